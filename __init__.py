@@ -9,6 +9,7 @@ app_common：关于对话框、App 信息条等通用 UI 子库。可整体作
 
 from app_common.focus_calc import (
     CameraFocusType,
+    extract_focus,
     extract_focus_box,
     get_focus_point,
     get_focus_point_for_display,
@@ -24,6 +25,7 @@ __all__ = [
     "resolve_focus_display_orientation",
     "get_focus_point",
     "get_focus_point_for_display",
+    "extract_focus",
     "extract_focus_box",
 ]
 
@@ -227,7 +227,7 @@ class PhotoMetaDataReportDB(PhotoMetaData):
             return None
         try:
             from app_common.report_db import ReportDB
-            db = ReportDB.open_if_exists(root)
+            db = ReportDB.open_if_exists(root, read_only=True)
             if db is None:
                 return None
             row = db.get_photo(stem)
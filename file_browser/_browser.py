@@ -9,6 +9,7 @@ file_browser._browser
 - Pillow（PIL）
 - piexif
 - rawpy（可选，用于 RAW 缩略图）
+- pillow-heif（可选，用于 HEIC/HEIF 缩略图，经 thumb_stream 注册）
 - app_common.exif_io.read_batch_metadata
 """
 from __future__ import annotations
@@ -17,6 +18,7 @@ import concurrent.futures as _futures
 from collections import deque
 from dataclasses import dataclass
 import hashlib
+import heapq
 import html
 import io as _io
 import os
@@ -76,6 +78,8 @@ from app_common.report_db import (
     report_row_to_exiftool_style,
     EXIF_ONLY_FROM_REPORT_DB,
     get_preview_path_for_file,
+    clear_preview_cache,
+    invalidate_preview_path,
     find_report_root,
 )
 from app_common.superviewer_user_options import (
@@ -216,6 +220,11 @@ try:
 except AttributeError:
     _QImageRGB888 = QImage.Format_RGB888  # type: ignore[attr-defined]
 
+try:
+    _QImageRGB16 = QImage.Format.Format_RGB16
+except AttributeError:
+    _QImageRGB16 = QImage.Format_RGB16  # type: ignore[attr-defined]
+
 try:
     _TicksBelow = QSlider.TickPosition.TicksBelow
 except AttributeError:
@@ -927,6 +936,15 @@ def _rgb_bytes_to_qimage(data: bytes, w: int, h: int) -> QImage:
     return QImage(data, w, h, w * 3, _QImageRGB888).copy()
 
 
+def _rgb_bytes_to_qimage_view(data: bytes, w: int, h: int) -> QImage:
+    """将 RGB 字节直接包装为 QImage，不复制像素。
+
+    PyQt 的 QImage 包装对象持有 data 的引用，只要该对象存活（经 object 型信号跨线程投递时即如此）
+    像素就有效；需要长期保存时由使用方 copy()（内存缓存与磁盘写入均会自行复制）。
+    """
+    return QImage(data, w, h, w * 3, _QImageRGB888)
+
+
 def _get_thumb_disk_writer() -> _futures.ThreadPoolExecutor:
     global _THUMB_DISK_WRITER
     with _THUMB_DISK_WRITER_LOCK:
@@ -957,6 +975,18 @@ def _qimage_num_bytes(image: QImage | None) -> int:
         return int(image.byteCount())  # type: ignore[attr-defined]
 
 
+# 不超过该尺寸档（128/256）的缩略图在内存缓存中以 RGB16（5-6-5）保存：每像素 2 字节，
+# 小格子里看不出差别，同样预算下可多缓存约一倍条目；512/1024 档保持 24 位。
+_THUMB_RGB16_MAX_SIZE = 256
+
+
+def _compact_thumb_qimage(image: QImage, size: int) -> QImage:
+    """返回适合长期缓存的独立副本：小尺寸档量化为 RGB16，其余原样复制。"""
+    if int(size) <= _THUMB_RGB16_MAX_SIZE:
+        return image.convertToFormat(_QImageRGB16)
+    return image.copy()
+
+
 def _scale_qimage_for_thumb(image: QImage, size: int) -> QImage:
     if image.isNull():
         return image
@@ -991,6 +1021,33 @@ def _thumbnail_loader_batch_size(worker_count: int) -> int:
     return min(max(1, worker_count), max(4, (worker_count * 2 + 2) // 3))
 
 
+# Linux 下在解码前对文件发 POSIX_FADV_WILLNEED，让内核提前异步预读（HDD/网络卷收益明显）。
+_THUMB_PREFETCH_HINT_ENABLED = sys.platform.startswith("linux") and hasattr(os, "posix_fadvise")
+_THUMB_PREFETCH_WINDOW = 8
+# 已发过预读提示的路径只保留最近这么多条，避免大目录里长期运行的 loader 无限增长
+_THUMB_PREFETCH_HINTED_MAX = 512
+
+
+def _prefetch_file_hint(path: str) -> None:
+    if not _THUMB_PREFETCH_HINT_ENABLED or not path:
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _prefetch_file_hints(paths: list[str]) -> None:
+    for path in paths:
+        _prefetch_file_hint(path)
+
+
 def _get_cached_actual_path(path: str) -> str | None:
     if not path:
         return None
@@ -1138,29 +1195,8 @@ def _exec_menu(menu: "QMenu", global_pos) -> None:
 # ── RAW 缩略图工具函数 ─────────────────────────────────────────────────────────
 
 def _get_raw_thumbnail(path: str) -> bytes | None:
-    """从 RAW 文件中提取嵌入 JPEG 缩略图字节，失败返回 None。"""
-    if Path(path).suffix.lower() not in RAW_EXTENSIONS:
-        return None
-    try:
-        import piexif
-        data = piexif.load(path)
-        thumb = data.get("thumbnail")
-        if isinstance(thumb, bytes) and len(thumb) > 100:
-            return thumb
-    except Exception:
-        pass
-    try:
-        import rawpy
-        with rawpy.imread(path) as rp:
-            thumb = rp.extract_thumb()
-        if thumb is None:
-            return None
-        if hasattr(rawpy, "ThumbFormat") and thumb.format == rawpy.ThumbFormat.JPEG:
-            if isinstance(thumb.data, bytes):
-                return thumb.data
-    except Exception:
-        pass
-    return None
+    """从 RAW 文件中提取嵌入 JPEG 缩略图字节，失败返回 None（与 thumb_stream 共用提取策略与缓存）。"""
+    return thumb_stream._get_raw_thumbnail_bytes(path)
 
 
 def _load_thumbnail_image(path: str, size: int) -> "QImage | None":
@@ -1189,27 +1225,11 @@ def _load_thumbnail_image(path: str, size: int) -> "QImage | None":
         return None
 
 
-# ── 可排序树节点 ───────────────────────────────────────────────────────────────
-
-class SortableTreeItem(QTreeWidgetItem):
-    """支持数值感知排序的 QTreeWidgetItem（通过 _SortRole 存储排序键）。"""
-
-    def __lt__(self, other: "QTreeWidgetItem") -> bool:
-        col = self.treeWidget().sortColumn() if self.treeWidget() else 0
-        sv = self.data(col, _SortRole)
-        ov = other.data(col, _SortRole)
-        if sv is not None and ov is not None:
-            try:
-                return sv < ov
-            except TypeError:
-                return str(sv) < str(ov)
-        return (self.text(col) or "") < (other.text(col) or "")
-
-
 @dataclass
 class FileTableEntry:
     path: str
     name: str
+    name_lc: str = ""
     tooltip: str = ""
     mismatch: bool = False
     title: str = ""
@@ -1223,6 +1243,7 @@ class FileTableEntry:
     shutter: str = ""
     iso: str = ""
     aperture: str = ""
+    sort_keys: tuple = ()
 
 
 class FileTableModel(QAbstractTableModel):
@@ -1278,6 +1299,7 @@ class FileTableModel(QAbstractTableModel):
         entry.shutter = str(meta.get("shutter", "") or "")
         entry.iso = str(meta.get("iso", "") or "")
         entry.aperture = str(meta.get("aperture", "") or "")
+        entry.sort_keys = self._build_sort_keys(entry)
 
     def _build_entry(
         self,
@@ -1288,47 +1310,53 @@ class FileTableModel(QAbstractTableModel):
         mismatch_fn,
     ) -> FileTableEntry:
         norm = os.path.normpath(path)
+        name = Path(path).name
         entry = FileTableEntry(
             path=path,
-            name=Path(path).name,
+            name=name,
+            name_lc=name.casefold(),
             tooltip=tooltip_fn(path),
             mismatch=bool(mismatch_fn(path)),
         )
         self._apply_meta_to_entry(entry, meta_cache.get(norm, {}) if isinstance(meta_cache, dict) else {})
         return entry
 
+    @staticmethod
+    def _build_sort_keys(entry: FileTableEntry) -> tuple:
+        """按列预先算好排序键（元组下标即列号），同一列的键类型一致，比较时无需兜底。"""
+        if entry.pick == 1:
+            star_key = 10
+        elif entry.pick == -1:
+            star_key = -1
+        else:
+            star_key = entry.rating
+        seconds = _parse_positive_fraction_or_float(entry.shutter)
+        iso_value = _parse_optional_int(entry.iso)
+        aperture_value = _parse_positive_fraction_or_float(entry.aperture)
+        return (
+            0,
+            entry.name_lc,
+            entry.title.casefold(),
+            _COLOR_SORT_ORDER.get(entry.color, 99),
+            star_key,
+            entry.city.casefold(),
+            entry.state.casefold(),
+            entry.country.casefold(),
+            (0, seconds) if seconds is not None else (1, entry.shutter.lower()),
+            (0, iso_value) if iso_value is not None else (1, entry.iso.lower()),
+            (0, aperture_value) if aperture_value is not None else (1, entry.aperture.lower()),
+        )
+
     def _sort_value(self, entry: FileTableEntry, column: int):
-        if column == _TREE_COL_SEQ:
-            return 0
-        if column == _TREE_COL_NAME:
-            return entry.name.lower()
-        if column == _TREE_COL_TITLE:
-            return entry.title.lower()
-        if column == _TREE_COL_COLOR:
-            return _COLOR_SORT_ORDER.get(entry.color, 99)
-        if column == _TREE_COL_STAR:
-            if entry.pick == 1:
-                return 10
-            if entry.pick == -1:
-                return -1
-            return entry.rating
-        if column == _TREE_COL_SHARP:
-            return entry.city.lower()
-        if column == _TREE_COL_AESTHETIC:
-            return entry.state.lower()
-        if column == _TREE_COL_FOCUS:
-            return entry.country.lower()
-        if column == _TREE_COL_SHUTTER:
-            seconds = _parse_positive_fraction_or_float(entry.shutter)
-            return (0, seconds) if seconds is not None else (1, entry.shutter.lower())
-        if column == _TREE_COL_ISO:
-            iso_value = _parse_optional_int(entry.iso)
-            return (0, iso_value) if iso_value is not None else (1, entry.iso.lower())
-        if column == _TREE_COL_APERTURE:
-            aperture_value = _parse_positive_fraction_or_float(entry.aperture)
-            return (0, aperture_value) if aperture_value is not None else (1, entry.aperture.lower())
+        keys = entry.sort_keys
+        if 0 <= column < len(keys):
+            return keys[column]
         return ""
 
+    def sort_key(self, row: int, column: int):
+        """供排序代理直接取键，绕过 data()/QVariant 往返。"""
+        return self._sort_value(self._entries[row], column)
+
     def _display_value(self, entry: FileTableEntry, row: int, column: int) -> str:
         if column == _TREE_COL_SEQ:
             return str(row + 1)
@@ -1421,8 +1449,10 @@ class FileTableModel(QAbstractTableModel):
         self.endResetModel()
 
     def row_for_path(self, path: str) -> int | None:
-        norm = os.path.normpath(path) if path else ""
-        row = self._row_by_path.get(norm)
+        # 调用方大多已传入规范化路径，先直接查表，未命中再 normpath。
+        row = self._row_by_path.get(path)
+        if row is None and path:
+            row = self._row_by_path.get(os.path.normpath(path))
         if row is None or row < 0 or row >= len(self._entries):
             return None
         return row
@@ -1458,6 +1488,21 @@ class FileTableModel(QAbstractTableModel):
         self.dataChanged.emit(left, right, [_DisplayRole, _SortRole, _ForegroundRole, _BackgroundRole])
         return True
 
+    def set_meta_for_paths(self, items: list[tuple[str, dict | None]]) -> int:
+        """批量应用元数据，只发一次覆盖所有命中行的 dataChanged；返回命中行数。"""
+        rows: list[int] = []
+        for path, meta in items:
+            row = self.row_for_path(path)
+            if row is None:
+                continue
+            self._apply_meta_to_entry(self._entries[row], meta)
+            rows.append(row)
+        if rows:
+            left = self.index(min(rows), _TREE_COL_TITLE)
+            right = self.index(max(rows), self.columnCount() - 1)
+            self.dataChanged.emit(left, right, [_DisplayRole, _SortRole, _ForegroundRole, _BackgroundRole])
+        return len(rows)
+
     def set_tooltip_for_path(self, path: str, tooltip: str) -> bool:
         row = self.row_for_path(path)
         if row is None:
@@ -1496,6 +1541,9 @@ class FileTableSortProxyModel(QSortFilterProxyModel):
 
     def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
         source = self.sourceModel()
+        if isinstance(source, FileTableModel):
+            column = left.column()
+            return source.sort_key(left.row(), column) < source.sort_key(right.row(), column)
         lv = source.data(left, _SortRole) if source is not None else None
         rv = source.data(right, _SortRole) if source is not None else None
         if lv is not None and rv is not None:
@@ -1783,8 +1831,9 @@ class ThumbnailListModel(QAbstractListModel):
         self.endResetModel()
 
     def row_for_path(self, path: str) -> int | None:
-        norm = os.path.normpath(path) if path else ""
-        row = self._row_by_path.get(norm)
+        row = self._row_by_path.get(path)
+        if row is None and path:
+            row = self._row_by_path.get(os.path.normpath(path))
         if row is None:
             return None
         if row < 0 or row >= len(self._entries):
@@ -1822,7 +1871,30 @@ class ThumbnailListModel(QAbstractListModel):
         row = self.row_for_path(path)
         if row is None:
             return False
-        entry = self._entries[row]
+        changed_roles = self._apply_meta_to_entry(self._entries[row], meta)
+        if not changed_roles:
+            return False
+        idx = self.index(row, 0)
+        self.dataChanged.emit(idx, idx, changed_roles)
+        return True
+
+    def set_meta_for_paths(self, items: list[tuple[str, dict | None]]) -> int:
+        """批量应用元数据，只发一次覆盖所有变化行的 dataChanged；返回变化行数。"""
+        rows: list[int] = []
+        roles: set[int] = set()
+        for path, meta in items:
+            row = self.row_for_path(path)
+            if row is None:
+                continue
+            changed_roles = self._apply_meta_to_entry(self._entries[row], meta)
+            if changed_roles:
+                rows.append(row)
+                roles.update(changed_roles)
+        if rows:
+            self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), 0), sorted(roles))
+        return len(rows)
+
+    def _apply_meta_to_entry(self, entry: ThumbnailListEntry, meta: dict | None) -> list[int]:
         meta = meta or {}
         changed_roles: list[int] = []
         new_color = str(meta.get("color", ""))
@@ -1851,11 +1923,7 @@ class ThumbnailListModel(QAbstractListModel):
         if entry.species_cn != new_species_cn:
             entry.species_cn = new_species_cn
             changed_roles.append(_MetaSpeciesCnRole)
-        if not changed_roles:
-            return False
-        idx = self.index(row, 0)
-        self.dataChanged.emit(idx, idx, changed_roles)
-        return True
+        return changed_roles
 
     def set_pixmap_for_path(self, path: str, pixmap: QPixmap | None, thumb_size: int) -> int | None:
         row = self.row_for_path(path)
@@ -2194,11 +2262,11 @@ class ThumbnailMemoryCache:
             if img is not None and not img.isNull():
                 self._bytes -= _qimage_num_bytes(img)
 
-    def _store_image(self, bucket: dict, key, image: QImage) -> None:
+    def _store_image(self, bucket: dict, key, image: QImage, requested_size: int) -> None:
         old = bucket.get(key)
         if old is not None:
             self._bytes -= _qimage_num_bytes(old)
-        stored = image.copy()
+        stored = _compact_thumb_qimage(image, requested_size)
         bucket[key] = stored
         self._bytes += _qimage_num_bytes(stored)
 
@@ -2234,13 +2302,13 @@ class ThumbnailMemoryCache:
                 lru_k = self._lru_key_jpeg(cache_key, requested_size)
                 if lru_k in self._lru_keys:
                     self._lru_keys.remove(lru_k)
-                self._store_image(self._jpeg_mips, jkey, image)
+                self._store_image(self._jpeg_mips, jkey, image, requested_size)
                 self._lru_keys.append(lru_k)
             else:
                 lru_k = self._lru_key_base(cache_key)
                 if lru_k in self._lru_keys:
                     self._lru_keys.remove(lru_k)
-                self._store_image(self._base_images, cache_key, image)
+                self._store_image(self._base_images, cache_key, image, requested_size)
                 self._lru_keys.append(lru_k)
             self._evict_until_under_limit()
 
@@ -2317,7 +2385,11 @@ class ThumbnailLoader(QThread):
     within one batch cycle (≤ max_workers completions).
     """
 
-    thumbnail_ready = pyqtSignal(int, str, object)  # (request_token, path, QImage)
+    thumbnails_ready = pyqtSignal(int, object)  # (request_token, [(path, QImage), ...])
+
+    # 跨线程信号按批投递：攒满 READY_BATCH_SIZE 帧或距上次投递超过 READY_FLUSH_INTERVAL_S 即发出
+    READY_BATCH_SIZE = 8
+    READY_FLUSH_INTERVAL_S = 0.05
 
     PRIORITY_VISIBLE  = 0  # noqa: E221
     PRIORITY_PREFETCH = 1
@@ -2347,6 +2419,10 @@ class ThumbnailLoader(QThread):
         self._queued:  set[str] = set()   # paths currently sitting in the queue
         self._loaded:  set[str] = set()   # paths already submitted to executor
         self._desired_paths: set[str] = set()
+        self._prefetch_hinted: dict[str, None] = {}  # 最近已发预读提示的路径（按插入顺序淘汰）
+        self._ready_lock = threading.Lock()
+        self._ready_buffer: list[tuple[str, QImage]] = []
+        self._ready_last_flush = _time.monotonic()
         self._seq = 0                      # monotonic counter for stable FIFO within same priority
         self._queue_lock = threading.Lock()
         self._profile_lock = threading.Lock()
@@ -2562,8 +2638,65 @@ class ThumbnailLoader(QThread):
         with self._queue_lock:
             self._desired_paths.clear()
 
+    def _queue_ready(self, request_token: int, path: str, qimg: QImage) -> None:
+        """worker 线程调用：先缓冲解码结果，够一批或超时再发一次 thumbnails_ready。
+
+        取批与 emit 都在 _ready_lock 内完成：跨线程 emit 只是按序投递事件，持锁发出可保证
+        批次到达主线程的顺序与入缓冲顺序一致，同一路径的旧帧不会晚于新帧到达。
+        """
+        with self._ready_lock:
+            self._ready_buffer.append((path, qimg))
+            if (
+                len(self._ready_buffer) < self.READY_BATCH_SIZE
+                and _time.monotonic() - self._ready_last_flush < self.READY_FLUSH_INTERVAL_S
+            ):
+                return
+            self.thumbnails_ready.emit(request_token, self._take_ready_locked())
+
+    def _take_ready_locked(self) -> list[tuple[str, QImage]]:
+        items = self._ready_buffer
+        self._ready_buffer = []
+        self._ready_last_flush = _time.monotonic()
+        return items
+
+    def _flush_ready(self, *, only_if_due: bool = False) -> None:
+        with self._ready_lock:
+            if not self._ready_buffer:
+                return
+            if only_if_due and _time.monotonic() - self._ready_last_flush < self.READY_FLUSH_INTERVAL_S:
+                return
+            self.thumbnails_ready.emit(self._request_token, self._take_ready_locked())
+
+    def _prefetch_upcoming(self, executor: _futures.ThreadPoolExecutor) -> None:
+        """对队列中当前批次之后的若干路径发预读提示，让下一批的磁盘读取与本批解码重叠。
+
+        只在 loader 线程里挑选路径；open/fadvise 交给线程池执行，不阻塞 loader 线程。
+        """
+        if not _THUMB_PREFETCH_HINT_ENABLED:
+            return
+        with self._queue_lock:
+            upcoming = [
+                item[2]
+                for item in heapq.nsmallest(_THUMB_PREFETCH_WINDOW, self._task_queue.queue)
+                if item[2] not in self._loaded
+            ]
+        paths: list[str] = []
+        for path in upcoming:
+            if path in self._prefetch_hinted:
+                continue
+            self._prefetch_hinted[path] = None
+            paths.append(path)
+        while len(self._prefetch_hinted) > _THUMB_PREFETCH_HINTED_MAX:
+            del self._prefetch_hinted[next(iter(self._prefetch_hinted))]
+        if not paths:
+            return
+        try:
+            executor.submit(_prefetch_file_hints, paths)
+        except RuntimeError:
+            pass
+
     def _load_single(self, path: str, emit_fn, *, allow_progressive: bool) -> None:
-        """Decode one image progressively, calling emit_fn(path, QImage) for every
+        """Decode one image progressively, calling emit_fn(token, path, QImage) for every
         available frame — coarse frames first, final high-quality frame last.
 
         emit_fn is called from the thread-pool worker thread.  Qt cross-thread
@@ -2660,7 +2793,8 @@ class ThumbnailLoader(QThread):
                 if stopped():
                     return
                 data, w, h = rgb_result
-                qimg = _rgb_bytes_to_qimage(data, w, h)
+                # 不在 worker 中复制：主线程 QPixmap.fromImage 时只做一次像素拷贝。
+                qimg = _rgb_bytes_to_qimage_view(data, w, h)
                 safe_emit(qimg)
                 final_qimg = qimg
 
@@ -2718,9 +2852,9 @@ class ThumbnailLoader(QThread):
             thread_name_prefix="thumb",
         )
         self._executor = executor
-        # emit_fn is called from pool-worker threads; Qt queued-connection
-        # delivery is thread-safe and routes each call to the main event loop.
-        emit_fn = self.thumbnail_ready.emit
+        # emit_fn is called from pool-worker threads; results are buffered and
+        # delivered in batches through the thread-safe queued connection.
+        emit_fn = self._queue_ready
 
         try:
             while not self._stop_flag and not self.isInterruptionRequested():
@@ -2772,20 +2906,33 @@ class ThumbnailLoader(QThread):
                         _log.info("[ThumbnailLoader.run] submit stopped path=%r: %s", path, e)
                         break
 
+                self._prefetch_upcoming(executor)
+
                 # ── Wait for this batch before taking the next ───────────────
                 # Waiting (rather than fire-and-forget) lets the priority queue
                 # be checked again after each batch, so newly-visible items
                 # injected via promote() are processed in the next iteration.
-                for f in _futures.as_completed(future_map):
+                # Wake at least every READY_FLUSH_INTERVAL_S so buffered frames
+                # are not held back by one slow decode in the batch.
+                pending_futures = set(future_map)
+                while pending_futures:
                     if self._stop_flag or self.isInterruptionRequested():
                         break
-                    try:
-                        f.result()
-                    except Exception as e:
-                        _log.warning(
-                            "[ThumbnailLoader.run] failed path=%r: %s",
-                            future_map[f], e,
-                        )
+                    done, pending_futures = _futures.wait(
+                        pending_futures,
+                        timeout=self.READY_FLUSH_INTERVAL_S,
+                        return_when=_futures.FIRST_COMPLETED,
+                    )
+                    for f in done:
+                        try:
+                            f.result()
+                        except Exception as e:
+                            _log.warning(
+                                "[ThumbnailLoader.run] failed path=%r: %s",
+                                future_map[f], e,
+                            )
+                    self._flush_ready(only_if_due=True)
+                self._flush_ready()
 
         finally:
             if self._profile_enabled:
@@ -2817,6 +2964,7 @@ class ThumbnailLoader(QThread):
             except Exception:
                 pass
             self._executor = None
+            self._flush_ready()
             _log.debug("[ThumbnailLoader.run] END")
 
 
@@ -3025,12 +3173,12 @@ class DirectoryScanWorker(QThread):
                 _log.info("[DirectoryScanWorker.run] reuse cached full report_cache %s entries", len(report_cache))
             else:
                 db_dir = self._report_root or self._path
-                db = ReportDB.open_if_exists(db_dir)
+                db = ReportDB.open_if_exists(db_dir, read_only=True)
                 if db:
                     report_source_available = True
                     full_report_cache = {}
                     try:
-                        for row in db.get_all_photos():
+                        for row in db.get_all_photos(as_dict=False):
                             r = _normalize_report_row_paths(dict(row))
                             stem = r.get("filename")
                             if stem is not None:
@@ -3664,6 +3812,7 @@ class FileListPanel(QWidget):
     def __init__(self, parent=None, *, create_filter_bar: bool | None = None) -> None:
         super().__init__(parent)
         self._all_files: list = []
+        self._norm_by_path: dict[str, str] = {}  # _all_files 原始路径 -> normpath，扫描结果落地时算一次
         self._filtered_files: list = []
         self._current_dir = ""
         self._report_root_dir: str | None = None  # 当前使用的 report 根目录（含 .superpicky 的目录）
@@ -4275,6 +4424,7 @@ class FileListPanel(QWidget):
                     report_row_by_path[norm_p] = row
         self._report_row_by_path = dict(report_row_by_path or {})
         self._all_files = list(files)
+        self._norm_by_path = {p: os.path.normpath(p) for p in self._all_files if p}
         self._loaded_directory_recursive = bool(recursive)
         self._store_directory_scope_cache(
             recursive=recursive,
@@ -4444,6 +4594,7 @@ class FileListPanel(QWidget):
             self._report_row_by_path = {}
             self._selected_display_path = ""
             self._all_files = []
+            self._norm_by_path = {}
             _log.info("[load_directory] _rebuild_views (empty)")
             self._rebuild_views()
         else:
@@ -4489,6 +4640,8 @@ class FileListPanel(QWidget):
         if path != self._current_dir:
             _log.info("[_on_directory_scan_finished] IGNORE stale path")
             return
+        # report 已重新加载，temp_jpeg_path 对应的预览文件可能已生成或删除
+        clear_preview_cache()
         recursive = self._requested_directory_recursive
         _log.info(
             "[_on_directory_scan_finished] apply scan result recursive=%s files=%s report_entries=%s",
@@ -5460,7 +5613,7 @@ class FileListPanel(QWidget):
         db_dir = self._report_root_dir or self._current_dir
         db_exists = False
         if db_dir:
-            db_probe = ReportDB.open_if_exists(db_dir)
+            db_probe = ReportDB.open_if_exists(db_dir, read_only=True)
             db_exists = db_probe is not None
             if db_probe is not None:
                 db_probe.close()
@@ -5577,6 +5730,18 @@ class FileListPanel(QWidget):
             "</body></html>"
         )
 
+    @staticmethod
+    def _existing_report_preview_path(norm_path: str, preview_base_dir: str, report_cache: dict) -> str:
+        """report 中 temp_jpeg_path 对应的预览若仍存在则返回；已被删除时让解析缓存失效并返回空串。"""
+        preview_target = get_preview_path_for_file(norm_path, preview_base_dir, report_cache)
+        if not preview_target:
+            return ""
+        if os.path.isfile(preview_target):
+            return preview_target
+        if preview_target != norm_path:
+            invalidate_preview_path(preview_target)
+        return ""
+
     def _resolve_preview_path_for_tooltip(self, path: str) -> str:
         norm_path = os.path.normpath(path) if path else ""
         if not norm_path:
@@ -5584,8 +5749,8 @@ class FileListPanel(QWidget):
         preview_base_dir = self._report_root_dir or self._current_dir
         report_cache = self._report_full_cache or self._report_cache or {}
         if preview_base_dir:
-            preview_target = get_preview_path_for_file(norm_path, preview_base_dir, report_cache)
-            if preview_target and os.path.isfile(preview_target):
+            preview_target = self._existing_report_preview_path(norm_path, preview_base_dir, report_cache)
+            if preview_target:
                 return preview_target
         actual_path = self._get_actual_path_for_display(norm_path)
         return actual_path or norm_path
@@ -5629,10 +5794,7 @@ class FileListPanel(QWidget):
         if not preview_base_dir:
             return ""
         report_cache = self._report_full_cache or self._report_cache or {}
-        preview_target = get_preview_path_for_file(norm_path, preview_base_dir, report_cache)
-        if preview_target and os.path.isfile(preview_target):
-            return preview_target
-        return ""
+        return self._existing_report_preview_path(norm_path, preview_base_dir, report_cache)
 
     def _build_list_path_tooltip(self, path: str) -> str:
         base_tooltip = self._build_path_tooltip(path)
@@ -5995,13 +6157,11 @@ class FileListPanel(QWidget):
                         self._thumb_size,
                     )
                     return thumb_disk_path
-        preview_target = get_preview_path_for_file(norm_path, preview_base_dir, report_cache)
-        preview_path = preview_target if (preview_target and os.path.isfile(preview_target)) else ""
+        preview_path = self._existing_report_preview_path(norm_path, preview_base_dir, report_cache)
         _log.info(
-            "[resolve_preview_path] source=%r preview=%r preview_target=%r actual=%r preview_base_dir=%r report_entries=%s fast=%s",
+            "[resolve_preview_path] source=%r preview=%r actual=%r preview_base_dir=%r report_entries=%s fast=%s",
             norm_path,
             preview_path,
-            preview_target,
             actual_path,
             preview_base_dir,
             len(report_cache),
@@ -6473,62 +6633,6 @@ class FileListPanel(QWidget):
             self._schedule_visible_thumbnail_update()
         self._update_selection_status()
         _log.info("[_rebuild_views] END")
-        return
-        self._tree_widget.setUpdatesEnabled(False)
-        self._list_widget.setUpdatesEnabled(False)
-        try:
-            self._tree_widget.setSortingEnabled(False)
-            self._tree_widget.clear()
-            self._tree_item_map = {}
-            ft = (self._filter_edit.text().strip().lower()) if self._filter_edit else ""
-            _log.info("[_rebuild_views] filter_text=%r adding items", ft or "(none)")
-
-            for seq, path in enumerate(self._filtered_files, start=1):
-                name = Path(path).name
-                norm = os.path.normpath(path)
-                meta = self._meta_cache.get(norm, {})
-
-                ti = SortableTreeItem([str(seq), name, *([""] * (len(_FILE_TABLE_HEADERS) - 2))])
-                ti.setTextAlignment(_TREE_COL_SEQ, _AlignCenter)
-                ti.setData(0, _UserRole, path)
-                ti.setData(_TREE_COL_SEQ, _SortRole, 0)
-                ti.setData(_TREE_COL_NAME, _SortRole, name.lower())
-                self._set_tree_item_tooltip_all_columns(ti, self._build_list_path_tooltip(path))
-                if meta:
-                    self._apply_meta_to_tree_item(ti, meta)
-                self._tree_widget.addTopLevelItem(ti)
-                self._tree_item_map[norm] = ti
-                self._apply_path_status_to_items(norm)
-            self._thumb_list_model.rebuild(
-                self._filtered_files,
-                meta_cache=self._meta_cache,
-                tooltip_fn=self._build_list_path_tooltip,
-                mismatch_fn=self._has_path_mismatch,
-            )
-        finally:
-            self._tree_widget.setSortingEnabled(True)
-            # 重建后显式按当前记录的排序列排序，避免列头状态未同步时按序号列（全 0）产生不稳定顺序
-            if self._tree_widget.topLevelItemCount() > 0:
-                hdr = self._tree_widget.header()
-                try:
-                    hdr.blockSignals(True)
-                    hdr.setSortIndicator(self._tree_last_sort_column, self._tree_last_sort_order)
-                finally:
-                    hdr.blockSignals(False)
-                self._tree_widget.sortItems(self._tree_last_sort_column, self._tree_last_sort_order)
-            self._tree_widget.setUpdatesEnabled(True)
-            self._list_widget.setUpdatesEnabled(True)
-            self._refresh_tree_row_numbers()
-
-        _log.info("[_rebuild_views] added %s items", len(self._filtered_files))
-        if self._view_mode == self._MODE_THUMB:
-            _log.info("[_rebuild_views] thumb mode: update thumb display + schedule visible loader")
-            self._invalidate_visible_thumbnail_signature()
-            self._update_thumb_display()
-            # 目录间切换时，优先尝试直接用内存缓存的缩略图填充，已有缓存的不再排队后台加载。
-            self._apply_cached_thumbs_to_items()
-            self._schedule_visible_thumbnail_update()
-        _log.info("[_rebuild_views] END")
 
     def _apply_filter(self) -> None:
         """根据当前过滤条件（文件名、精选、星级、对焦）重算过滤结果并刷新视图。"""
@@ -6605,59 +6709,6 @@ class FileListPanel(QWidget):
             btn.setChecked(key == self._filter_focus_status)
         self._refresh_filter_scope()
 
-    def _apply_meta_to_tree_item(self, item: SortableTreeItem, meta: dict) -> None:
-        title   = meta.get("title", "")
-        color   = meta.get("color", "")
-        rating  = meta.get("rating", 0)
-        pick    = meta.get("pick", 0)
-        city    = meta.get("city", "")
-        state   = meta.get("state", "")
-        country = meta.get("country", "")
-        shutter = str(meta.get("shutter", "") or "")
-        iso = str(meta.get("iso", "") or "")
-        aperture = str(meta.get("aperture", "") or "")
-
-        item.setText(_TREE_COL_TITLE, title);  item.setData(_TREE_COL_TITLE, _SortRole, title.lower())
-        color_display = (_COLOR_LABEL_COLORS.get(color, ("", ""))[1] or color)
-        item.setText(_TREE_COL_COLOR, color_display);  item.setData(_TREE_COL_COLOR, _SortRole, _COLOR_SORT_ORDER.get(color, 99))
-        if color in _COLOR_LABEL_COLORS:
-            hex_c, _ = _COLOR_LABEL_COLORS[color]
-            item.setBackground(_TREE_COL_COLOR, QBrush(QColor(hex_c)))
-            item.setForeground(_TREE_COL_COLOR, QBrush(QColor(
-                "#333" if color in ("Yellow", "White") else "#fff"
-            )))
-
-        # 星级列：pick 旗标优先于星级显示
-        # 排序键：精选=10 > 5星=5 > ... > 未标=0 > 排除=-1
-        if pick == 1:
-            star_text = "🏆"
-            sort_val  = 10
-        elif pick == -1:
-            star_text = "🚫"
-            sort_val  = -1
-        else:
-            star_text = "★" * rating if rating > 0 else ""
-            sort_val  = rating
-        item.setText(_TREE_COL_STAR, star_text); item.setData(_TREE_COL_STAR, _SortRole, sort_val)
-
-        item.setText(_TREE_COL_SHARP, city);    item.setData(_TREE_COL_SHARP, _SortRole, city.lower())
-        item.setText(_TREE_COL_AESTHETIC, state);   item.setData(_TREE_COL_AESTHETIC, _SortRole, state.lower())
-        item.setText(_TREE_COL_FOCUS, country); item.setData(_TREE_COL_FOCUS, _SortRole, country.lower())
-        shutter_seconds = _parse_positive_fraction_or_float(shutter)
-        item.setText(_TREE_COL_SHUTTER, shutter)
-        item.setData(_TREE_COL_SHUTTER, _SortRole, (0, shutter_seconds) if shutter_seconds is not None else (1, shutter.lower()))
-        iso_value = _parse_optional_int(iso)
-        item.setText(_TREE_COL_ISO, iso)
-        item.setData(_TREE_COL_ISO, _SortRole, (0, iso_value) if iso_value is not None else (1, iso.lower()))
-        aperture_value = _parse_positive_fraction_or_float(aperture)
-        item.setText(_TREE_COL_APERTURE, aperture)
-        item.setData(_TREE_COL_APERTURE, _SortRole, (0, aperture_value) if aperture_value is not None else (1, aperture.lower()))
-        focus_color = _FOCUS_STATUS_TEXT_COLORS.get(country, "")
-        if focus_color:
-            item.setForeground(_TREE_COL_FOCUS, QBrush(QColor(focus_color)))
-        else:
-            item.setForeground(_TREE_COL_FOCUS, QBrush())
-
     # ── 视图模式切换 ────────────────────────────────────────────────────────────
     def eventFilter(self, obj, event):
         tree_widget = getattr(self, "_tree_widget", None)
@@ -7364,7 +7415,7 @@ class FileListPanel(QWidget):
             loader.enqueue(prefetch_paths, priority=ThumbnailLoader.PRIORITY_PREFETCH)
         loader.set_desired_paths(requested_visible, prefetch_paths)
 
-        loader.thumbnail_ready.connect(self._on_thumbnail_ready)
+        loader.thumbnails_ready.connect(self._on_thumbnails_ready)
         loader.finished.connect(self._schedule_visible_thumbnail_update)
         self._thumbnail_loader = loader
         loader.start()
@@ -7382,8 +7433,8 @@ class FileListPanel(QWidget):
         if self._thumbnail_loader:
             self._detach_loader(
                 self._thumbnail_loader,
-                self._thumbnail_loader.thumbnail_ready,
-                self._on_thumbnail_ready,
+                self._thumbnail_loader.thumbnails_ready,
+                self._on_thumbnails_ready,
             )
             self._thumbnail_loader = None
         if self._thumb_apply_timer is not None and self._thumb_apply_timer.isActive():
@@ -7923,8 +7974,9 @@ class FileListPanel(QWidget):
         ordered: list = []
         seen: set = set()
         preferred = self._filtered_files or self._all_files
+        norm_by_path = self._norm_by_path
         for p in preferred:
-            norm = os.path.normpath(p)
+            norm = norm_by_path.get(p) or os.path.normpath(p)
             if norm in meta_dict:
                 ordered.append((norm, meta_dict[norm]))
                 seen.add(norm)
@@ -8035,21 +8087,26 @@ class FileListPanel(QWidget):
         tick_t0 = _time.perf_counter()
         max_batch = max(1, _META_APPLY_BATCH_SIZE)
         budget_s = max(1.0, _META_APPLY_TIME_BUDGET_MS) / 1000.0
+        tree_items: list[tuple[str, dict]] = []
+        thumb_items: list[tuple[str, dict]] = []
         while i < total:
             if (i - start) >= max_batch:
                 break
             if (i - start) >= 8 and (_time.perf_counter() - tick_t0) >= budget_s:
                 break
             norm_path, meta = self._meta_apply_items[i]
-            if self._file_table_model.set_meta_for_path(norm_path, meta):
-                self._meta_apply_tree_hits += 1
-                if _DEBUG_FILE_LIST_LIMIT == 1:
-                    _log.info("[DEBUG][_apply_meta] norm=%r meta=%r", norm_path, meta)
+            tree_items.append((norm_path, meta))
+            if _DEBUG_FILE_LIST_LIMIT == 1:
+                _log.info("[DEBUG][_apply_meta] norm=%r meta=%r", norm_path, meta)
             if self._view_mode == self._MODE_THUMB:
                 if self._thumb_index_for_path(norm_path).isValid():
                     self._meta_apply_list_hits += 1
-                    self._apply_thumb_meta_to_path(norm_path, meta)
+                    thumb_items.append((norm_path, meta))
             i += 1
+        # 整批只发一次 dataChanged，避免逐行信号触发逐行重绘排队。
+        self._meta_apply_tree_hits += self._file_table_model.set_meta_for_paths(tree_items)
+        if thumb_items:
+            self._thumb_list_model.set_meta_for_paths(thumb_items)
 
         end = i
         self._meta_apply_index = end
@@ -8079,16 +8136,18 @@ class FileListPanel(QWidget):
                 self._finish_meta_apply()
 
     # ── Slots ─────────────────────────────────────────────────────────────────
-    def _on_thumbnail_ready(self, request_token: int, path: str, qimg) -> None:
+    def _on_thumbnails_ready(self, request_token: int, items: list) -> None:
         if self._view_mode != self._MODE_THUMB:
             return
         if int(request_token) != int(self._thumb_request_token):
-            self._thumb_profile_add("stale_ready", 1)
-            return
-        norm = os.path.normpath(path)
-        self._thumb_profile_add("ready_signals", 1)
-        self._thumb_profile_ready_received_at[norm] = _time.perf_counter()
-        self._thumb_pending_batch[norm] = qimg
+            self._thumb_profile_add("stale_ready", len(items))
+            return
+        received_at = _time.perf_counter()
+        # ThumbnailLoader 发出的已是规范化路径
+        for norm, qimg in items:
+            self._thumb_profile_ready_received_at[norm] = received_at
+            self._thumb_pending_batch[norm] = qimg
+        self._thumb_profile_add("ready_signals", len(items))
         self._thumb_profile_set_max("pending_peak", float(len(self._thumb_pending_batch)))
         if self._thumb_apply_timer is None:
             self._thumb_apply_timer = QTimer(self)
@@ -8270,13 +8329,15 @@ class FileListPanel(QWidget):
         self._selected_display_path = os.path.normpath(path)
         self._update_selection_status()
         resolved_path = self._resolve_source_path_for_action(path)
-        if not resolved_path or not os.path.isfile(resolved_path):
+        # 点击/方向键路径上只 stat 一次，结果同时用于补查与日志。
+        resolved_exists = bool(resolved_path) and os.path.isfile(resolved_path)
+        if not resolved_exists:
             self._request_actual_path_lookup(path)
         _log.info(
             "[_emit_file_selected_for_path] source=%r resolved=%r exists=%s",
             path,
             resolved_path,
-            os.path.isfile(resolved_path) if resolved_path else False,
+            resolved_exists,
         )
         self.file_selected.emit(resolved_path or path)
 
@@ -8691,7 +8752,7 @@ class DirectoryBrowserWidget(QWidget):
     def _populate_roots(self) -> None:
         """添加根节点：主目录 + macOS 外接卷 / Windows 盘符。"""
         home = os.path.expanduser("~")
-        home_item = self._make_item(home, "🏠 " + os.path.basename(home))
+        home_item = self._make_item(home, "🏠 " + os.path.basename(home), is_dir=os.path.isdir(home))
         self._tree.addTopLevelItem(home_item)
 
         if sys.platform == "darwin":
@@ -8710,7 +8771,7 @@ class DirectoryBrowserWidget(QWidget):
                     except OSError:
                         is_external = True
                     if is_external:
-                        vol_item = self._make_item(entry.path, "💾 " + entry.name)
+                        vol_item = self._make_item(entry.path, "💾 " + entry.name, is_dir=True)
                         self._tree.addTopLevelItem(vol_item)
             except (PermissionError, OSError):
                 pass
@@ -8718,17 +8779,19 @@ class DirectoryBrowserWidget(QWidget):
             import string
             for letter in string.ascii_uppercase:
                 drive = f"{letter}:\\"
-                if os.path.exists(drive):
+                # 每个盘符只探测一次：断开的映射盘上每次 stat 都可能卡住数秒
+                if os.path.isdir(drive):
                     self._tree.addTopLevelItem(
-                        self._make_item(drive, f"💾 {letter}:")
+                        self._make_item(drive, f"💾 {letter}:", is_dir=True)
                     )
 
         self._tree.expandItem(home_item)
 
-    def _make_item(self, path: str, label: str) -> QTreeWidgetItem:
+    def _make_item(self, path: str, label: str, is_dir: bool = True) -> QTreeWidgetItem:
+        """is_dir 由调用方给出（调用方已探测过），这里不再重复 stat。"""
         item = QTreeWidgetItem([label])
         item.setData(0, _UserRole, path)
-        if os.path.isdir(path):
+        if is_dir:
             item.addChild(QTreeWidgetItem([self._PLACEHOLDER]))
         return item
 
@@ -8913,11 +8976,17 @@ class DirectoryBrowserWidget(QWidget):
         if not path:
             return
         try:
-            for entry in sorted(os.scandir(path), key=lambda e: e.name.lower()):
-                if not entry.is_dir() or entry.name.startswith("."):
-                    continue
-                child = QTreeWidgetItem([entry.name])
-                child.setData(0, _UserRole, entry.path)
+            # 先过滤再排序：大目录里的文件不参与排序；隐藏项不触发 is_dir()。
+            with os.scandir(path) as it:
+                subdirs = [
+                    (entry.name.lower(), entry.name, entry.path)
+                    for entry in it
+                    if not entry.name.startswith(".") and entry.is_dir()
+                ]
+            subdirs.sort()
+            for _key, name, child_path in subdirs:
+                child = QTreeWidgetItem([name])
+                child.setData(0, _UserRole, child_path)
                 child.addChild(QTreeWidgetItem([self._PLACEHOLDER]))
                 item.addChild(child)
         except (PermissionError, OSError):
@@ -7,11 +7,23 @@ tests without importing PyQt-heavy modules.
 from __future__ import annotations
 
 from enum import Enum
+import functools
 import re
-from typing import Any, Callable
+import string
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
 DEFAULT_FOCUS_BOX_SHORT_EDGE_RATIO = 0.12
 
+# 热路径正则预编译：每张预览会对几十个 MakerNote 字段反复调用。
+_NUM_RE = re.compile(r"[-+]?\d+(?:\.\d+)?")
+_MODEL_KEY_RE = re.compile(r"[^A-Za-z0-9]+")
+_PLAIN_NUMBER_TYPES = (int, float)
+# ASCII 机型名走 str.translate：非字母数字统一映射为 "_"，再合并连续的 "_"。
+_MODEL_KEY_TRANS = str.maketrans(
+    {chr(code): "_" for code in range(128) if chr(code) not in string.ascii_letters + string.digits}
+)
+
 
 class CameraFocusType(str, Enum):
     """Camera focus metadata parsing strategy / camera family discriminator."""
@@ -28,6 +40,12 @@ def clamp01(value: float) -> float:
 def _clean_text(value: Any) -> str | None:
     if value is None:
         return None
+    if isinstance(value, str):
+        # 常见情况：已是干净的单行文本。isprintable() 会排除 NUL / 制表 / 换行 /
+        # 全角空格等，再确认没有连续空格，即可跳过替换与空白折叠两次分配。
+        text = value.strip()
+        if text.isprintable() and "  " not in text:
+            return text or None
     if isinstance(value, bytes):
         for codec in ("utf-8", "utf-16le", "latin1"):
             try:
@@ -38,57 +56,89 @@ def _clean_text(value: Any) -> str | None:
     if isinstance(value, (list, tuple)):
         items = [str(v).strip() for v in value if str(v).strip()]
         value = " ".join(items)
-    text = str(value).replace("\x00", " ").strip()
-    text = re.sub(r"\s+", " ", text)
+    # str.split() 无参时在 C 层一次折叠所有空白（含 NUL 替换后的空格）
+    text = " ".join(str(value).replace("\x00", " ").split())
     return text or None
 
 
 def normalize_lookup(raw: dict[str, Any]) -> dict[str, Any]:
     lookup: dict[str, Any] = {}
-    for key, value in (raw or {}).items():
-        key_text = str(key).strip().lower()
+    if not raw:
+        return lookup
+    # 每张图几百个键：用 in + 赋值代替 setdefault 方法调用，后缀用 rpartition 取，
+    # 语义不变（同名键先到先得）。
+    for key, value in raw.items():
+        key_text = (key if type(key) is str else str(key)).strip().lower()
         if not key_text:
             continue
-        lookup.setdefault(key_text, value)
+        if key_text not in lookup:
+            lookup[key_text] = value
         if ":" in key_text:
-            lookup.setdefault(key_text.split(":")[-1], value)
+            suffix = key_text.rpartition(":")[2]
+            if suffix not in lookup:
+                lookup[suffix] = value
+    return lookup
+
+
+def _normalize_focus_lookup(raw: dict[str, Any]) -> dict[str, Any]:
+    """
+    normalize_lookup() 的子集版本：只保留 _FOCUS_LOOKUP_KEYS 里用得到的键。
+
+    EXIF 往往有几百个键而焦点解析只查几十个，结果 dict 小得多；
+    对同一个键的取值与 normalize_lookup() 完全一致（同名先到先得）。
+    """
+    lookup: dict[str, Any] = {}
+    if not raw:
+        return lookup
+    needed = _FOCUS_LOOKUP_KEYS
+    for key, value in raw.items():
+        key_text = (key if type(key) is str else str(key)).strip().lower()
+        if key_text in needed:
+            if key_text not in lookup:
+                lookup[key_text] = value
+        if ":" in key_text:
+            suffix = key_text.rpartition(":")[2]
+            if suffix in needed and suffix not in lookup:
+                lookup[suffix] = value
     return lookup
 
 
 def _extract_numbers(value: Any) -> list[float]:
-    if value is None:
-        return []
-    if isinstance(value, (int, float)):
+    value_type = type(value)
+    if value_type is str:
+        return [float(token) for token in _NUM_RE.findall(value)]
+    if value_type is int or value_type is float:
         return [float(value)]
-    if isinstance(value, (list, tuple)):
-        out: list[float] = []
-        for item in value:
-            out.extend(_extract_numbers(item))
-        return out
-    tokens = re.findall(r"[-+]?\d+(?:\.\d+)?", str(value))
-    out = []
-    for token in tokens:
-        try:
-            out.append(float(token))
-        except ValueError:
+    if (value_type is list or value_type is tuple) and all(type(item) in _PLAIN_NUMBER_TYPES for item in value):
+        # piexif / exifread 常直接给出扁平的数字序列
+        return [float(item) for item in value]
+    # 显式栈代替递归：MakerNote 块常是嵌套 tuple，省掉逐层函数调用。
+    out: list[float] = []
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if item is None:
             continue
+        if isinstance(item, (int, float)):
+            out.append(float(item))
+        elif isinstance(item, (list, tuple)):
+            stack.extend(reversed(item))
+        else:
+            # _NUM_RE 只匹配合法数字文本，float() 不会失败
+            out.extend(float(token) for token in _NUM_RE.findall(str(item)))
     return out
 
 
-def _is_dimension_like(value: float, size: int) -> bool:
-    if size <= 0 or value <= 0:
-        return False
-    if value <= 1.0:
-        return False
-    size_f = float(size)
-    return abs(value - size_f) <= 3.0 or abs(value - (size_f + 1.0)) <= 3.0
-
-
 def _normalize_focus_coordinate(x: float, y: float, width: int, height: int) -> tuple[float, float]:
+    # 热路径内联 clamp01，等价于 max(0.0, min(1.0, v))（NaN 同样落到 1.0）。
     if x > 1.0 or y > 1.0:
         if width > 0 and height > 0:
-            return (clamp01(x / float(width)), clamp01(y / float(height)))
-    return (clamp01(x), clamp01(y))
+            x = x / float(width)
+            y = y / float(height)
+    return (
+        x if 0.0 <= x <= 1.0 else (0.0 if x < 0.0 else 1.0),
+        y if 0.0 <= y <= 1.0 else (0.0 if y < 0.0 else 1.0),
+    )
 
 
 def _decode_focus_numbers_layout(
@@ -96,7 +146,17 @@ def _decode_focus_numbers_layout(
 ) -> tuple[float, float, float | None, float | None] | None:
     if len(numbers) < 2:
         return None
-    if len(numbers) >= 4 and _is_dimension_like(numbers[0], width) and _is_dimension_like(numbers[1], height):
+    # 前两个数是否像图像尺寸（与 size 或 size+1 相差不超过 3）。
+    # 写成单个 and 链：绝大多数块不带尺寸前缀，前几个比较即可判否。
+    if (
+        len(numbers) >= 4
+        and width > 0
+        and height > 0
+        and 1.0 < numbers[0]
+        and width - 3.0 <= numbers[0] <= width + 4.0
+        and 1.0 < numbers[1]
+        and height - 3.0 <= numbers[1] <= height + 4.0
+    ):
         center_x = numbers[2]
         center_y = numbers[3]
         span_start = 4
@@ -127,21 +187,20 @@ def _extract_focus_frame_size(value: Any) -> tuple[float, float] | None:
 
 
 def _normalize_focus_span(value: float | None, full_size: int, fallback: float) -> float:
-    if full_size <= 0:
-        return max(0.01, min(1.0, fallback))
-    if value is None or value <= 0:
-        return max(0.01, min(1.0, fallback))
-    span = float(value)
-    if span > 1.0:
-        span = span / float(full_size)
-    return max(0.01, min(1.0, span))
+    if full_size <= 0 or value is None or value <= 0:
+        span = fallback
+    else:
+        span = float(value)
+        if span > 1.0:
+            span = span / float(full_size)
+    return span if 0.01 <= span <= 1.0 else (0.01 if span < 0.01 else 1.0)
 
 
 def _focus_box_from_center(center_x: float, center_y: float, span_x: float, span_y: float) -> tuple[float, float, float, float]:
-    cx = clamp01(center_x)
-    cy = clamp01(center_y)
-    sx = max(0.01, min(1.0, span_x))
-    sy = max(0.01, min(1.0, span_y))
+    cx = center_x if 0.0 <= center_x <= 1.0 else (0.0 if center_x < 0.0 else 1.0)
+    cy = center_y if 0.0 <= center_y <= 1.0 else (0.0 if center_y < 0.0 else 1.0)
+    sx = span_x if 0.01 <= span_x <= 1.0 else (0.01 if span_x < 0.01 else 1.0)
+    sy = span_y if 0.01 <= span_y <= 1.0 else (0.01 if span_y < 0.01 else 1.0)
     half_x = sx * 0.5
     half_y = sy * 0.5
     left = cx - half_x
@@ -232,28 +291,51 @@ def _focus_box_from_dimension_prefixed_block(
 
 
 def _normalize_camera_model_key(value: Any) -> str:
+    if value is None:
+        return ""
+    if not isinstance(value, str):
+        # bytes / list 等先转成文本，才能作为缓存键
+        value = _clean_text(value)
+        if not value:
+            return ""
+    return _normalize_camera_model_text(value)
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_camera_model_text(value: str) -> str:
     text = _clean_text(value)
     if not text:
         return ""
-    return re.sub(r"[^A-Za-z0-9]+", "_", text).strip("_").upper()
+    if not text.isascii():
+        return _MODEL_KEY_RE.sub("_", text).strip("_").upper()
+    return "_".join(part for part in text.translate(_MODEL_KEY_TRANS).split("_") if part).upper()
 
 
-_CAMERA_MODEL_TO_FOCUS_TYPE: dict[str, CameraFocusType] = {
+# Read-only: _resolve_focus_camera_type_by_key caches its results, so mutating this
+# table at runtime would silently be ignored for keys already looked up.
+_CAMERA_MODEL_TO_FOCUS_TYPE: Mapping[str, CameraFocusType] = MappingProxyType({
     # Sony Alpha 1 II: users may see different spellings depending on toolchain.
     "ILCE_A1M2": CameraFocusType.ILCE_A1M2,
     "ILCE_1M2": CameraFocusType.ILCE_A1M2,
     "ILCEA1M2": CameraFocusType.ILCE_A1M2,
     "ILCE1M2": CameraFocusType.ILCE_A1M2,
-}
+})
 
 
 def resolve_focus_camera_type(camera_model: Any, *, camera_make: Any = None) -> CameraFocusType:
     """Resolve a focus extraction camera type from model/make metadata text."""
-    model_key = _normalize_camera_model_key(camera_model)
+    return _resolve_focus_camera_type_by_key(
+        _normalize_camera_model_key(camera_model),
+        _normalize_camera_model_key(camera_make),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_focus_camera_type_by_key(model_key: str, make_key: str) -> CameraFocusType:
+    # 同一批照片通常来自同一台相机，按 (model, make) 键缓存结果。
     if model_key in _CAMERA_MODEL_TO_FOCUS_TYPE:
         return _CAMERA_MODEL_TO_FOCUS_TYPE[model_key]
 
-    make_key = _normalize_camera_model_key(camera_make)
     # Conservative family fallback: Sony mirrorless/compact model prefixes.
     if make_key == "SONY" or model_key.startswith(("ILCE_", "ILME_", "DSC_", "ZV_")):
         return CameraFocusType.SONY_GENERIC
@@ -261,7 +343,20 @@ def resolve_focus_camera_type(camera_model: Any, *, camera_make: Any = None) ->
 
 
 def resolve_focus_camera_type_from_metadata(raw: dict[str, Any]) -> CameraFocusType:
-    lookup = normalize_lookup(raw)
+    return _resolve_focus_camera_type_from_lookup(_normalize_focus_lookup(raw))
+
+
+_CAMERA_IDENTITY_KEYS: tuple[str, ...] = (
+    "make",
+    "manufacturer",
+    "model",
+    "cameramodelname",
+    "camera model name",
+    "cameramodel",
+)
+
+
+def _resolve_focus_camera_type_from_lookup(lookup: dict[str, Any]) -> CameraFocusType:
     make_value = lookup.get("make") or lookup.get("manufacturer")
     model_value = (
         lookup.get("model")
@@ -272,22 +367,29 @@ def resolve_focus_camera_type_from_metadata(raw: dict[str, Any]) -> CameraFocusT
     return resolve_focus_camera_type(model_value, camera_make=make_value)
 
 
+# 枚举值 / 枚举名（小写）→ CameraFocusType，供字符串形式的 camera_type 直接查表。
+_CAMERA_FOCUS_TYPE_BY_TEXT: dict[str, CameraFocusType] = {
+    **{item.name.lower(): item for item in CameraFocusType},
+    **{item.value.lower(): item for item in CameraFocusType},
+}
+
+
 def _coerce_camera_type(
     camera_type: CameraFocusType | str | None,
     *,
-    raw: dict[str, Any],
+    lookup: dict[str, Any],
 ) -> CameraFocusType:
-    if camera_type is None:
-        return resolve_focus_camera_type_from_metadata(raw)
+    # 调用方已解析好机型（GUI 的常见用法）时直接返回
     if isinstance(camera_type, CameraFocusType):
         return camera_type
+    if camera_type is None:
+        return _resolve_focus_camera_type_from_lookup(lookup)
     text = str(camera_type).strip()
     if not text:
-        return resolve_focus_camera_type_from_metadata(raw)
-    normalized = text.lower()
-    for item in CameraFocusType:
-        if normalized in {item.value.lower(), item.name.lower()}:
-            return item
+        return _resolve_focus_camera_type_from_lookup(lookup)
+    matched = _CAMERA_FOCUS_TYPE_BY_TEXT.get(text.lower())
+    if matched is not None:
+        return matched
     return resolve_focus_camera_type(text)
 
 
@@ -323,24 +425,33 @@ def _parse_dimension_pair(value: Any) -> tuple[int, int] | None:
     return (width, height)
 
 
+_CALC_SIZE_KEY_PAIRS: tuple[tuple[str, str], ...] = (
+    ("exif:exifimagewidth", "exif:exifimageheight"),
+    ("exifimagewidth", "exifimageheight"),
+    ("exif:imagewidth", "exif:imageheight"),
+    ("rawimagewidth", "rawimageheight"),
+    ("imagewidth", "imageheight"),
+    ("file:imagewidth", "file:imageheight"),
+)
+_CALC_SIZE_PAIR_KEYS: tuple[str, ...] = ("composite:imagesize", "imagesize", "exif:image size")
+
+
 def resolve_focus_calc_image_size(raw: dict[str, Any], fallback: tuple[int, int]) -> tuple[int, int]:
     """Resolve the metadata coordinate-space size used by focus-point tags."""
-    lookup = normalize_lookup(raw)
-    key_pairs = [
-        ("exif:exifimagewidth", "exif:exifimageheight"),
-        ("exifimagewidth", "exifimageheight"),
-        ("exif:imagewidth", "exif:imageheight"),
-        ("rawimagewidth", "rawimageheight"),
-        ("imagewidth", "imageheight"),
-        ("file:imagewidth", "file:imageheight"),
-    ]
-    for width_key, height_key in key_pairs:
+    return _resolve_focus_calc_image_size_from_lookup(_normalize_focus_lookup(raw), fallback)
+
+
+def _resolve_focus_calc_image_size_from_lookup(
+    lookup: dict[str, Any],
+    fallback: tuple[int, int],
+) -> tuple[int, int]:
+    for width_key, height_key in _CALC_SIZE_KEY_PAIRS:
         width = _parse_positive_int(lookup.get(width_key))
         height = _parse_positive_int(lookup.get(height_key))
         if width and height:
             return (width, height)
 
-    for pair_key in ("composite:imagesize", "imagesize", "exif:image size"):
+    for pair_key in _CALC_SIZE_PAIR_KEYS:
         parsed = _parse_dimension_pair(lookup.get(pair_key))
         if parsed is not None:
             return parsed
@@ -398,6 +509,9 @@ def _resolve_focus_orientation_from_keys(
     return None
 
 
+_STANDARD_ORIENTATION_KEYS: tuple[str, ...] = ("orientation", "exif:orientation", "ifd0:orientation")
+_SONY_ORIENTATION_KEYS: tuple[str, ...] = ("sony:cameraorientation", "cameraorientation")
+
 _FocusOrientationResolver = Callable[[dict[str, Any], dict[str, Any], CameraFocusType], int | None]
 
 
@@ -407,10 +521,7 @@ def _resolve_standard_focus_orientation(
     camera_type: CameraFocusType,
 ) -> int | None:
     del raw, camera_type
-    return _resolve_focus_orientation_from_keys(
-        lookup,
-        ("orientation", "exif:orientation", "ifd0:orientation"),
-    )
+    return _resolve_focus_orientation_from_keys(lookup, _STANDARD_ORIENTATION_KEYS)
 
 
 def _resolve_sony_focus_orientation(
@@ -421,10 +532,7 @@ def _resolve_sony_focus_orientation(
     del raw, camera_type
     # Sony HIF/HEIF 竖拍样本经常没有标准 EXIF Orientation，
     # 但会把真实显示方向写在 CameraOrientation 里。
-    return _resolve_focus_orientation_from_keys(
-        lookup,
-        ("sony:cameraorientation", "cameraorientation"),
-    )
+    return _resolve_focus_orientation_from_keys(lookup, _SONY_ORIENTATION_KEYS)
 
 
 _DEFAULT_FOCUS_ORIENTATION_RESOLVERS: tuple[_FocusOrientationResolver, ...] = (
@@ -439,7 +547,8 @@ _SONY_FOCUS_ORIENTATION_RESOLVERS: tuple[_FocusOrientationResolver, ...] = (
 # 1. 新增机型/文件家族的横竖检测时，优先新增一个小 resolver 函数；
 # 2. 再把 resolver 注册到这个表，不要把厂商分支散落到调用方；
 # 3. 请先保留标准 EXIF resolver 在前，再补厂商私有字段 fallback；
-# 4. 扩展前务必用该机型真实横图/竖图样本各验证一次，避免误用别家私有标签语义。
+# 4. 扩展前务必用该机型真实横图/竖图样本各验证一次，避免误用别家私有标签语义；
+# 5. resolver 读取的新键要登记进 _FOCUS_LOOKUP_KEYS，否则 lookup 里不会有它。
 _FOCUS_ORIENTATION_RESOLVERS: dict[CameraFocusType, tuple[_FocusOrientationResolver, ...]] = {
     CameraFocusType.UNKNOWN: _DEFAULT_FOCUS_ORIENTATION_RESOLVERS,
     CameraFocusType.SONY_GENERIC: _SONY_FOCUS_ORIENTATION_RESOLVERS,
@@ -457,11 +566,20 @@ def resolve_focus_display_orientation(
     标准 EXIF Orientation 永远优先；仅当它缺失时，才尝试机型/厂商私有字段。
     这样既能修正 Sony HIF/HEIF 竖拍焦点框错位，也尽量不改变现有 JPEG/RAW 行为。
     """
-    lookup = normalize_lookup(raw)
-    resolved_camera_type = _coerce_camera_type(camera_type, raw=raw)
-    resolvers = _FOCUS_ORIENTATION_RESOLVERS.get(resolved_camera_type)
-    if not resolvers:
-        resolvers = _FOCUS_ORIENTATION_RESOLVERS[CameraFocusType.UNKNOWN]
+    lookup = _normalize_focus_lookup(raw)
+    return _resolve_focus_display_orientation_from_lookup(
+        raw,
+        lookup,
+        _coerce_camera_type(camera_type, lookup=lookup),
+    )
+
+
+def _resolve_focus_display_orientation_from_lookup(
+    raw: dict[str, Any],
+    lookup: dict[str, Any],
+    resolved_camera_type: CameraFocusType,
+) -> int:
+    resolvers = _FOCUS_ORIENTATION_RESOLVERS.get(resolved_camera_type) or _DEFAULT_FOCUS_ORIENTATION_RESOLVERS
     for resolver in resolvers:
         orientation = resolver(raw, lookup, resolved_camera_type)
         if orientation is not None:
@@ -581,13 +699,15 @@ def extract_focus_box_for_display(
     call: many cameras store focus metadata in the original EXIF coordinate space,
     while the GUI preview uses an Orientation-corrected image.
     """
-    calc_width, calc_height = resolve_focus_calc_image_size(raw, fallback=(display_width, display_height))
-    source_box = extract_focus_box(raw, calc_width, calc_height, camera_type=camera_type)
+    lookup = _normalize_focus_lookup(raw)
+    resolved = _coerce_camera_type(camera_type, lookup=lookup)
+    calc_width, calc_height = _resolve_focus_calc_image_size_from_lookup(lookup, (display_width, display_height))
+    source_box = _extract_focus_box_from_lookup(lookup, calc_width, calc_height, resolved)
     if source_box is None:
         return None
     return transform_focus_box_by_orientation(
         source_box,
-        resolve_focus_display_orientation(raw, camera_type=camera_type),
+        _resolve_focus_display_orientation_from_lookup(raw, lookup, resolved),
     )
 
 
@@ -598,27 +718,63 @@ def get_focus_point_for_display(
     camera_type: CameraFocusType | str | None = None,
 ) -> tuple[float, float] | None:
     """Return the focus point in display coordinates."""
-    calc_width, calc_height = resolve_focus_calc_image_size(raw, fallback=(display_width, display_height))
-    source_point = get_focus_point(raw, calc_width, calc_height, camera_type=camera_type)
+    lookup = _normalize_focus_lookup(raw)
+    resolved = _coerce_camera_type(camera_type, lookup=lookup)
+    calc_width, calc_height = _resolve_focus_calc_image_size_from_lookup(lookup, (display_width, display_height))
+    source_point = _get_focus_point_from_lookup(lookup, calc_width, calc_height, resolved)
     if source_point is None:
         return None
     return transform_focus_point_by_orientation(
         source_point,
-        resolve_focus_display_orientation(raw, camera_type=camera_type),
+        _resolve_focus_display_orientation_from_lookup(raw, lookup, resolved),
     )
 
 
-def _extract_focus_point_sony(raw: dict[str, Any], width: int, height: int) -> tuple[float, float] | None:
+_SONY_FOCUS_POINT_KEY_PAIRS: tuple[tuple[str, str], ...] = (
+    ("composite:focusx", "composite:focusy"),
+    ("focusx", "focusy"),
+    ("regioninfo:regionsregionlistregionareax", "regioninfo:regionsregionlistregionareay"),
+    ("regionareax", "regionareay"),
+)
+_SONY_FOCUS_POINT_LOCATION_KEYS: tuple[str, ...] = (
+    "subjectarea",
+    "subjectlocation",
+    "focuslocation",
+    "focuslocation2",
+    "afpoint",
+)
+_SONY_FOCUS_BOX_KEY_GROUPS: tuple[tuple[str, str, str, str], ...] = (
+    ("composite:focusx", "composite:focusy", "composite:focusw", "composite:focush"),
+    ("focusx", "focusy", "focusw", "focush"),
+    (
+        "regioninfo:regionsregionlistregionareax",
+        "regioninfo:regionsregionlistregionareay",
+        "regioninfo:regionsregionlistregionareaw",
+        "regioninfo:regionsregionlistregionareah",
+    ),
+    ("regionareax", "regionareay", "regionareaw", "regionareah"),
+)
+_SONY_FOCUS_BOX_LOCATION_KEYS: tuple[str, ...] = ("subjectlocation", "focuslocation", "focuslocation2", "afpoint")
+_SONY_FOCUS_FRAME_SIZE_KEYS: tuple[str, ...] = ("focusframesize", "focusframesize2")
+
+# 能产出焦点的全部候选键；元数据里一个都没有时直接返回，不再逐组遍历。
+# 新增候选键时记得同步进上面的表，这两个集合由表自动汇总。
+_SONY_FOCUS_POINT_KEYS: frozenset[str] = frozenset(
+    [key for pair in _SONY_FOCUS_POINT_KEY_PAIRS for key in pair]
+    + list(_SONY_MAKERNOTE_FOCUS_BLOCK_KEYS)
+    + list(_SONY_FOCUS_POINT_LOCATION_KEYS)
+)
+_SONY_FOCUS_BOX_KEYS: frozenset[str] = _SONY_FOCUS_POINT_KEYS | frozenset(
+    key for group in _SONY_FOCUS_BOX_KEY_GROUPS for key in group
+)
+
+
+def _extract_focus_point_sony(lookup: dict[str, Any], width: int, height: int) -> tuple[float, float] | None:
     if width <= 0 or height <= 0:
         return None
-    lookup = normalize_lookup(raw)
-    key_pairs = [
-        ("composite:focusx", "composite:focusy"),
-        ("focusx", "focusy"),
-        ("regioninfo:regionsregionlistregionareax", "regioninfo:regionsregionlistregionareay"),
-        ("regionareax", "regionareay"),
-    ]
-    for x_key, y_key in key_pairs:
+    if _SONY_FOCUS_POINT_KEYS.isdisjoint(lookup):
+        return None
+    for x_key, y_key in _SONY_FOCUS_POINT_KEY_PAIRS:
         if x_key in lookup and y_key in lookup:
             xs = _extract_numbers(lookup[x_key])
             ys = _extract_numbers(lookup[y_key])
@@ -633,7 +789,7 @@ def _extract_focus_point_sony(raw: dict[str, Any], width: int, height: int) -> t
         point = _focus_point_from_dimension_prefixed_block(_extract_numbers(lookup[key]))
         if point is not None:
             return point
-    for key in ("subjectarea", "subjectlocation", "focuslocation", "focuslocation2", "afpoint"):
+    for key in _SONY_FOCUS_POINT_LOCATION_KEYS:
         if key not in lookup:
             continue
         nums = _extract_numbers(lookup[key])
@@ -645,12 +801,37 @@ def _extract_focus_point_sony(raw: dict[str, Any], width: int, height: int) -> t
     return None
 
 
-def _extract_focus_box_sony(raw: dict[str, Any], width: int, height: int) -> tuple[float, float, float, float] | None:
+def _extract_focus_box_sony(lookup: dict[str, Any], width: int, height: int) -> tuple[float, float, float, float] | None:
+    box = _extract_focus_box_sony_from_tags(lookup, width, height)
+    if box is not None:
+        return box
+    return _default_focus_box_around_point(_extract_focus_point_sony(lookup, width, height), width, height)
+
+
+def _extract_focus_sony(
+    lookup: dict[str, Any],
+    width: int,
+    height: int,
+) -> tuple[tuple[float, float] | None, tuple[float, float, float, float] | None]:
+    # 焦点只解析一次：既作为返回值，也作为框标签缺失时的兜底中心。
+    focus_point = _extract_focus_point_sony(lookup, width, height)
+    box = _extract_focus_box_sony_from_tags(lookup, width, height)
+    if box is None:
+        box = _default_focus_box_around_point(focus_point, width, height)
+    return (focus_point, box)
+
+
+def _extract_focus_box_sony_from_tags(
+    lookup: dict[str, Any],
+    width: int,
+    height: int,
+) -> tuple[float, float, float, float] | None:
     if width <= 0 or height <= 0:
         return None
-    lookup = normalize_lookup(raw)
+    if _SONY_FOCUS_BOX_KEYS.isdisjoint(lookup):
+        return None
     focus_frame_span_px: tuple[float, float] | None = None
-    for key in ("focusframesize", "focusframesize2"):
+    for key in _SONY_FOCUS_FRAME_SIZE_KEYS:
         if key not in lookup:
             continue
         parsed = _extract_focus_frame_size(lookup[key])
@@ -671,18 +852,7 @@ def _extract_focus_box_sony(raw: dict[str, Any], width: int, height: int) -> tup
         )
         if box is not None:
             return box
-    box_key_groups = [
-        ("composite:focusx", "composite:focusy", "composite:focusw", "composite:focush"),
-        ("focusx", "focusy", "focusw", "focush"),
-        (
-            "regioninfo:regionsregionlistregionareax",
-            "regioninfo:regionsregionlistregionareay",
-            "regioninfo:regionsregionlistregionareaw",
-            "regioninfo:regionsregionlistregionareah",
-        ),
-        ("regionareax", "regionareay", "regionareaw", "regionareah"),
-    ]
-    for x_key, y_key, w_key, h_key in box_key_groups:
+    for x_key, y_key, w_key, h_key in _SONY_FOCUS_BOX_KEY_GROUPS:
         if x_key not in lookup or y_key not in lookup:
             continue
         xs = _extract_numbers(lookup[x_key])
@@ -697,14 +867,21 @@ def _extract_focus_box_sony(raw: dict[str, Any], width: int, height: int) -> tup
         box = _focus_box_from_numbers(nums, width, height, fallback_span_px=focus_frame_span_px)
         if box is not None:
             return box
-    for key in ("subjectlocation", "focuslocation", "focuslocation2", "afpoint"):
+    for key in _SONY_FOCUS_BOX_LOCATION_KEYS:
         if key not in lookup:
             continue
         box = _focus_box_from_numbers(_extract_numbers(lookup[key]), width, height, fallback_span_px=focus_frame_span_px)
         if box is not None:
             return box
-    focus_point = _extract_focus_point_sony(raw, width, height)
-    if focus_point is None:
+    return None
+
+
+def _default_focus_box_around_point(
+    focus_point: tuple[float, float] | None,
+    width: int,
+    height: int,
+) -> tuple[float, float, float, float] | None:
+    if focus_point is None or width <= 0 or height <= 0:
         return None
     default_side_px = max(24.0, min(width, height) * DEFAULT_FOCUS_BOX_SHORT_EDGE_RATIO)
     return _focus_box_from_center(
@@ -715,9 +892,29 @@ def _extract_focus_box_sony(raw: dict[str, Any], width: int, height: int) -> tup
     )
 
 
+# 焦点解析全流程（机型 / 坐标系尺寸 / 方向 / 焦点标签）会查询的全部小写键。
+# 新增查询键时先把它加进对应的表；直接写在函数里的键必须同步登记到这里。
+_FOCUS_LOOKUP_KEYS: frozenset[str] = frozenset(
+    [
+        *_CAMERA_IDENTITY_KEYS,
+        *(key for pair in _CALC_SIZE_KEY_PAIRS for key in pair),
+        *_CALC_SIZE_PAIR_KEYS,
+        *_STANDARD_ORIENTATION_KEYS,
+        *_SONY_ORIENTATION_KEYS,
+        *_SONY_FOCUS_FRAME_SIZE_KEYS,
+    ]
+) | _SONY_FOCUS_BOX_KEYS
+
+
 _FocusPointExtractor = Callable[[dict[str, Any], int, int], tuple[float, float] | None]
 _FocusBoxExtractor = Callable[[dict[str, Any], int, int], tuple[float, float, float, float] | None]
+_FocusExtractor = Callable[
+    [dict[str, Any], int, int],
+    tuple[tuple[float, float] | None, tuple[float, float, float, float] | None],
+]
 
+# 提取器的第一个参数是 _normalize_focus_lookup() 的结果，由调用方统一构建一次，
+# 避免同一份 EXIF 在机型判断 / 尺寸解析 / 焦点提取里被反复小写化。
 # 当前仅实现 Sony 系列元数据提取；未知机型暂时走相同算法以保持兼容。
 _FOCUS_POINT_EXTRACTORS: dict[CameraFocusType, _FocusPointExtractor] = {
     CameraFocusType.UNKNOWN: _extract_focus_point_sony,
@@ -729,6 +926,12 @@ _FOCUS_BOX_EXTRACTORS: dict[CameraFocusType, _FocusBoxExtractor] = {
     CameraFocusType.SONY_GENERIC: _extract_focus_box_sony,
     CameraFocusType.ILCE_A1M2: _extract_focus_box_sony,
 }
+# 点 + 框一次取出；新增机型时三张表需同步注册。
+_FOCUS_EXTRACTORS: dict[CameraFocusType, _FocusExtractor] = {
+    CameraFocusType.UNKNOWN: _extract_focus_sony,
+    CameraFocusType.SONY_GENERIC: _extract_focus_sony,
+    CameraFocusType.ILCE_A1M2: _extract_focus_sony,
+}
 
 
 def get_focus_point(
@@ -738,9 +941,18 @@ def get_focus_point(
     camera_type: CameraFocusType | str | None = None,
 ) -> tuple[float, float] | None:
     """Return normalized focus point from metadata using camera-aware strategy."""
-    resolved = _coerce_camera_type(camera_type, raw=raw)
-    extractor = _FOCUS_POINT_EXTRACTORS.get(resolved) or _FOCUS_POINT_EXTRACTORS[CameraFocusType.UNKNOWN]
-    return extractor(raw, width, height)
+    lookup = _normalize_focus_lookup(raw)
+    return _get_focus_point_from_lookup(lookup, width, height, _coerce_camera_type(camera_type, lookup=lookup))
+
+
+def _get_focus_point_from_lookup(
+    lookup: dict[str, Any],
+    width: int,
+    height: int,
+    camera_type: CameraFocusType,
+) -> tuple[float, float] | None:
+    extractor = _FOCUS_POINT_EXTRACTORS.get(camera_type, _extract_focus_point_sony)
+    return extractor(lookup, width, height)
 
 
 def extract_focus_box(
@@ -750,9 +962,37 @@ def extract_focus_box(
     camera_type: CameraFocusType | str | None = None,
 ) -> tuple[float, float, float, float] | None:
     """Return normalized focus box from metadata using camera-aware strategy."""
-    resolved = _coerce_camera_type(camera_type, raw=raw)
-    extractor = _FOCUS_BOX_EXTRACTORS.get(resolved) or _FOCUS_BOX_EXTRACTORS[CameraFocusType.UNKNOWN]
-    return extractor(raw, width, height)
+    lookup = _normalize_focus_lookup(raw)
+    return _extract_focus_box_from_lookup(lookup, width, height, _coerce_camera_type(camera_type, lookup=lookup))
+
+
+def _extract_focus_box_from_lookup(
+    lookup: dict[str, Any],
+    width: int,
+    height: int,
+    camera_type: CameraFocusType,
+) -> tuple[float, float, float, float] | None:
+    extractor = _FOCUS_BOX_EXTRACTORS.get(camera_type, _extract_focus_box_sony)
+    return extractor(lookup, width, height)
+
+
+def extract_focus(
+    raw: dict[str, Any],
+    width: int,
+    height: int,
+    camera_type: CameraFocusType | str | None = None,
+) -> tuple[tuple[float, float] | None, tuple[float, float, float, float] | None]:
+    """
+    Return ``(focus_point, focus_box)`` with a single metadata pass.
+
+    Same results as calling get_focus_point() and extract_focus_box() separately,
+    but the lookup / camera type are resolved once and the focus point is reused
+    as the box fallback.
+    """
+    lookup = _normalize_focus_lookup(raw)
+    resolved = _coerce_camera_type(camera_type, lookup=lookup)
+    extractor = _FOCUS_EXTRACTORS.get(resolved, _extract_focus_sony)
+    return extractor(lookup, width, height)
 
 
 __all__ = [
@@ -768,6 +1008,7 @@ __all__ = [
     "resolve_focus_calc_image_size",
     "get_focus_point",
     "get_focus_point_for_display",
+    "extract_focus",
     "extract_focus_box",
     "transform_focus_point_by_orientation",
     "transform_focus_box_by_orientation",
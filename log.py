@@ -9,9 +9,11 @@ Usage::
 """
 from __future__ import annotations
 
+import atexit
 import os
 import sys
-from datetime import datetime
+import threading
+import time
 from pathlib import Path
 from typing import Any, TextIO
 
@@ -61,57 +63,109 @@ LOG_FILE: str | None = _default_log_file()
 LOG_LEVEL: str = os.environ.get("APP_COMMON_LOG_LEVEL", "DEBUG").upper()  # DEBUG | INFO | WARNING | ERROR
 
 _LEVEL_ORDER = {"DEBUG": 0, "INFO": 1, "WARNING": 2, "ERROR": 3}
+# LOG_LEVEL 在进程内不变，启动时解析成整数阈值，过滤只剩一次整数比较。
+_CURRENT_LEVEL_INT: int = _LEVEL_ORDER.get(LOG_LEVEL, 0)
 
+# 所有 _Logger 共用一个日志文件句柄，首次写入时才打开。
+_SHARED_FILE: TextIO | None = None
+_SHARED_FILE_FAILED = False
+_SHARED_LOCK = threading.Lock()
 
-def _level_ok(level: str) -> bool:
-    return _LEVEL_ORDER.get(level.upper(), 0) >= _LEVEL_ORDER.get(LOG_LEVEL.upper(), 0)
+
+def _get_shared_file() -> TextIO | None:
+    global _SHARED_FILE, _SHARED_FILE_FAILED
+    if _SHARED_FILE is not None or _SHARED_FILE_FAILED or not LOG_FILE:
+        return _SHARED_FILE
+    with _SHARED_LOCK:
+        if _SHARED_FILE is None and not _SHARED_FILE_FAILED:
+            try:
+                # 行缓冲：每行写满即落盘，不再需要每次显式 flush()
+                _SHARED_FILE = open(LOG_FILE, "a", encoding="utf-8", buffering=1)  # noqa: SIM115
+                atexit.register(_close_shared_file)
+            except OSError:
+                # 打开失败只尝试一次，之后只写 stderr
+                _SHARED_FILE_FAILED = True
+    return _SHARED_FILE
+
+
+def _close_shared_file() -> None:
+    """退出时关闭日志文件；之后（其它 atexit 钩子里）的日志只写 stderr，不会写已关闭的句柄。"""
+    global _SHARED_FILE, _SHARED_FILE_FAILED
+    with _SHARED_LOCK:
+        log_file = _SHARED_FILE
+        _SHARED_FILE = None
+        _SHARED_FILE_FAILED = True
+    if log_file is not None:
+        try:
+            log_file.close()
+        except (OSError, ValueError):
+            pass
+
+
+# (秒, 时间戳文本)：同一秒内的日志复用 strftime 结果；整体替换 tuple，多线程下不会读到半更新状态。
+_LAST_TS: tuple[int, str] = (-1, "")
+
+
+def _timestamp() -> str:
+    global _LAST_TS
+    sec = int(time.time())
+    cached_sec, cached_text = _LAST_TS
+    if cached_sec != sec:
+        cached_text = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        _LAST_TS = (sec, cached_text)
+    return cached_text
 
 
 def _format(level: str, name: str, msg: str, *args: Any) -> str:
-    parts = [datetime.now().strftime("%Y-%m-%d %H:%M:%S"), level, name, msg % args if args else msg]
-    return " ".join(str(p) for p in parts)
+    text = msg % args if args else msg
+    return f"{_timestamp()} {level} {name} {text}"
+
+
+def _noop(*_args: Any, **_kwargs: Any) -> None:
+    return None
 
 
 class _Logger:
     def __init__(self, name: str) -> None:
         self._name = name
-        self._file: TextIO | None = None
-        if LOG_FILE:
-            try:
-                self._file = open(LOG_FILE, "a", encoding="utf-8")  # noqa: SIM115
-            except OSError:
-                pass
-
-    def _write(self, level: str, msg: str, *args: Any) -> None:
-        if not _level_ok(level):
+        self._threshold = _CURRENT_LEVEL_INT
+        # 低于阈值的级别直接绑定为空函数，被过滤的调用不再走 _write。
+        for method_name, level in (("debug", "DEBUG"), ("info", "INFO"), ("warning", "WARNING")):
+            if _LEVEL_ORDER[level] < _CURRENT_LEVEL_INT:
+                setattr(self, method_name, _noop)
+
+    def _write(self, level_int: int, level: str, msg: str, *args: Any) -> None:
+        if level_int < self._threshold:
             return
         line = _format(level, self._name, msg, *args) + "\n"
-        if self._file:
+        log_file = _get_shared_file()
+        if log_file is not None:
             try:
-                self._file.write(line)
-                self._file.flush()
-            except OSError:
+                with _SHARED_LOCK:
+                    log_file.write(line)
+            except (OSError, ValueError):
+                # ValueError：句柄已被关闭（例如退出阶段），日志不应影响调用方
                 pass
         err = sys.stderr
         if err is None or not hasattr(err, "write"):
             return
+        # Python 3.9+ 的 stderr 无论是否重定向都是行缓冲，不必再 flush。
         try:
             err.write(line)
-            err.flush()
-        except OSError:
+        except (OSError, ValueError):
             pass
 
     def debug(self, msg: str, *args: Any) -> None:
-        self._write("DEBUG", msg, *args)
+        self._write(0, "DEBUG", msg, *args)
 
     def info(self, msg: str, *args: Any) -> None:
-        self._write("INFO", msg, *args)
+        self._write(1, "INFO", msg, *args)
 
     def warning(self, msg: str, *args: Any) -> None:
-        self._write("WARNING", msg, *args)
+        self._write(2, "WARNING", msg, *args)
 
     def error(self, msg: str, *args: Any) -> None:
-        self._write("ERROR", msg, *args)
+        self._write(3, "ERROR", msg, *args)
 
 
 def get_logger(name: str) -> _Logger:
@@ -41,17 +41,24 @@ import math
 from typing import Callable
 
 try:
-    from PyQt6.QtCore import QPointF, QRectF, Qt, pyqtSignal
-    from PyQt6.QtGui import QColor, QPainter, QPen, QPixmap
+    from PyQt6.QtCore import QPoint, QPointF, QRect, QRectF, Qt, QTimer, pyqtSignal
+    from PyQt6.QtGui import QColor, QPainter, QPen, QPixmap, QPixmapCache, QRegion
     from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget
     _QRect_or_QRectF = "QRect | QRectF"
 except ImportError:
-    from PyQt5.QtCore import QPointF, QRectF, Qt, pyqtSignal  # type: ignore[no-reattr]
-    from PyQt5.QtGui import QColor, QPainter, QPen, QPixmap  # type: ignore[no-reattr]
+    from PyQt5.QtCore import QPoint, QPointF, QRect, QRectF, Qt, QTimer, pyqtSignal  # type: ignore[no-reattr]
+    from PyQt5.QtGui import QColor, QPainter, QPen, QPixmap, QPixmapCache, QRegion  # type: ignore[no-reattr]
     from PyQt5.QtWidgets import QLabel, QVBoxLayout, QWidget  # type: ignore[no-reattr]
     _QRect_or_QRectF = "QRect | QRectF"
 
 # Type alias for overlay callables registered at runtime.
+# 绘制/鼠标事件热路径里反复用到的 Qt 枚举，提前解析一次
+_SMOOTH_HINT = QPainter.RenderHint.SmoothPixmapTransform
+_LEFT_BUTTON = Qt.MouseButton.LeftButton
+_OPEN_HAND = Qt.CursorShape.OpenHandCursor
+_CLOSED_HAND = Qt.CursorShape.ClosedHandCursor
+_NO_PEN = Qt.PenStyle.NoPen
+
 OverlayLayer = Callable[["QPainter", "QRectF", "object"], None]
 NormalizedBox = tuple[float, float, float, float]
 PREVIEW_COMPOSITION_GRID_MODES: tuple[str, ...] = (
@@ -82,9 +89,24 @@ PREVIEW_SCALE_PRESET_PERCENTS: tuple[int, ...] = (
     400,
     500,
 )
+# 缩小图同时放进全局 QPixmapCache（按源图 cacheKey + 尺寸），原图/预览图来回切换时可直接复用；
+# Qt 默认 10MB 上限放不下一张全屏缩放图，这里至少提到 64MB
+_SCALED_PIXMAP_CACHE_LIMIT_KB = 64 * 1024
+if QPixmapCache.cacheLimit() < _SCALED_PIXMAP_CACHE_LIMIT_KB:
+    QPixmapCache.setCacheLimit(_SCALED_PIXMAP_CACHE_LIMIT_KB)
+# 滚轮 angleDelta -> 缩放倍数；滚轮步长只有少数几种取值，触控板的连续值也有限
+_WHEEL_ZOOM_BASE = 1.0015
+_WHEEL_ZOOM_FACTORS: dict[int, float] = {}
+_WHEEL_ZOOM_FACTORS_MAX = 1024
+# 滚轮缩放/窗口缩放停止多久后再做一次平滑缩放重绘（毫秒）
+_INTERACTIVE_SETTLE_MS = 30
 _FOCUS_BOX_OUTER_BLACK_WIDTH = 1
 _FOCUS_BOX_GREEN_WIDTH = 4
 _FOCUS_BOX_INNER_BLACK_WIDTH = 1
+_FOCUS_BOX_BLACK = QColor("#000000")
+_FOCUS_BOX_GREEN = QColor("#2EFF55")
+# 构图线线宽 -> (阴影笔, 亮线笔)，每帧复用，不再逐条线新建 QPen
+_GRID_PENS: dict[int, tuple["QPen", "QPen"]] = {}
 _GRID_MODE_ALIASES: dict[str, str] = {
     "off": "none",
 }
@@ -253,10 +275,79 @@ class PreviewOverlayOptions:
     composition_grid_mode: str = PREVIEW_COMPOSITION_GRID_MODES[0]
     composition_grid_line_width: int = PREVIEW_COMPOSITION_GRID_LINE_WIDTHS[0]
 
+def _append_box_ring_rects(
+    out: "list[QRect]",
+    left_px: int,
+    top_px: int,
+    right_px: int,
+    bottom_px: int,
+    thickness: int,
+) -> tuple[int, int, int, int]:
+    """把一圈 thickness 像素宽的边框拆成上下左右四个矩形追加到 out，返回内圈边界。"""
+    if thickness <= 0:
+        return (left_px, top_px, right_px, bottom_px)
+    width_px = right_px - left_px
+    height_px = bottom_px - top_px
+    ring = min(int(thickness), max(0, width_px // 2), max(0, height_px // 2))
+    if ring <= 0:
+        return (left_px, top_px, right_px, bottom_px)
+
+    out.append(QRect(left_px, top_px, width_px, ring))
+    out.append(QRect(left_px, bottom_px - ring, width_px, ring))
+
+    inner_height = height_px - (ring * 2)
+    if inner_height > 0:
+        out.append(QRect(left_px, top_px + ring, ring, inner_height))
+        out.append(QRect(right_px - ring, top_px + ring, ring, inner_height))
+    return (left_px + ring, top_px + ring, right_px - ring, bottom_px - ring)
+
+
+def _composition_grid_pens(line_width: int) -> tuple["QPen", "QPen"]:
+    pens = _GRID_PENS.get(line_width)
+    if pens is None:
+        shadow_pen = QPen(QColor(0, 0, 0, 112))
+        shadow_pen.setWidth(max(2, line_width + 2))
+        line_pen = QPen(QColor(255, 255, 255, 176))
+        line_pen.setWidth(max(1, line_width))
+        for pen in (shadow_pen, line_pen):
+            try:
+                pen.setCosmetic(True)
+            except Exception:
+                pass
+        pens = (shadow_pen, line_pen)
+        _GRID_PENS[line_width] = pens
+    return pens
+
+
 # ---------------------------------------------------------------------------
 # Checker background helper (self-contained, no external deps)
 # ---------------------------------------------------------------------------
 
+_CHECKER_LIGHT = QColor(203, 203, 203)
+_CHECKER_DARK = QColor(153, 153, 153)
+# (cell, devicePixelRatio) -> 2x2 格的棋盘贴图；DPR 变化时自然换成新键
+_CHECKER_TILES: dict[tuple[int, float], "QPixmap"] = {}
+
+
+def _checker_tile(cell: int, dpr: float) -> "QPixmap":
+    key = (cell, dpr)
+    tile = _CHECKER_TILES.get(key)
+    if tile is None:
+        side = int(round(cell * 2 * dpr))
+        tile = QPixmap(side, side)
+        tile.setDevicePixelRatio(dpr)
+        tile_painter = QPainter(tile)
+        try:
+            tile_painter.fillRect(0, 0, cell, cell, _CHECKER_LIGHT)
+            tile_painter.fillRect(cell, 0, cell, cell, _CHECKER_DARK)
+            tile_painter.fillRect(0, cell, cell, cell, _CHECKER_DARK)
+            tile_painter.fillRect(cell, cell, cell, cell, _CHECKER_LIGHT)
+        finally:
+            tile_painter.end()
+        _CHECKER_TILES[key] = tile
+    return tile
+
+
 def draw_checker_background(
     painter: "QPainter",
     rect: "object",  # QRect | QRectF
@@ -267,25 +358,13 @@ def draw_checker_background(
     Alternating light/dark cells make transparent areas clearly visible.
     Safe to call with either ``QRect`` or ``QRectF``.
     """
-    x0 = int(rect.x())
-    y0 = int(rect.y())
-    x1 = x0 + int(rect.width())
-    y1 = y0 + int(rect.height())
-    light = QColor(203, 203, 203)
-    dark = QColor(153, 153, 153)
-    ri = 0
-    row = y0
-    while row < y1:
-        row_h = min(cell, y1 - row)
-        ci = 0
-        col = x0
-        while col < x1:
-            col_w = min(cell, x1 - col)
-            painter.fillRect(col, row, col_w, row_h, light if (ri + ci) % 2 == 0 else dark)
-            col += cell
-            ci += 1
-        row += cell
-        ri += 1
+    # 一次 drawTiledPixmap 代替逐格 fillRect：大画布上每帧可省掉上万次 Python→Qt 调用。
+    target = QRect(int(rect.x()), int(rect.y()), int(rect.width()), int(rect.height()))
+    if target.width() <= 0 or target.height() <= 0 or cell <= 0:
+        return
+    device = painter.device()
+    dpr = float(device.devicePixelRatioF()) if device is not None else 1.0
+    painter.drawTiledPixmap(target, _checker_tile(int(cell), dpr))
 
 
 # ---------------------------------------------------------------------------
@@ -316,15 +395,35 @@ class PreviewCanvas(QLabel):
         # Built-in: zoom / pan
         self._use_original_size: bool = False
         self._zoom: float = 1.0
-        self._offset: "QPointF" = QPointF(0.0, 0.0)
+        # 平移偏移存成两个 float，拖动时不必每次构造 QPointF；_offset 属性保留兼容
+        self._ox: float = 0.0
+        self._oy: float = 0.0
         self._dragging: bool = False
-        self._last_drag_pos: "QPointF" = QPointF(0.0, 0.0)
+        # 最近一次设置的光标形状（None 表示已 unsetCursor），避免重复 setCursor
+        self._cursor_shape: "Qt.CursorShape | None" = None
+        self._last_drag_x: float = 0.0
+        self._last_drag_y: float = 0.0
         self._min_zoom: float = 0.02
         self._max_zoom: float = 24.0
         self._last_emitted_display_scale_percent: float | None = None
 
+        # 缩小显示时缓存按当前尺寸平滑缩放好的图，平移/叠加层重绘直接贴图
+        self._scaled_cache: "QPixmap | None" = None
+        self._scaled_cache_key: "tuple[int, int, int, float] | None" = None
+        # paintEvent 期间的脏区域；局部重绘时跳过与之不相交的绘制
+        self._paint_dirty_rect: "QRect | None" = None
+        # 焦点框屏幕矩形 -> (黑色环矩形, 绿色环矩形)
+        self._focus_box_rings: "tuple[tuple[int, int, int, int], list[QRect], list[QRect]] | None" = None
+        # 连续滚轮缩放/窗口缩放期间只做快速缩放，停下后由定时器触发一次平滑重绘
+        self._interactive_scaling: bool = False
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(_INTERACTIVE_SETTLE_MS)
+        self._settle_timer.timeout.connect(self._finish_interactive_scaling)
+
         # Runtime-registered overlay callables
-        self._overlay_layers: list[OverlayLayer] = []
+        # 不可变元组：注册/注销时整体替换，绘制中图层自行注销也不会打乱遍历
+        self._overlay_layers: tuple[OverlayLayer, ...] = ()
 
     # ------------------------------------------------------------------
     # Public API – batched overlay state / options (open/closed)
@@ -342,6 +441,23 @@ class PreviewCanvas(QLabel):
         if self._apply_overlay_options_data(target):
             self.update()
 
+    def apply_overlay(
+        self,
+        state: "PreviewOverlayState | None" = None,
+        options: "PreviewOverlayOptions | None" = None,
+    ) -> None:
+        """Apply overlay state and options together with at most one repaint.
+
+        Unlike the single-purpose methods, ``None`` here means "leave unchanged".
+        """
+        changed = False
+        if state is not None:
+            changed = self._apply_overlay_state_data(state)
+        if options is not None:
+            changed = self._apply_overlay_options_data(options) or changed
+        if changed:
+            self.update()
+
     # ------------------------------------------------------------------
     # Public API – focus box
     # ------------------------------------------------------------------
@@ -350,16 +466,18 @@ class PreviewCanvas(QLabel):
         """Set the focus-box in normalised [0, 1] image coordinates."""
         if self._focus_box == focus_box:
             return
+        old_rect = self._visible_focus_box_rect()
         self._focus_box = focus_box
-        self.update()
+        self._update_focus_box_region(old_rect)
 
     def set_show_focus_box(self, enabled: bool) -> None:
         """Show or hide the focus-box overlay."""
         parsed = bool(enabled)
         if self._show_focus_box == parsed:
             return
+        old_rect = self._visible_focus_box_rect()
         self._show_focus_box = parsed
-        self.update()
+        self._update_focus_box_region(old_rect)
 
     def set_composition_grid_mode(self, mode: str | None) -> None:
         """Set the composition-guide overlay mode."""
@@ -395,7 +513,7 @@ class PreviewCanvas(QLabel):
             self._use_original_size = target
             if reset_view:
                 self._zoom = 1.0
-                self._offset = QPointF(0.0, 0.0)
+                self._ox = self._oy = 0.0
             self._clamp_offset()
             self._update_cursor()
             self.update()
@@ -408,7 +526,7 @@ class PreviewCanvas(QLabel):
         if target == self._use_original_size:
             if reset_view:
                 self._zoom = 1.0
-                self._offset = QPointF(0.0, 0.0)
+                self._ox = self._oy = 0.0
             elif view_ratio is not None:
                 self._apply_view_center_ratio(view_ratio)
                 self._clamp_offset()
@@ -424,7 +542,7 @@ class PreviewCanvas(QLabel):
                 self._zoom = max(self._min_zoom, min(self._max_zoom, old_total_scale / new_fit))
         if reset_view:
             self._zoom = 1.0
-            self._offset = QPointF(0.0, 0.0)
+            self._ox = self._oy = 0.0
         elif view_ratio is not None:
             self._apply_view_center_ratio(view_ratio)
         self._clamp_offset()
@@ -492,11 +610,13 @@ class PreviewCanvas(QLabel):
         old_total_scale = self._fit_scale() * self._zoom
 
         self._source_pixmap = pixmap
+        self._scaled_cache = None
+        self._scaled_cache_key = None
         if self._source_pixmap is None or self._source_pixmap.isNull():
             self._source_pixmap = None
             self._focus_box = None
             self._zoom = 1.0
-            self._offset = QPointF(0.0, 0.0)
+            self._ox = self._oy = 0.0
             self._dragging = False
             self._on_source_cleared()
             self.setText("暂无预览")
@@ -522,7 +642,7 @@ class PreviewCanvas(QLabel):
                 self._zoom = max(self._min_zoom, min(self._max_zoom, old_total_scale / new_fit))
         if reset_view:
             self._zoom = 1.0
-            self._offset = QPointF(0.0, 0.0)
+            self._ox = self._oy = 0.0
         elif view_ratio is not None:
             self._apply_view_center_ratio(view_ratio)
         self._clamp_offset()
@@ -542,14 +662,14 @@ class PreviewCanvas(QLabel):
         while the painter is still active. Multiple layers are drawn in
         registration order.
         """
-        self._overlay_layers.append(fn)
+        self._overlay_layers = self._overlay_layers + (fn,)
 
     def unregister_overlay_layer(self, fn: OverlayLayer) -> None:
         """Remove a previously registered overlay callable."""
-        try:
-            self._overlay_layers.remove(fn)
-        except ValueError:
-            pass
+        if fn in self._overlay_layers:
+            layers = list(self._overlay_layers)
+            layers.remove(fn)
+            self._overlay_layers = tuple(layers)
 
     def render_source_pixmap_with_overlays(self) -> "QPixmap | None":
         """Render the current source pixmap with overlays at source resolution."""
@@ -560,7 +680,7 @@ class PreviewCanvas(QLabel):
         try:
             try:
                 painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-                painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+                painter.setRenderHint(_SMOOTH_HINT, True)
             except Exception:
                 pass
             content_rect = rendered.rect()
@@ -654,10 +774,13 @@ class PreviewCanvas(QLabel):
     # Internal geometry helpers
     # ------------------------------------------------------------------
 
-    def _fit_scale(self) -> float:
+    # 以下几何辅助函数都接受可选的 content：同一次事件处理里只取一次 contentsRect()
+
+    def _fit_scale(self, content: "QRect | None" = None) -> float:
         if self._source_pixmap is None or self._use_original_size:
             return 1.0
-        content = self.contentsRect()
+        if content is None:
+            content = self.contentsRect()
         if content.width() <= 0 or content.height() <= 0:
             return 1.0
         return min(
@@ -665,15 +788,23 @@ class PreviewCanvas(QLabel):
             content.height() / float(max(1, self._source_pixmap.height())),
         )
 
+    @property
+    def _offset(self) -> "QPointF":
+        return QPointF(self._ox, self._oy)
+
+    @_offset.setter
+    def _offset(self, value: "QPointF") -> None:
+        self._ox = float(value.x())
+        self._oy = float(value.y())
+
     def _view_center_ratio(self) -> "tuple[float, float] | None":
-        draw_rect = self._display_rect()
-        if draw_rect is None or draw_rect.width() <= 0 or draw_rect.height() <= 0:
+        content = self.contentsRect()
+        geom = self._display_geometry(content)
+        if geom is None:
             return None
-        c = QPointF(self.contentsRect().center())
-        return (
-            (c.x() - draw_rect.left()) / draw_rect.width(),
-            (c.y() - draw_rect.top()) / draw_rect.height(),
-        )
+        x, y, dw, dh = geom
+        c = content.center()
+        return ((c.x() - x) / dw, (c.y() - y) / dh)
 
     def _apply_view_center_ratio(self, ratio: "tuple[float, float]") -> None:
         if self._source_pixmap is None:
@@ -681,29 +812,38 @@ class PreviewCanvas(QLabel):
         content = self.contentsRect()
         if content.width() <= 0 or content.height() <= 0:
             return
-        total = self._fit_scale() * self._zoom
+        total = self._fit_scale(content) * self._zoom
         if total <= 0:
             return
         dw = self._source_pixmap.width() * total
         dh = self._source_pixmap.height() * total
-        cc = QPointF(content.center())
-        cx = cc.x() + (0.5 - ratio[0]) * dw
-        cy = cc.y() + (0.5 - ratio[1]) * dh
-        self._offset = QPointF(cx - cc.x(), cy - cc.y())
+        self._ox = (0.5 - ratio[0]) * dw
+        self._oy = (0.5 - ratio[1]) * dh
 
-    def _display_rect(self) -> "QRectF | None":
-        if self._source_pixmap is None:
+    def _display_geometry(self, content: "QRect | None" = None) -> "tuple[float, float, float, float] | None":
+        """图片在控件中的显示区域 (x, y, w, h)；几何计算只用 float，不构造 Qt 对象。"""
+        src = self._source_pixmap
+        if src is None:
             return None
-        content = self.contentsRect()
+        if content is None:
+            content = self.contentsRect()
         if content.width() <= 0 or content.height() <= 0:
             return None
-        scale = self._fit_scale() * self._zoom
+        scale = self._fit_scale(content) * self._zoom
         if scale <= 0:
             return None
-        dw = self._source_pixmap.width() * scale
-        dh = self._source_pixmap.height() * scale
-        center = QPointF(content.center()) + self._offset
-        return QRectF(center.x() - dw * 0.5, center.y() - dh * 0.5, dw, dh)
+        dw = src.width() * scale
+        dh = src.height() * scale
+        if dw <= 0 or dh <= 0:
+            return None
+        center = content.center()
+        return (center.x() + self._ox - dw * 0.5, center.y() + self._oy - dh * 0.5, dw, dh)
+
+    def _display_rect(self, content: "QRect | None" = None) -> "QRectF | None":
+        geom = self._display_geometry(content)
+        if geom is None:
+            return None
+        return QRectF(*geom)
 
     def _emit_display_scale_percent_changed(self, *, force: bool = False) -> None:
         current = self.current_display_scale_percent()
@@ -716,38 +856,65 @@ class PreviewCanvas(QLabel):
         self._last_emitted_display_scale_percent = current
         self.display_scale_percent_changed.emit(current)
 
-    def _can_pan(self) -> bool:
-        dr = self._display_rect()
-        if dr is None:
+    def _can_pan(self, content: "QRect | None" = None) -> bool:
+        cr = content if content is not None else self.contentsRect()
+        geom = self._display_geometry(cr)
+        if geom is None:
             return False
-        cr = self.contentsRect()
-        return (dr.width() > cr.width() + 0.5) or (dr.height() > cr.height() + 0.5)
+        return (geom[2] > cr.width() + 0.5) or (geom[3] > cr.height() + 0.5)
 
-    def _clamp_offset(self) -> None:
+    def _clamp_offset(self, content: "QRect | None" = None) -> None:
         if self._source_pixmap is None:
-            self._offset = QPointF(0.0, 0.0)
+            self._ox = self._oy = 0.0
             return
-        content = self.contentsRect()
+        if content is None:
+            content = self.contentsRect()
         if content.width() <= 0 or content.height() <= 0:
-            self._offset = QPointF(0.0, 0.0)
+            self._ox = self._oy = 0.0
             return
-        scale = self._fit_scale() * self._zoom
+        scale = self._fit_scale(content) * self._zoom
         dw = self._source_pixmap.width() * scale
         dh = self._source_pixmap.height() * scale
         lx = max(0.0, (dw - content.width()) * 0.5)
         ly = max(0.0, (dh - content.height()) * 0.5)
-        self._offset = QPointF(
-            max(-lx, min(lx, self._offset.x())),
-            max(-ly, min(ly, self._offset.y())),
-        )
+        self._ox = max(-lx, min(lx, self._ox))
+        self._oy = max(-ly, min(ly, self._oy))
 
-    def _update_cursor(self) -> None:
-        if self._source_pixmap is None or not self._can_pan():
-            self.unsetCursor()
+    def _visible_focus_box_rect(self) -> "QRect | None":
+        """当前屏幕上焦点框占据的像素区域（未显示时为 None）。"""
+        if not (self._show_focus_box and self._focus_box):
+            return None
+        content = self.contentsRect()
+        draw_rect = self._display_rect(content)
+        if draw_rect is None:
+            return None
+        return self._focus_box_screen_rect(draw_rect, content)
+
+    def _update_focus_box_region(self, old_rect: "QRect | None") -> None:
+        """焦点框变化只重绘新旧框的并集，不触发整幅图像 + 棋盘格重绘。"""
+        new_rect = self._visible_focus_box_rect()
+        if old_rect is None and new_rect is None:
             return
-        self.setCursor(
-            Qt.CursorShape.ClosedHandCursor if self._dragging else Qt.CursorShape.OpenHandCursor
-        )
+        if old_rect is None:
+            dirty = new_rect
+        elif new_rect is None:
+            dirty = old_rect
+        else:
+            dirty = old_rect.united(new_rect)
+        self.update(dirty.adjusted(-1, -1, 1, 1))
+
+    def _update_cursor(self, content: "QRect | None" = None) -> None:
+        if self._source_pixmap is None or not self._can_pan(content):
+            shape = None
+        else:
+            shape = _CLOSED_HAND if self._dragging else _OPEN_HAND
+        if shape == self._cursor_shape:
+            return
+        self._cursor_shape = shape
+        if shape is None:
+            self.unsetCursor()
+        else:
+            self.setCursor(shape)
 
     # ------------------------------------------------------------------
     # Qt event overrides
@@ -755,8 +922,13 @@ class PreviewCanvas(QLabel):
 
     def resizeEvent(self, event) -> None:  # type: ignore[override]
         super().resizeEvent(event)
-        self._clamp_offset()
-        self._update_cursor()
+        content = self.contentsRect()
+        self._clamp_offset(content)
+        self._update_cursor(content)
+        if self._source_pixmap is not None:
+            # 拖动窗口边缘时每帧尺寸都变，先快速绘制，停下后再平滑缩放一次
+            self._interactive_scaling = True
+            self._settle_timer.start()
         self._emit_display_scale_percent_changed()
 
     def wheelEvent(self, event) -> None:  # type: ignore[override]
@@ -768,41 +940,52 @@ class PreviewCanvas(QLabel):
             event.ignore()
             return
         old_zoom = self._zoom
-        new_zoom = max(self._min_zoom, min(self._max_zoom, old_zoom * pow(1.0015, float(delta))))
+        factor = _WHEEL_ZOOM_FACTORS.get(delta)
+        if factor is None:
+            factor = pow(_WHEEL_ZOOM_BASE, float(delta))
+            if len(_WHEEL_ZOOM_FACTORS) < _WHEEL_ZOOM_FACTORS_MAX:
+                _WHEEL_ZOOM_FACTORS[delta] = factor
+        new_zoom = max(self._min_zoom, min(self._max_zoom, old_zoom * factor))
         if abs(new_zoom - old_zoom) < 1e-9:
             event.accept()
             return
-        fit_scale = self._fit_scale()
+        content = self.contentsRect()
+        fit_scale = self._fit_scale(content)
         if fit_scale <= 0:
             event.ignore()
             return
-        content = self.contentsRect()
-        cc = QPointF(content.center())
+        cc = content.center()
         cur = event.position()
         old_s = fit_scale * old_zoom
         new_s = fit_scale * new_zoom
         if old_s <= 0 or new_s <= 0:
             event.ignore()
             return
-        img_c = cc + self._offset
-        idx = (cur.x() - img_c.x()) / old_s
-        idy = (cur.y() - img_c.y()) / old_s
+        cur_x = cur.x()
+        cur_y = cur.y()
+        idx = (cur_x - cc.x() - self._ox) / old_s
+        idy = (cur_y - cc.y() - self._oy) / old_s
         self._zoom = new_zoom
-        self._offset = QPointF(cur.x() - idx * new_s, cur.y() - idy * new_s) - cc
-        self._clamp_offset()
-        self._update_cursor()
+        self._ox = cur_x - idx * new_s - cc.x()
+        self._oy = cur_y - idy * new_s - cc.y()
+        self._clamp_offset(content)
+        self._update_cursor(content)
+        self._interactive_scaling = True
+        self._settle_timer.start()
         self.update()
         self._emit_display_scale_percent_changed(force=True)
         event.accept()
 
     def mousePressEvent(self, event) -> None:  # type: ignore[override]
         if (
-            event.button() == Qt.MouseButton.LeftButton
+            event.button() == _LEFT_BUTTON
             and self._source_pixmap is not None
             and self._can_pan()
         ):
             self._dragging = True
-            self._last_drag_pos = event.position()
+            pos = event.position()
+            self._last_drag_x = pos.x()
+            self._last_drag_y = pos.y()
             self._update_cursor()
             event.accept()
             return
@@ -810,8 +993,13 @@ class PreviewCanvas(QLabel):
 
     def mouseMoveEvent(self, event) -> None:  # type: ignore[override]
         if self._dragging:
-            self._offset += event.position() - self._last_drag_pos
-            self._last_drag_pos = event.position()
+            pos = event.position()
+            x = pos.x()
+            y = pos.y()
+            self._ox += x - self._last_drag_x
+            self._oy += y - self._last_drag_y
+            self._last_drag_x = x
+            self._last_drag_y = y
             self._clamp_offset()
             self.update()
             event.accept()
@@ -819,7 +1007,7 @@ class PreviewCanvas(QLabel):
         super().mouseMoveEvent(event)
 
     def mouseReleaseEvent(self, event) -> None:  # type: ignore[override]
-        if event.button() == Qt.MouseButton.LeftButton and self._dragging:
+        if event.button() == _LEFT_BUTTON and self._dragging:
             self._dragging = False
             self._update_cursor()
             event.accept()
@@ -830,28 +1018,128 @@ class PreviewCanvas(QLabel):
         if self._source_pixmap is None:
             super().paintEvent(event)
             return
-        draw_rect = self._display_rect()
+        content = self.contentsRect()
+        draw_rect = self._display_rect(content)
         if draw_rect is None:
             super().paintEvent(event)
             return
 
-        content = self.contentsRect()
+        dirty = event.rect()
+        if not dirty.intersects(content):
+            return
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
-        painter.setClipRect(content)
+        painter.setRenderHint(_SMOOTH_HINT, True)
+        painter.setClipRegion(event.region().intersected(content))
+        self._paint_dirty_rect = dirty
+        try:
+            # ── checker background ────────────────────────────────────
+            self._draw_checker_behind_image(painter, content, draw_rect)
 
-        # ── checker background ────────────────────────────────────────
-        draw_checker_background(painter, content)
+            # ── image ─────────────────────────────────────────────────
+            if draw_rect.intersects(QRectF(dirty)):
+                self._draw_source_pixmap(painter, draw_rect)
+            self._paint_overlay_layers(painter, draw_rect, content)
+        finally:
+            self._paint_dirty_rect = None
+            painter.end()
 
-        # ── image ─────────────────────────────────────────────────────
-        painter.drawPixmap(
-            draw_rect,
-            self._source_pixmap,
-            QRectF(0, 0, self._source_pixmap.width(), self._source_pixmap.height()),
+    def _draw_checker_behind_image(self, painter: "QPainter", content: "QRect", draw_rect: "QRectF") -> None:
+        src = self._source_pixmap
+        if src is None or src.hasAlphaChannel():
+            draw_checker_background(painter, content)
+            return
+        # 不透明图片会完整盖住自身区域，棋盘格只需画在图片外的留白处
+        left = math.ceil(draw_rect.left())
+        top = math.ceil(draw_rect.top())
+        covered = QRect(
+            left,
+            top,
+            max(0, math.floor(draw_rect.right()) - left),
+            max(0, math.floor(draw_rect.bottom()) - top),
+        )
+        if covered.contains(content):
+            return
+        if covered.isEmpty():
+            draw_checker_background(painter, content)
+            return
+        painter.save()
+        painter.setClipRegion(
+            QRegion(content).subtracted(QRegion(covered)),
+            Qt.ClipOperation.IntersectClip,
         )
-        self._paint_overlay_layers(painter, draw_rect, content)
+        draw_checker_background(painter, content)
+        painter.restore()
+
+    def _finish_interactive_scaling(self) -> None:
+        self._interactive_scaling = False
+        self.update()
+
+    def _draw_source_pixmap(self, painter: "QPainter", draw_rect: "QRectF") -> None:
+        src = self._source_pixmap
+        if src is None:
+            return
+        if (
+            self._use_original_size
+            and abs(self._zoom - 1.0) < 1e-6
+            and src.devicePixelRatio() == 1.0
+            and self.devicePixelRatioF() == 1.0
+        ):
+            # 原图 1:1 且屏幕像素也是 1:1：按整数坐标直接贴图，走 Qt 的无缩放快速路径；
+            # 高 DPI 屏上仍需放大，保持原来的平滑缩放绘制
+            painter.setRenderHint(_SMOOTH_HINT, False)
+            painter.drawPixmap(QPoint(int(round(draw_rect.x())), int(round(draw_rect.y()))), src)
+            painter.setRenderHint(_SMOOTH_HINT, True)
+            return
+        scaled = self._scaled_source_pixmap(draw_rect, build=not self._interactive_scaling)
+        if scaled is not None:
+            painter.drawPixmap(QPointF(round(draw_rect.x()), round(draw_rect.y())), scaled)
+            return
+        source_rect = QRectF(0, 0, src.width(), src.height())
+        if self._interactive_scaling and draw_rect.width() < src.width():
+            # 滚轮缩放/窗口缩放进行中：尺寸每帧都在变，缓存命中不了；先用最近邻快速绘制，
+            # 停下 _INTERACTIVE_SETTLE_MS 后再平滑重绘。
+            painter.setRenderHint(_SMOOTH_HINT, False)
+            painter.drawPixmap(draw_rect, src, source_rect)
+            painter.setRenderHint(_SMOOTH_HINT, True)
+            return
+        painter.drawPixmap(draw_rect, src, source_rect)
 
-        painter.end()
+    def _scaled_source_pixmap(self, draw_rect: "QRectF", *, build: bool = True) -> "QPixmap | None":
+        """返回按 draw_rect 物理像素尺寸缩小好的源图；放大显示时返回 None。
+
+        缩小显示（适应窗口等常见情况）时每帧对整张原图做平滑采样代价很高，
+        缓存一张屏幕尺寸的缩放图后，平移与叠加层重绘只需普通贴图。
+        放大显示时直接带变换绘制即可：光栅引擎只处理裁剪后的可见区域，
+        若缓存放大图反而会占用远超屏幕的内存。
+        build=False 时只返回命中的缓存，不重新缩放（滚轮/窗口缩放过程中使用）。
+        """
+        src = self._source_pixmap
+        if src is None:
+            return None
+        dpr = float(self.devicePixelRatioF())
+        target_w = int(round(draw_rect.width() * dpr))
+        target_h = int(round(draw_rect.height() * dpr))
+        if target_w <= 0 or target_h <= 0 or target_w >= src.width() or target_h >= src.height():
+            return None
+        key = (int(src.cacheKey()), target_w, target_h, dpr)
+        if self._scaled_cache_key == key and self._scaled_cache is not None:
+            return self._scaled_cache
+        shared_key = f"app_common.preview_canvas:{key[0]}:{target_w}x{target_h}@{dpr:g}"
+        scaled = QPixmapCache.find(shared_key)
+        if scaled is None or scaled.isNull():
+            if not build:
+                return None
+            scaled = src.scaled(
+                target_w,
+                target_h,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            scaled.setDevicePixelRatio(dpr)
+            QPixmapCache.insert(shared_key, scaled)
+        self._scaled_cache = scaled
+        self._scaled_cache_key = key
+        return scaled
 
     # ------------------------------------------------------------------
     # Built-in overlay painters (private)
@@ -871,6 +1159,7 @@ class PreviewCanvas(QLabel):
 
         self._paint_overlays(painter, draw_rect, content_rect)
 
+        # 逐个 try：单个图层出错不影响其余图层
         for layer_fn in self._overlay_layers:
             try:
                 layer_fn(painter, draw_rect, content_rect)
@@ -960,53 +1249,55 @@ class PreviewCanvas(QLabel):
         end: "QPointF",
         line_width: int,
     ) -> None:
-        shadow_pen = QPen(QColor(0, 0, 0, 112))
-        shadow_pen.setWidth(max(2, int(line_width) + 2))
-        try:
-            shadow_pen.setCosmetic(True)
-        except Exception:
-            pass
+        shadow_pen, line_pen = _composition_grid_pens(int(line_width))
         painter.setPen(shadow_pen)
         painter.drawLine(start, end)
-
-        line_pen = QPen(QColor(255, 255, 255, 176))
-        line_pen.setWidth(max(1, int(line_width)))
-        try:
-            line_pen.setCosmetic(True)
-        except Exception:
-            pass
         painter.setPen(line_pen)
         painter.drawLine(start, end)
 
     def _paint_focus_box(self, painter: "QPainter", draw_rect: "QRectF", content: "object") -> None:
-        def _fill_box_ring(
-            left_px: int,
-            top_px: int,
-            right_px: int,
-            bottom_px: int,
-            thickness: int,
-            color: "QColor",
-        ) -> tuple[int, int, int, int]:
-            if thickness <= 0:
-                return (left_px, top_px, right_px, bottom_px)
-            width_px = right_px - left_px
-            height_px = bottom_px - top_px
-            ring = min(int(thickness), max(0, width_px // 2), max(0, height_px // 2))
-            if ring <= 0:
-                return (left_px, top_px, right_px, bottom_px)
-
-            painter.fillRect(left_px, top_px, width_px, ring, color)
-            painter.fillRect(left_px, bottom_px - ring, width_px, ring, color)
-
-            inner_height = height_px - (ring * 2)
-            if inner_height > 0:
-                painter.fillRect(left_px, top_px + ring, ring, inner_height, color)
-                painter.fillRect(right_px - ring, top_px + ring, ring, inner_height, color)
-            return (left_px + ring, top_px + ring, right_px - ring, bottom_px - ring)
+        box_rect = self._focus_box_screen_rect(draw_rect, content)
+        if box_rect is None:
+            return
+        dirty = self._paint_dirty_rect
+        if dirty is not None and not dirty.intersects(box_rect):
+            return
+        # 环形矩形只在焦点框屏幕位置变化时重算；按颜色各一次 drawRects 画完
+        key = (box_rect.left(), box_rect.top(), box_rect.width(), box_rect.height())
+        cached = self._focus_box_rings
+        if cached is None or cached[0] != key:
+            black_rects: list[QRect] = []
+            green_rects: list[QRect] = []
+            edges = _append_box_ring_rects(
+                black_rects,
+                box_rect.left(),
+                box_rect.top(),
+                box_rect.left() + box_rect.width(),
+                box_rect.top() + box_rect.height(),
+                _FOCUS_BOX_OUTER_BLACK_WIDTH,
+            )
+            edges = _append_box_ring_rects(green_rects, *edges, _FOCUS_BOX_GREEN_WIDTH)
+            _append_box_ring_rects(black_rects, *edges, _FOCUS_BOX_INNER_BLACK_WIDTH)
+            cached = (key, black_rects, green_rects)
+            self._focus_box_rings = cached
+        _, black_rects, green_rects = cached
+        painter.save()
+        try:
+            painter.setPen(_NO_PEN)
+            if black_rects:
+                painter.setBrush(_FOCUS_BOX_BLACK)
+                painter.drawRects(black_rects)
+            if green_rects:
+                painter.setBrush(_FOCUS_BOX_GREEN)
+                painter.drawRects(green_rects)
+        finally:
+            painter.restore()
 
+    def _focus_box_screen_rect(self, draw_rect: "QRectF", content: "object") -> "QRect | None":
+        """焦点框在屏幕上的像素矩形（含边框），绘制与局部刷新共用。"""
         fb = self._focus_box
         if fb is None:
-            return
+            return None
         left = int(round(draw_rect.left() + fb[0] * draw_rect.width()))
         top = int(round(draw_rect.top() + fb[1] * draw_rect.height()))
         right = int(round(draw_rect.left() + fb[2] * draw_rect.width()))
@@ -1017,37 +1308,13 @@ class PreviewCanvas(QLabel):
         cr = cl + content.width() - 1
         cb = ct + content.height() - 1
         if cr - cl < 2 or cb - ct < 2:
-            return
+            return None
 
         left = max(cl, min(cr - 2, left))
         top = max(ct, min(cb - 2, top))
         right = min(cr, max(left + 2, right))
         bottom = min(cb, max(top + 2, bottom))
-        painter.setBrush(Qt.BrushStyle.NoBrush)
-        ring_left, ring_top, ring_right, ring_bottom = _fill_box_ring(
-            left,
-            top,
-            right + 1,
-            bottom + 1,
-            _FOCUS_BOX_OUTER_BLACK_WIDTH,
-            QColor("#000000"),
-        )
-        ring_left, ring_top, ring_right, ring_bottom = _fill_box_ring(
-            ring_left,
-            ring_top,
-            ring_right,
-            ring_bottom,
-            _FOCUS_BOX_GREEN_WIDTH,
-            QColor("#2EFF55"),
-        )
-        _fill_box_ring(
-            ring_left,
-            ring_top,
-            ring_right,
-            ring_bottom,
-            _FOCUS_BOX_INNER_BLACK_WIDTH,
-            QColor("#000000"),
-        )
+        return QRect(left, top, right + 1 - left, bottom + 1 - top)
 
 
 # ---------------------------------------------------------------------------
@@ -1157,6 +1424,59 @@ class PreviewWithStatusBar(QWidget):
         """Forward batched overlay options to the inner canvas."""
         self._canvas.apply_overlay_options(options)
 
+    def apply_overlay(
+        self,
+        state: "PreviewOverlayState | None" = None,
+        options: "PreviewOverlayOptions | None" = None,
+    ) -> None:
+        """Forward combined overlay state/options to the inner canvas."""
+        self._canvas.apply_overlay(state, options)
+
+    # 常用接口显式转发，避免每次都走 __getattr__ 兜底
+    def set_focus_box(self, focus_box: "NormalizedBox | None") -> None:
+        self._canvas.set_focus_box(focus_box)
+
+    def set_show_focus_box(self, enabled: bool) -> None:
+        self._canvas.set_show_focus_box(enabled)
+
+    def set_composition_grid_mode(self, mode: str | None) -> None:
+        self._canvas.set_composition_grid_mode(mode)
+
+    def set_composition_grid_line_width(self, width: int | str | None) -> None:
+        self._canvas.set_composition_grid_line_width(width)
+
+    def set_use_original_size(
+        self,
+        enabled: bool,
+        *,
+        reset_view: bool = False,
+        preserve_view: bool = False,
+        preserve_scale: bool = False,
+    ) -> None:
+        self._canvas.set_use_original_size(
+            enabled,
+            reset_view=reset_view,
+            preserve_view=preserve_view,
+            preserve_scale=preserve_scale,
+        )
+
+    def register_overlay_layer(self, fn: OverlayLayer) -> None:
+        self._canvas.register_overlay_layer(fn)
+
+    def unregister_overlay_layer(self, fn: OverlayLayer) -> None:
+        self._canvas.unregister_overlay_layer(fn)
+
+    def render_source_pixmap_with_overlays(self) -> "QPixmap | None":
+        return self._canvas.render_source_pixmap_with_overlays()
+
+    def save_source_pixmap_with_overlays(
+        self,
+        path: str,
+        fmt: str | None = None,
+        quality: int = -1,
+    ) -> bool:
+        return self._canvas.save_source_pixmap_with_overlays(path, fmt, quality)
+
     def _refresh_status_bar(self) -> None:
         segments = self._get_status_segments()
         self._status_label.setText(" | ".join(s for s in segments if s))
@@ -1187,5 +1507,5 @@ class PreviewWithStatusBar(QWidget):
         return out
 
     def __getattr__(self, name: str):
-        """Forward other attributes/methods to the inner canvas."""
+        """Forward other (uncommon) attributes/methods to the inner canvas."""
         return getattr(self._canvas, name)
@@ -11,15 +11,30 @@ Usage:
     db.close()
 """
 
+import atexit
+import functools
+import json
+import operator
 import os
+import pathlib
+import queue
 import sqlite3
 import time
 import threading
-from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+import weakref
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Sequence
 from .file_utils import ensure_hidden_directory
 from .log import get_logger
 
+# fastnumbers（可选）：C 实现的字符串→数字解析，失败时直接返回默认值而不抛异常。
+# 旧版本不支持 on_type_error 等参数，导入时试调用一次，不兼容则退回内置 float()。
+try:
+    from fastnumbers import try_float as _fn_try_float
+    _fn_try_float("1", on_fail=None, on_type_error=None, allow_underscores=True)
+except Exception:
+    _fn_try_float = None
+
 _log = get_logger("report_db")
 
 
@@ -91,7 +106,90 @@ PHOTO_COLUMNS = [
 ]
 
 # 列名集合，用于快速查找
-COLUMN_NAMES = {col[0] for col in PHOTO_COLUMNS}
+COLUMN_NAMES = frozenset(col[0] for col in PHOTO_COLUMNS)
+# 有序列名 / 默认值，导入时算好，避免调用时再解包 PHOTO_COLUMNS
+ALL_COLS = tuple(col[0] for col in PHOTO_COLUMNS)
+DEFAULTS: Dict[str, Any] = {col[0]: col[2] for col in PHOTO_COLUMNS}
+NON_FILENAME_COLS = tuple(c for c in ALL_COLS if c != "filename")
+# update_photo / update_ratings_batch 可写的列（filename 为定位键，不参与 SET）
+_UPDATABLE_COLUMNS = frozenset(NON_FILENAME_COLS)
+
+# 结果浏览器列表实际用到的列；列表查询可传 columns=LIST_COLUMNS 只取这些列
+LIST_COLUMNS = (
+    "filename", "rating", "pick", "focus_status", "is_flying", "has_bird",
+    "adj_sharpness", "adj_topiq", "head_sharp", "nima_score",
+    "bird_species_cn", "bird_species_en",
+    "temp_jpeg_path", "current_path", "original_path",
+    "camera_model", "lens_model", "iso", "shutter_speed", "aperture",
+    "date_time_original",
+)
+
+# 热点查询的固定 SQL 文本：sqlite3 的语句缓存按 SQL 文本命中，统一用常量
+SQL_GET_PHOTO = "SELECT * FROM photos WHERE filename = ?"
+SQL_GET_BY_RATING = "SELECT * FROM photos WHERE rating = ? ORDER BY filename"
+SQL_GET_META = "SELECT value FROM meta WHERE key = ?"
+SQL_SET_META = "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)"
+SQL_COUNT = "SELECT COUNT(*) FROM photos"
+# 统计：按评分分组一次扫描，同时累计有鸟/飞行数（总数由各组相加）
+SQL_STATISTICS = (
+    "SELECT rating, COUNT(*), "
+    "SUM(CASE WHEN has_bird = 1 THEN 1 ELSE 0 END), "
+    "SUM(CASE WHEN is_flying = 1 THEN 1 ELSE 0 END) "
+    "FROM photos GROUP BY rating ORDER BY rating"
+)
+
+# 结果浏览器排序表达式；表达式索引只有在文本完全一致时才会被使用
+_SHARPNESS_SORT_KEY = "COALESCE(adj_sharpness, head_sharp, -1e99)"
+_AESTHETIC_SORT_KEY = "COALESCE(adj_topiq, nima_score, -1e99)"
+
+# 筛选列表达到该长度时改用 IN (SELECT value FROM json_each(?))，只绑定一个参数
+_JSON_IN_MIN_VALUES = 8
+
+# 每个连接缓存的已编译语句数（sqlite3 默认 128）
+_CACHED_STATEMENTS = 256
+
+# 只读连接池大小：get_* 查询走独立的只读连接，WAL 下不必排队等待写入方的 _lock
+_READ_POOL_SIZE = 4
+
+# 单行写入（insert_photo/update_photo/set_meta）不再逐条 commit：
+# 攒够 _COMMIT_BATCH_SIZE 条或距首条未提交写入超过 _COMMIT_DELAY_S 秒再统一提交。
+# 语句本身立即执行，同一连接上的读取和 rowcount 不受影响。
+_COMMIT_BATCH_SIZE = 64
+_COMMIT_DELAY_S = 0.25
+# 本进程内已完成建表/升级的库文件：(路径, st_dev, st_ino) → PRAGMA schema_version。
+# 同一文件再次打开且 schema cookie 未变时，不再重复执行 CREATE ... IF NOT EXISTS 与版本查询；
+# 库被删除重建（即使 inode 被复用）或被其他程序改过表结构时 cookie 不同，会重新初始化。
+_SCHEMA_READY: Dict[tuple, int] = {}
+_json_each_available: Optional[bool] = None
+
+
+def _schema_ready_key(db_path: str) -> Optional[tuple]:
+    try:
+        st = os.stat(db_path)
+    except OSError:
+        return None
+    return (os.path.normcase(os.path.abspath(db_path)), st.st_dev, st.st_ino)
+
+
+# 累计写入这么多行后在后台线程重新 ANALYZE，避免规划器沿用过期的 sqlite_stat1
+_ANALYZE_EVERY_WRITES = 5000
+# 有未提交写入的实例；进程退出时统一 flush，避免最后一批写入被回滚
+_DBS_WITH_PENDING_WRITES: "weakref.WeakSet[ReportDB]" = weakref.WeakSet()
+
+
+def _flush_pending_report_dbs() -> None:
+    for db in list(_DBS_WITH_PENDING_WRITES):
+        try:
+            db.flush()
+        except Exception as e:
+            _log.warning(
+                "[ReportDB] 退出时提交未提交写入失败 db_path=%r: %s",
+                getattr(db, "db_path", None),
+                e,
+            )
+
+
+atexit.register(_flush_pending_report_dbs)
 
 # 控制开关：True = 仅从 report.db 读取 EXIF，不读文件；False = report 优先，未命中再读文件
 EXIF_ONLY_FROM_REPORT_DB = True
@@ -221,86 +319,148 @@ def get_preview_path_for_file(path: str, current_dir: str, report_cache: Dict[st
     temp_path = row.get("temp_jpeg_path")
     if not temp_path or not str(temp_path).strip():
         return path
-    temp_path = str(temp_path).strip()
-    resolved = os.path.normpath(os.path.join(current_dir, temp_path)) if not os.path.isabs(temp_path) else os.path.normpath(temp_path)
-    if os.path.isfile(resolved):
+    resolved = _resolve_preview(str(temp_path).strip(), current_dir)
+    if resolved:
         _log.debug("[get_preview_path_for_file] 使用 temp_jpeg_path path=%r resolved=%r", path, resolved)
         return resolved
     _log.debug("[get_preview_path_for_file] temp 文件不存在 使用原 path=%r", path)
     return path
 
 
+# 只缓存“文件存在”的解析结果：不存在的 temp_jpeg_path 之后可能被生成，每次重新检查
+_PREVIEW_CACHE_MAX = 4096
+_preview_hits: Dict[tuple, str] = {}
+_preview_hits_lock = threading.Lock()
+
+
+def _resolve_preview(temp_path: str, current_dir: str) -> Optional[str]:
+    """解析 temp_jpeg_path 为完整路径并确认文件存在；命中结果缓存，列表滚动时不再重复 stat。"""
+    key = (temp_path, current_dir)
+    resolved = _preview_hits.get(key)
+    if resolved is not None:
+        return resolved
+    if os.path.isabs(temp_path):
+        resolved = os.path.normpath(temp_path)
+    else:
+        resolved = os.path.normpath(os.path.join(current_dir, temp_path))
+    if not os.path.isfile(resolved):
+        return None
+    with _preview_hits_lock:
+        _preview_hits[key] = resolved
+        while len(_preview_hits) > _PREVIEW_CACHE_MAX:
+            del _preview_hits[next(iter(_preview_hits))]
+    return resolved
+
+
+def invalidate_preview_path(resolved_path: str) -> None:
+    """预览文件已不存在或加载失败时调用，移除解析缓存中指向 resolved_path 的条目。"""
+    target = os.path.normpath(resolved_path) if resolved_path else ""
+    if not target:
+        return
+    with _preview_hits_lock:
+        for key in [k for k, v in _preview_hits.items() if v == target]:
+            del _preview_hits[key]
+
+
+def clear_preview_cache() -> None:
+    """清空 get_preview_path_for_file 的路径解析缓存（切换目录、重新加载 report 或清理缓存文件后调用）。"""
+    _log.debug("[clear_preview_cache]")
+    with _preview_hits_lock:
+        _preview_hits.clear()
+
+
+# report 列 → exiftool 键（无特殊逻辑的直接映射；空值/空白字符串跳过）
+_EXIF_MAP: "tuple[tuple[str, tuple[str, ...]], ...]" = (
+    ("caption", ("XMP-dc:Description", "IFD0:ImageDescription")),
+    # 相机与镜头
+    ("camera_model", ("IFD0:Model", "EXIF:Model")),
+    ("lens_model", ("ExifIFD:LensModel", "EXIF:LensModel")),
+    # 拍摄参数
+    ("iso", ("ExifIFD:ISO", "EXIF:ISO")),
+    ("shutter_speed", ("Composite:ShutterSpeed", "ExifIFD:ExposureTime")),
+    ("aperture", ("Composite:Aperture", "ExifIFD:FNumber")),
+    ("focal_length", ("ExifIFD:FocalLength", "EXIF:FocalLength")),
+    ("focal_length_35mm", ("ExifIFD:FocalLengthIn35mmFormat", "EXIF:FocalLengthIn35mmFormat")),
+    # 时间
+    ("date_time_original", ("ExifIFD:DateTimeOriginal", "EXIF:DateTimeOriginal")),
+    # GPS
+    ("gps_latitude", ("Composite:GPSLatitude", "EXIF:GPSLatitude")),
+    ("gps_longitude", ("Composite:GPSLongitude", "EXIF:GPSLongitude")),
+    ("gps_altitude", ("Composite:GPSAltitude", "EXIF:GPSAltitude")),
+)
+_EXIF_TITLE_KEYS = ("XMP-dc:Title", "XMP-dc:title", "IPTC:ObjectName")
+_EXIF_COUNTRY_KEYS = ("XMP:Country", "XMP-photoshop:Country", "XMP-photoshop:Country-PrimaryLocationName")
+_EXIF_CITY_KEYS = ("XMP:City", "XMP-photoshop:City")
+_EXIF_STATE_KEYS = ("XMP:State", "XMP-photoshop:State")
+_GREEN_FOCUS_STATUSES = frozenset(("BEST", "精焦"))
+_EXIF_PICK_KEYS = ("XMP-xmpDM:pick", "XMP-xmpDM:Pick", "XMP-xmp:Pick", "XMP:Pick")
+
+
 def report_row_to_exiftool_style(row: Dict[str, Any], source_file: str) -> Dict[str, Any]:
     """
     将 ReportDB 的一行（photos 表记录）转为 exiftool -G1 风格的平坦字典，
     供文件列表 MetadataLoader._parse_rec 与主窗口 load_all_exif_exiftool 复用。
 
     Args:
-        row: get_photo / get_all_photos 返回的字典（列名即键）
+        row: get_photo / get_all_photos 返回的字典或 sqlite3.Row（列名即键）
         source_file: 当前文件路径，用于 SourceFile 及供调用方 normpath
 
     Returns:
         exiftool 风格 dict，包含 SourceFile 及 XMP-dc:Title、XMP-xmp:Rating、
         XMP:City/State/Country、ExifIFD:ISO、Composite:ShutterSpeed 等键
     """
-    _log.debug("[report_row_to_exiftool_style] source_file=%r row_keys=%s", source_file, len(row) if isinstance(row, dict) else 0)
+    _log.debug("[report_row_to_exiftool_style] source_file=%r row_keys=%s", source_file, len(row) if isinstance(row, (dict, sqlite3.Row)) else 0)
     out: Dict[str, Any] = {"SourceFile": source_file}
-    if not isinstance(row, dict):
-        _log.debug("[report_row_to_exiftool_style] row 非 dict 返回仅 SourceFile")
+    if isinstance(row, sqlite3.Row):
+        row = dict(row)
+    elif not isinstance(row, dict):
+        _log.debug("[report_row_to_exiftool_style] row 非 dict/Row 返回仅 SourceFile")
         return out
 
-    def _set(k: str, v: Any) -> None:
-        if v is not None and (not isinstance(v, str) or v.strip() != ""):
+    get = row.get
+    _str = str
+
+    def _set_all(keys: "tuple[str, ...]", v: Any) -> None:
+        if v is None or (isinstance(v, _str) and not v.strip()):
+            return
+        for k in keys:
             out[k] = v
 
     # 标题：优先鸟种中文名（列表“标题”列），无则用 title
-    species = row.get("bird_species_cn")
-    if species and str(species).strip():
-        _set("XMP-dc:Title", species)
-        _set("XMP-dc:title", species)
-        _set("IPTC:ObjectName", species)
-    else:
-        _set("XMP-dc:Title", row.get("title"))
-        _set("XMP-dc:title", row.get("title"))
-        _set("IPTC:ObjectName", row.get("title"))
-    _set("XMP-dc:Description", row.get("caption"))
-    _set("IFD0:ImageDescription", row.get("caption"))
+    species = get("bird_species_cn")
+    _set_all(_EXIF_TITLE_KEYS, species if species and _str(species).strip() else get("title"))
+
+    for rkey, okeys in _EXIF_MAP:
+        v = get(rkey)
+        if v is None or (isinstance(v, _str) and not v.strip()):
+            continue
+        for k in okeys:
+            out[k] = v
 
     # 对焦状态（列表/主窗口复用 XMP:Country 语义，优先 focus_status）
-    focus = row.get("focus_status")
-    _set("XMP:Country", focus or row.get("country"))
-    _set("XMP-photoshop:Country", focus or row.get("country"))
-    _set("XMP-photoshop:Country-PrimaryLocationName", focus or row.get("country"))
+    focus = get("focus_status")
+    _set_all(_EXIF_COUNTRY_KEYS, focus or get("country"))
 
     # 锐度（列表“锐度值”列）← adj_sharpness；美学评分（列表“美学评分”列）← adj_topiq
-    sharp = row.get("adj_sharpness")
-    if sharp is not None:
-        _set("XMP:City", sharp)
-        _set("XMP-photoshop:City", sharp)
-    else:
-        _set("XMP:City", row.get("city"))
-        _set("XMP-photoshop:City", row.get("city"))
-    topiq = row.get("adj_topiq")
-    if topiq is not None:
-        _set("XMP:State", topiq)
-        _set("XMP-photoshop:State", topiq)
-    else:
-        _set("XMP:State", row.get("state_province"))
-        _set("XMP-photoshop:State", row.get("state_province"))
+    sharp = get("adj_sharpness")
+    _set_all(_EXIF_CITY_KEYS, sharp if sharp is not None else get("city"))
+    topiq = get("adj_topiq")
+    _set_all(_EXIF_STATE_KEYS, topiq if topiq is not None else get("state_province"))
 
     # 颜色标签：红 = is_flying==1，绿 = 精焦（focus_status BEST/精焦）
-    is_flying = row.get("is_flying")
-    focus_str = (row.get("focus_status") or "").strip().upper()
-    if is_flying == 1:
-        _set("XMP-xmp:Label", "Red")
-    elif focus_str in ("BEST", "精焦"):
-        _set("XMP-xmp:Label", "Green")
+    if get("is_flying") == 1:
+        out["XMP-xmp:Label"] = "Red"
+    elif focus in _GREEN_FOCUS_STATUSES or (
+        focus and focus.strip().upper() in _GREEN_FOCUS_STATUSES
+    ):
+        # 库里通常就是规范写法，先精确匹配，避免每行 strip()/upper() 分配新字符串
+        out["XMP-xmp:Label"] = "Green"
 
     # 星级
-    r = row.get("rating")
+    r = get("rating")
     if r is not None:
         try:
-            rv = int(float(str(r)))
+            rv = int(float(_str(r)))
             if rv < 0:
                 out["XMP-xmpDM:pick"] = -1
                 out["XMP-xmpDM:Pick"] = -1
@@ -308,58 +468,16 @@ def report_row_to_exiftool_style(row: Dict[str, Any], source_file: str) -> Dict[
                 out["XMP-xmp:Rating"] = max(0, min(5, rv))
         except (TypeError, ValueError):
             pass
-    pick_value = row.get("pick")
+    pick_value = get("pick")
     if pick_value is not None:
         try:
-            pv = max(-1, min(1, int(float(str(pick_value)))))
+            pv = max(-1, min(1, int(float(_str(pick_value)))))
             if pv != 0:
-                out["XMP-xmpDM:pick"] = pv
-                out["XMP-xmpDM:Pick"] = pv
-                out["XMP-xmp:Pick"] = pv
-                out["XMP:Pick"] = pv
+                for k in _EXIF_PICK_KEYS:
+                    out[k] = pv
         except (TypeError, ValueError):
             pass
 
-    # 相机与镜头
-    _set("IFD0:Model", row.get("camera_model"))
-    _set("ExifIFD:LensModel", row.get("lens_model"))
-    _set("EXIF:Model", row.get("camera_model"))
-    _set("EXIF:LensModel", row.get("lens_model"))
-
-    # 拍摄参数
-    _set("ExifIFD:ISO", row.get("iso"))
-    _set("EXIF:ISO", row.get("iso"))
-    _set("Composite:ShutterSpeed", row.get("shutter_speed"))
-    _set("ExifIFD:ExposureTime", row.get("shutter_speed"))
-    _set("Composite:Aperture", row.get("aperture"))
-    _set("ExifIFD:FNumber", row.get("aperture"))
-    fl = row.get("focal_length")
-    if fl is not None:
-        _set("ExifIFD:FocalLength", fl)
-        _set("EXIF:FocalLength", fl)
-    fl35 = row.get("focal_length_35mm")
-    if fl35 is not None:
-        _set("ExifIFD:FocalLengthIn35mmFormat", fl35)
-        _set("EXIF:FocalLengthIn35mmFormat", fl35)
-
-    # 时间
-    _set("ExifIFD:DateTimeOriginal", row.get("date_time_original"))
-    _set("EXIF:DateTimeOriginal", row.get("date_time_original"))
-
-    # GPS
-    lat = row.get("gps_latitude")
-    lon = row.get("gps_longitude")
-    alt = row.get("gps_altitude")
-    if lat is not None:
-        _set("Composite:GPSLatitude", lat)
-        _set("EXIF:GPSLatitude", lat)
-    if lon is not None:
-        _set("Composite:GPSLongitude", lon)
-        _set("EXIF:GPSLongitude", lon)
-    if alt is not None:
-        _set("Composite:GPSAltitude", alt)
-        _set("EXIF:GPSAltitude", alt)
-
     _log.debug("[report_row_to_exiftool_style] 完成 out_keys=%s", len(out))
     return out
 
@@ -370,8 +488,9 @@ class ReportDB:
     每个照片处理目录拥有一个独立的数据库文件：
         <directory>/.superpicky/report.db
 
-    线程安全：设置 check_same_thread=False，支持工作线程写入。
-    WAL 模式：支持读写并发。
+    线程安全：设置 check_same_thread=False，支持工作线程写入；写入方法与 close() 由 _lock 串行化。
+    WAL 模式：支持读写并发；get_* / count 等查询各自借用只读连接池中的连接，
+    不获取 _lock，也不会被写入阻塞（只读打开或连接池不可用时退回主连接 + _lock）。
     """
 
     DB_FILENAME = "report.db"
@@ -381,6 +500,7 @@ class ReportDB:
         directory: str,
         create_if_missing: bool = True,
         db_path_override: Optional[str] = None,
+        read_only: bool = False,
     ):
         """
         初始化数据库连接。
@@ -389,9 +509,21 @@ class ReportDB:
             directory: 照片目录路径（数据库存储在 .superpicky/ 子目录下）
             create_if_missing: 若 True，确保 .superpicky 存在并创建库；若 False，仅当 report.db 已存在时打开，否则抛出 FileNotFoundError
             db_path_override: 指定现有数据库文件路径；用于兼容非 ``.superpicky`` 布局的只读打开
+            read_only: 只读打开已有库（mode=ro + query_only）：不建表/升级 Schema，写入方法抛 RuntimeError；
+                适合“打开 → 查一次 → 关闭”的场景。隐含 create_if_missing=False。
+                注意 WAL 库的任何读者都会让 SQLite 建出 -wal/-shm 文件；若打开前没有这两个文件，
+                close() 会再用普通连接读一次后关闭，由 SQLite 在最后一个连接关闭时 checkpoint 并删除它们
         """
-        _log.info("[ReportDB.__init__] directory=%r create_if_missing=%s", directory, create_if_missing)
+        _log.info(
+            "[ReportDB.__init__] directory=%r create_if_missing=%s read_only=%s",
+            directory,
+            create_if_missing,
+            read_only,
+        )
+        if read_only:
+            create_if_missing = False
         self.directory = directory
+        self._read_only = read_only
         self._superpicky_dir = os.path.join(directory, ".superpicky")
         self.db_path = os.path.join(self._superpicky_dir, self.DB_FILENAME)
         if db_path_override:
@@ -399,6 +531,18 @@ class ReportDB:
             self._superpicky_dir = os.path.dirname(self.db_path)
         # 同一连接会被主线程和后台线程复用，需要串行化访问避免事务冲突
         self._lock = threading.RLock()
+        self._pending_writes = 0
+        self._commit_timer: Optional[threading.Timer] = None
+        # 只读连接按需创建，归还后复用；打开失败时回退到主连接
+        self._read_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=_READ_POOL_SIZE)
+        self._read_pool_disabled = False
+        # 写入代数：每次写入 +1，鸟种列表/统计缓存据此失效
+        self._write_gen = 0
+        self._species_cache: Dict[bool, tuple] = {}
+        self._stats_cache: Optional[tuple] = None
+        self._has_json_each = False
+        self._writes_since_analyze = 0
+        self._release_sidecars_on_close = False
 
         if create_if_missing:
             # 确保 .superpicky 目录存在并隐藏（Windows 下设置 Hidden 属性）
@@ -409,24 +553,52 @@ class ReportDB:
                     f"ReportDB: database not found: {self.db_path!r} (create_if_missing=False)"
                 )
 
+        if read_only:
+            # 只读实例直接用主连接查询，不再另开连接池
+            self._release_sidecars_on_close = not any(
+                os.path.exists(self.db_path + suffix) for suffix in _WAL_SIDECAR_SUFFIXES
+            )
+            self._conn = _connect_read_only(self.db_path)
+            self._read_pool_disabled = True
+            self._has_json_each = self._probe_json_each()
+            _log.info("[ReportDB.__init__] 只读打开完成 db_path=%r", self.db_path)
+            return
+
         # 连接数据库
         self._conn = sqlite3.connect(
             self.db_path,
             check_same_thread=False,
-            timeout=30.0
+            timeout=30.0,
+            cached_statements=_CACHED_STATEMENTS,
         )
         self._conn.row_factory = sqlite3.Row  # 支持按列名访问
+        # 单条写入复用同一个游标（均在 self._lock 内使用），省去每次 execute 新建游标
+        self._write_cursor = self._conn.cursor()
 
         # 启用 WAL 模式和外键
         self._conn.execute("PRAGMA journal_mode=WAL")
         self._conn.execute("PRAGMA foreign_keys=ON")
-
-        # 初始化 Schema
-        self._init_schema()
+        # WAL 下 synchronous=NORMAL 仍然崩溃安全，只在 checkpoint 时 fsync；
+        # 读多的列表/统计查询用更大的页缓存 + mmap 减少磁盘读，临时表/排序放内存
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        self._conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+
+        # 初始化 Schema：本进程已初始化/升级过同一个库文件且 schema 未变时，跳过整套建表与升级检查
+        schema_key = _schema_ready_key(self.db_path)
+        ready_cookie = _SCHEMA_READY.get(schema_key) if schema_key is not None else None
+        if ready_cookie is not None and ready_cookie == self._schema_cookie():
+            _log.debug("[ReportDB.__init__] Schema 已就绪 跳过初始化")
+            self._has_json_each = self._probe_json_each()
+        else:
+            self._init_schema()
+            if schema_key is not None:
+                _SCHEMA_READY[schema_key] = self._schema_cookie()
         _log.info("[ReportDB.__init__] 完成 db_path=%r", self.db_path)
 
     @classmethod
-    def open_if_exists(cls, directory: str) -> Optional["ReportDB"]:
+    def open_if_exists(cls, directory: str, read_only: bool = False) -> Optional["ReportDB"]:
         """
         仅当目录中已有 report.db 时打开并返回 ReportDB，否则返回 None。
 
@@ -434,17 +606,17 @@ class ReportDB:
         - ``directory/.superpicky/report.db``
         - ``directory/report.db``
 
-        用于只读加载缓存，不会创建目录或数据库文件。
+        不会创建目录或数据库文件。只查询不写入时传 read_only=True，跳过建表/升级等初始化语句。
         """
         db_path = resolve_existing_report_db_path(directory)
         _log.info("[ReportDB.open_if_exists] directory=%r db_path=%r", directory, db_path)
         if not db_path:
             _log.info("[ReportDB.open_if_exists] 文件不存在 返回 None")
             return None
-        return cls.open_db_path_if_exists(db_path)
+        return cls.open_db_path_if_exists(db_path, read_only=read_only)
 
     @classmethod
-    def open_db_path_if_exists(cls, db_path: str) -> Optional["ReportDB"]:
+    def open_db_path_if_exists(cls, db_path: str, read_only: bool = False) -> Optional["ReportDB"]:
         """按明确的数据库文件路径打开已有库，不存在则返回 None。"""
         if not db_path:
             _log.info("[ReportDB.open_db_path_if_exists] 空路径 返回 None")
@@ -460,7 +632,7 @@ class ReportDB:
         else:
             directory = parent_dir
         try:
-            db = cls(directory, create_if_missing=False, db_path_override=norm_path)
+            db = cls(directory, create_if_missing=False, db_path_override=norm_path, read_only=read_only)
             _log.info("[ReportDB.open_db_path_if_exists] 打开成功")
             return db
         except Exception as e:
@@ -499,6 +671,11 @@ class ReportDB:
                     "CREATE INDEX IF NOT EXISTS idx_photos_has_bird "
                     "ON photos(has_bird)"
                 )
+                # 覆盖 get_statistics 用到的列，统计只扫索引不回表
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_photos_flags "
+                    "ON photos(rating, has_bird, is_flying)"
+                )
 
                 # 元数据表
                 self._conn.execute("""
@@ -520,8 +697,39 @@ class ReportDB:
 
         # Schema 升级在独立事务中执行，避免嵌套 commit 冲突
         self._upgrade_schema_if_needed()
+        self._create_filter_indexes()
+        self._has_json_each = self._probe_json_each()
+        self._analyze_if_needed()
         _log.info("[ReportDB._init_schema] END")
 
+    def _create_filter_indexes(self):
+        """get_photos_by_filters 的筛选列与排序表达式索引（需与查询中的表达式完全一致）。
+
+        部分列（如 bird_species_cn/en）由 Schema 升级补齐，须在 _upgrade_schema_if_needed 之后创建。
+        """
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_photos_species_cn "
+                    "ON photos(bird_species_cn)"
+                )
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_photos_species_en "
+                    "ON photos(bird_species_en)"
+                )
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_photos_focus "
+                    "ON photos(focus_status, rating)"
+                )
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_photos_sharp_sort "
+                    f"ON photos({_SHARPNESS_SORT_KEY} DESC, filename)"
+                )
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_photos_aesthetic_sort "
+                    f"ON photos({_AESTHETIC_SORT_KEY} DESC, filename)"
+                )
+
     def _upgrade_schema_if_needed(self):
         """检查并升级数据库 Schema（支持连续升级 v1 -> v2 -> v3 -> v4 -> v5）"""
         _log.debug("[ReportDB._upgrade_schema_if_needed] START")
@@ -637,6 +845,41 @@ class ReportDB:
                 _log.info("[ReportDB._upgrade_schema_if_needed] 已升级到 v5")
         _log.debug("[ReportDB._upgrade_schema_if_needed] END current_version=%s", current_version)
 
+    def _schema_cookie(self) -> int:
+        """数据库头中的 schema 计数器，每次表结构变化都会递增（只读文件头，开销极小）。"""
+        with self._lock:
+            return self._conn.execute("PRAGMA schema_version").fetchone()[0]
+
+    def _probe_json_each(self) -> bool:
+        """当前 SQLite 是否带 JSON1（json_each）；旧版本/裁剪编译时返回 False。进程内只探测一次。"""
+        global _json_each_available
+        if _json_each_available is not None:
+            return _json_each_available
+        with self._lock:
+            try:
+                self._conn.execute("SELECT value FROM json_each('[]')").fetchall()
+                available = True
+            except sqlite3.Error:
+                _log.info("[ReportDB._probe_json_each] json_each 不可用 sqlite=%s", sqlite3.sqlite_version)
+                available = False
+        _json_each_available = available
+        return available
+
+    def _analyze_if_needed(self):
+        """库中还没有统计信息时执行一次 ANALYZE，让查询规划器能选用上面的索引。"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+            ).fetchone()
+            if row:
+                return
+            _log.info("[ReportDB._analyze_if_needed] ANALYZE")
+            try:
+                self._conn.execute("ANALYZE")
+                self._safe_commit()
+            except sqlite3.Error as e:
+                _log.warning("[ReportDB._analyze_if_needed] ANALYZE 失败: %s", e)
+
     def _update_schema_version(self, version):
         """更新数据库中的版本号（由调用方负责提交事务）"""
         _log.debug("[ReportDB._update_schema_version] version=%s", version)
@@ -662,38 +905,23 @@ class ReportDB:
         """
         filename = data.get("filename", "")
         _log.info("[ReportDB.insert_photo] filename=%r", filename)
-        cleaned = self._clean_data(data)
-        now = _now_iso()
-        cleaned.setdefault("created_at", now)
-        cleaned["updated_at"] = now
-
-        # 仅保留合法列
-        columns = [k for k in cleaned if k in COLUMN_NAMES]
-        values = [cleaned[k] for k in columns]
-
-        placeholders = ", ".join(["?"] * len(columns))
-        col_str = ", ".join(columns)
-
-        # INSERT OR REPLACE
-        update_clause = ", ".join(
-            f"{c} = excluded.{c}" for c in columns if c != "filename"
-        )
-
-        sql = (
-            f"INSERT INTO photos ({col_str}) VALUES ({placeholders}) "
-            f"ON CONFLICT(filename) DO UPDATE SET {update_clause}"
-        )
+        self._check_writable()
+        # 与批量路径共用按列清洗：直接得到 (列名, 值元组)，不再中转 dict；已丢弃非法列
+        columns, rows = _clean_column_run(tuple(data), [data], _now_iso())
 
         with self._lock:
-            self._conn.execute(sql, values)
-            self._safe_commit()
+            self._write_cursor.execute(_build_upsert_sql(columns), rows[0])
+            self._write_gen += 1
+            self._defer_commit()
         _log.info("[ReportDB.insert_photo] 完成 filename=%r", filename)
 
     def insert_photos_batch(self, photos: List[dict]) -> int:
         """
         批量插入或更新照片记录。
 
-        使用事务包裹，性能优于逐条插入。
+        使用事务包裹，性能优于逐条插入。相邻且列集合相同的记录合并为一次
+        executemany，SQL 只编译一次；仍只写入每条记录自带的列，不会用默认值
+        覆盖已有数据，且保持输入顺序。
 
         Args:
             photos: 照片数据字典列表
@@ -702,39 +930,73 @@ class ReportDB:
             成功插入/更新的记录数
         """
         _log.info("[ReportDB.insert_photos_batch] photos_count=%s", len(photos))
+        self._check_writable()
         if not photos:
             _log.info("[ReportDB.insert_photos_batch] 空列表 返回 0")
             return 0
 
-        now = _now_iso()
-        count = 0
+        groups = self._clean_batch(photos, _now_iso())
+        count = len(photos)
 
         with self._lock:
-            with self._conn:
-                for data in photos:
-                    cleaned = self._clean_data(data)
-                    cleaned.setdefault("created_at", now)
-                    cleaned["updated_at"] = now
+            self._write_gen += 1
+            with self._write_transaction():
+                for columns, rows in groups:
+                    self._conn.executemany(_build_upsert_sql(columns), rows)
+            self._count_writes(count)
 
-                    columns = [k for k in cleaned if k in COLUMN_NAMES]
-                    values = [cleaned[k] for k in columns]
+        _log.info("[ReportDB.insert_photos_batch] 完成 count=%s", count)
+        return count
+
+    def bulk_insert_arrow(self, table: Any) -> int:
+        """
+        从 pyarrow.Table 批量插入或更新照片记录（可选依赖 pyarrow，调用时才导入）。
 
-                    placeholders = ", ".join(["?"] * len(columns))
-                    col_str = ", ".join(columns)
+        按列处理：已是目标数值类型的列直接取值，其余列套用与 insert_photos_batch
+        相同的清洗函数，结果与逐行写入一致；只写入表中存在的合法列。
 
-                    update_clause = ", ".join(
-                        f"{c} = excluded.{c}" for c in columns if c != "filename"
-                    )
+        Args:
+            table: pyarrow.Table，列名即 photos 表列名，必须包含 filename
 
-                    sql = (
-                        f"INSERT INTO photos ({col_str}) VALUES ({placeholders}) "
-                        f"ON CONFLICT(filename) DO UPDATE SET {update_clause}"
-                    )
+        Returns:
+            成功插入/更新的记录数
+        """
+        import pyarrow as pa
+
+        count = table.num_rows
+        _log.info("[ReportDB.bulk_insert_arrow] rows=%s", count)
+        self._check_writable()
+        if "filename" not in table.column_names:
+            raise ValueError("bulk_insert_arrow: table 缺少 filename 列")
+        if not count:
+            return 0
 
-                    self._conn.execute(sql, values)
-                    count += 1
+        now = _now_iso()
+        columns: List[str] = []
+        values: List[list] = []
+        for index, name in enumerate(table.column_names):
+            if name not in _COLUMN_CLEANERS or name in columns or name == "updated_at":
+                continue
+            col = table.column(index)
+            data = col.to_pylist()
+            if not _arrow_type_is_clean(pa, name, col.type):
+                data = list(map(_COLUMN_CLEANERS[name], data))
+            columns.append(name)
+            values.append(data)
+        if "created_at" not in columns:
+            columns.append("created_at")
+            values.append([now] * count)
+        columns.append("updated_at")
+        values.append([now] * count)
+        sql = _build_upsert_sql(tuple(columns))
 
-        _log.info("[ReportDB.insert_photos_batch] 完成 count=%s", count)
+        with self._lock:
+            self._write_gen += 1
+            with self._write_transaction():
+                self._conn.executemany(sql, zip(*values))
+            self._count_writes(count)
+
+        _log.info("[ReportDB.bulk_insert_arrow] 完成 count=%s", count)
         return count
 
     # ==========================================================================
@@ -752,62 +1014,69 @@ class ReportDB:
             照片数据字典，未找到返回 None
         """
         _log.debug("[ReportDB.get_photo] filename=%r", filename)
-        with self._lock:
-            cursor = self._conn.execute(
-                "SELECT * FROM photos WHERE filename = ?", (filename,)
-            )
+        with self._read_conn() as conn:
+            cursor = conn.execute(SQL_GET_PHOTO, (filename,))
             row = cursor.fetchone()
             result = dict(row) if row else None
         _log.debug("[ReportDB.get_photo] 完成 found=%s", result is not None)
         return result
 
-    def get_all_photos(self) -> List[dict]:
+    def get_all_photos(
+        self, as_dict: bool = True, columns: Optional[Sequence[str]] = None
+    ) -> List[Any]:
         """
         获取所有照片记录。
 
+        Args:
+            as_dict: False 时直接返回 sqlite3.Row（支持 row["列名"]），省去逐行建 dict
+            columns: 只查询这些列（如 LIST_COLUMNS）；None 为全部列
+
         Returns:
             照片数据字典列表
         """
         _log.debug("[ReportDB.get_all_photos]")
-        with self._lock:
-            cursor = self._conn.execute("SELECT * FROM photos ORDER BY filename")
-            rows = [dict(row) for row in cursor.fetchall()]
+        with self._read_conn() as conn:
+            cursor = conn.execute(f"SELECT {_select_list(columns)} FROM photos ORDER BY filename")
+            rows = _fetch_rows(cursor, as_dict)
         _log.debug("[ReportDB.get_all_photos] 完成 count=%s", len(rows))
         return rows
 
-    def get_bird_photos(self) -> List[dict]:
+    def get_bird_photos(
+        self, as_dict: bool = True, columns: Optional[Sequence[str]] = None
+    ) -> List[Any]:
         """
         获取所有有鸟的照片记录（has_bird=1）。
 
+        Args:
+            as_dict / columns: 同 get_all_photos
+
         Returns:
             有鸟照片数据字典列表
         """
         _log.debug("[ReportDB.get_bird_photos]")
-        with self._lock:
-            cursor = self._conn.execute(
-                "SELECT * FROM photos WHERE has_bird = 1 ORDER BY filename"
+        with self._read_conn() as conn:
+            cursor = conn.execute(
+                f"SELECT {_select_list(columns)} FROM photos WHERE has_bird = 1 ORDER BY filename"
             )
-            rows = [dict(row) for row in cursor.fetchall()]
+            rows = _fetch_rows(cursor, as_dict)
         _log.debug("[ReportDB.get_bird_photos] 完成 count=%s", len(rows))
         return rows
 
-    def get_photos_by_rating(self, rating: int) -> List[dict]:
+    def get_photos_by_rating(self, rating: int, as_dict: bool = True) -> List[Any]:
         """
         按评分查询照片。
 
         Args:
             rating: 评分 (-1/0/1/2/3)
+            as_dict: 同 get_all_photos
 
         Returns:
             照片数据字典列表
         """
         _log.debug("[ReportDB.get_photos_by_rating] rating=%s", rating)
-        with self._lock:
-            cursor = self._conn.execute(
-                "SELECT * FROM photos WHERE rating = ? ORDER BY filename",
-                (rating,)
-            )
-            rows = [dict(row) for row in cursor.fetchall()]
+        with self._read_conn() as conn:
+            cursor = conn.execute(SQL_GET_BY_RATING, (rating,))
+            rows = _fetch_rows(cursor, as_dict)
         _log.debug("[ReportDB.get_photos_by_rating] 完成 count=%s", len(rows))
         return rows
 
@@ -826,8 +1095,14 @@ class ReportDB:
         assert column in {"bird_species_en", "bird_species_cn"}, f"Invalid column: {column}"
         order_clause = f"{column} COLLATE NOCASE" if use_en else column
 
-        with self._lock:
-            cursor = self._conn.execute(
+        token = self._cache_token()
+        cached = self._species_cache.get(use_en)
+        if cached is not None and cached[0] == token:
+            _log.debug("[ReportDB.get_distinct_species] 命中缓存 count=%s", len(cached[1]))
+            return list(cached[1])
+
+        with self._read_conn() as conn:
+            cursor = conn.execute(
                 f"""
                 SELECT DISTINCT {column}
                 FROM photos
@@ -837,10 +1112,16 @@ class ReportDB:
                 """
             )
             species_list = [row[0] for row in cursor.fetchall()]
+        self._species_cache[use_en] = (token, species_list)
         _log.debug("[ReportDB.get_distinct_species] 完成 count=%s", len(species_list))
-        return species_list
+        return list(species_list)
 
-    def get_photos_by_filters(self, filters: Optional[dict] = None) -> List[dict]:
+    def get_photos_by_filters(
+        self,
+        filters: Optional[dict] = None,
+        as_dict: bool = True,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
         """
         按结果浏览器筛选条件查询照片。
 
@@ -850,6 +1131,8 @@ class ReportDB:
             - is_flying: List[int]
             - bird_species_cn / bird_species_en: str
             - sort_by: filename | sharpness_desc | aesthetic_desc
+
+        as_dict / columns 同 get_all_photos。
         """
         _log.debug("[ReportDB.get_photos_by_filters] filters=%s", filters)
         filters = filters or {}
@@ -861,25 +1144,19 @@ class ReportDB:
         if isinstance(ratings, list):
             if not ratings:
                 return []
-            placeholders = ", ".join(["?"] * len(ratings))
-            where_clauses.append(f"rating IN ({placeholders})")
-            params.extend(ratings)
+            where_clauses.append(self._in_clause("rating", ratings, params))
 
         focus_statuses = filters.get("focus_statuses")
         if isinstance(focus_statuses, list):
             if not focus_statuses:
                 return []
-            placeholders = ", ".join(["?"] * len(focus_statuses))
-            where_clauses.append(f"focus_status IN ({placeholders})")
-            params.extend(focus_statuses)
+            where_clauses.append(self._in_clause("focus_status", focus_statuses, params))
 
         is_flying = filters.get("is_flying")
         if isinstance(is_flying, list):
             if not is_flying:
                 return []
-            placeholders = ", ".join(["?"] * len(is_flying))
-            where_clauses.append(f"is_flying IN ({placeholders})")
-            params.extend(is_flying)
+            where_clauses.append(self._in_clause("is_flying", is_flying, params))
 
         species_col = None
         species_val = None
@@ -901,17 +1178,17 @@ class ReportDB:
 
         sort_by = filters.get("sort_by") or "filename"
         if sort_by == "sharpness_desc":
-            order_sql = "ORDER BY COALESCE(adj_sharpness, head_sharp, -1e99) DESC, filename ASC"
+            order_sql = f"ORDER BY {_SHARPNESS_SORT_KEY} DESC, filename ASC"
         elif sort_by == "aesthetic_desc":
-            order_sql = "ORDER BY COALESCE(adj_topiq, nima_score, -1e99) DESC, filename ASC"
+            order_sql = f"ORDER BY {_AESTHETIC_SORT_KEY} DESC, filename ASC"
         else:
             order_sql = "ORDER BY filename ASC"
 
-        sql = f"SELECT * FROM photos {where_sql} {order_sql}"
+        sql = f"SELECT {_select_list(columns)} FROM photos {where_sql} {order_sql}"
 
-        with self._lock:
-            cursor = self._conn.execute(sql, params)
-            rows = [dict(row) for row in cursor.fetchall()]
+        with self._read_conn() as conn:
+            cursor = conn.execute(sql, params)
+            rows = _fetch_rows(cursor, as_dict)
         _log.debug("[ReportDB.get_photos_by_filters] 完成 count=%s", len(rows))
         return rows
 
@@ -929,39 +1206,30 @@ class ReportDB:
             }
         """
         _log.debug("[ReportDB.get_statistics]")
-        stats = {}
-
-        with self._lock:
-            # 总数
-            row = self._conn.execute("SELECT COUNT(*) FROM photos").fetchone()
-            stats["total"] = row[0]
+        token = self._cache_token()
+        cached = self._stats_cache
+        if cached is not None and cached[0] == token:
+            _log.debug("[ReportDB.get_statistics] 命中缓存")
+            return _copy_stats(cached[1])
 
-            # 有鸟数
-            row = self._conn.execute(
-                "SELECT COUNT(*) FROM photos WHERE has_bird = 1"
-            ).fetchone()
-            stats["has_bird"] = row[0]
-
-            # 飞行数
-            row = self._conn.execute(
-                "SELECT COUNT(*) FROM photos WHERE is_flying = 1"
-            ).fetchone()
-            stats["flying"] = row[0]
+        stats = {}
+        with self._read_conn() as conn:
+            groups = conn.execute(SQL_STATISTICS).fetchall()
 
-            # 按评分统计
-            cursor = self._conn.execute(
-                "SELECT rating, COUNT(*) as cnt FROM photos GROUP BY rating ORDER BY rating"
-            )
-            stats["by_rating"] = {row[0]: row[1] for row in cursor.fetchall()}
+        stats["total"] = sum(row[1] for row in groups)
+        stats["has_bird"] = sum(row[2] for row in groups)
+        stats["flying"] = sum(row[3] for row in groups)
+        stats["by_rating"] = {row[0]: row[1] for row in groups}
+        self._stats_cache = (token, stats)
 
         _log.debug("[ReportDB.get_statistics] 完成 total=%s", stats.get("total"))
-        return stats
+        return _copy_stats(stats)
 
     def count(self) -> int:
         """返回总记录数。"""
         _log.debug("[ReportDB.count]")
-        with self._lock:
-            row = self._conn.execute("SELECT COUNT(*) FROM photos").fetchone()
+        with self._read_conn() as conn:
+            row = conn.execute(SQL_COUNT).fetchone()
             n = row[0]
         _log.debug("[ReportDB.count] 完成 n=%s", n)
         return n
@@ -987,24 +1255,24 @@ class ReportDB:
             是否成功更新
         """
         _log.info("[ReportDB.update_photo] filename=%r", filename)
+        self._check_writable()
         cleaned = self._clean_data(data)
         cleaned["updated_at"] = _now_iso()
 
-        # 仅保留合法列，排除 filename 和 id
-        columns = [k for k in cleaned if k in COLUMN_NAMES and k not in ("filename", "id")]
+        # 仅保留可更新列，排除 filename
+        columns = tuple(k for k in cleaned if k in _UPDATABLE_COLUMNS)
         if not columns:
             _log.info("[ReportDB.update_photo] 无有效列 返回 False")
             return False
 
         values = [cleaned[k] for k in columns]
-        set_clause = ", ".join(f"{c} = ?" for c in columns)
-
-        sql = f"UPDATE photos SET {set_clause} WHERE filename = ?"
+        sql = _build_update_sql(columns)
         values.append(filename)
 
         with self._lock:
-            cursor = self._conn.execute(sql, values)
-            self._safe_commit()
+            cursor = self._write_cursor.execute(sql, values)
+            self._write_gen += 1
+            self._defer_commit()
             updated = cursor.rowcount > 0
         _log.info("[ReportDB.update_photo] 完成 filename=%r updated=%s", filename, updated)
         return updated
@@ -1023,35 +1291,36 @@ class ReportDB:
             成功更新的记录数
         """
         _log.info("[ReportDB.update_ratings_batch] updates_count=%s", len(updates))
+        self._check_writable()
         if not updates:
             return 0
 
         now = _now_iso()
         count = 0
+        updatable = _UPDATABLE_COLUMNS
 
         with self._lock:
-            with self._conn:
+            self._write_gen += 1
+            with self._write_transaction():
                 for upd in updates:
                     filename = upd.get("filename")
                     if not filename:
                         continue
 
-                    cleaned = self._clean_data(upd)
+                    cleaned = _clean_row(upd)
                     cleaned["updated_at"] = now
 
-                    columns = [k for k in cleaned if k in COLUMN_NAMES and k not in ("filename", "id")]
+                    columns = tuple(k for k in cleaned if k in updatable)
                     if not columns:
                         continue
 
                     values = [cleaned[k] for k in columns]
-                    set_clause = ", ".join(f"{c} = ?" for c in columns)
-
-                    sql = f"UPDATE photos SET {set_clause} WHERE filename = ?"
                     values.append(filename)
 
-                    cursor = self._conn.execute(sql, values)
+                    cursor = self._write_cursor.execute(_build_update_sql(columns), values)
                     if cursor.rowcount > 0:
                         count += 1
+            self._count_writes(count)
 
         _log.info("[ReportDB.update_ratings_batch] 完成 count=%s", count)
         return count
@@ -1059,12 +1328,16 @@ class ReportDB:
     def clear_cache_paths(self) -> int:
         """清空缓存相关路径字段（临时 JPG、调试裁切、YOLO 调试图）。"""
         _log.info("[ReportDB.clear_cache_paths]")
+        self._check_writable()
         with self._lock:
+            self._write_gen += 1
             cursor = self._conn.execute(
                 "UPDATE photos SET debug_crop_path = NULL, temp_jpeg_path = NULL, yolo_debug_path = NULL"
             )
             self._safe_commit()
             n = cursor.rowcount
+        # 临时 JPG 路径已清空，之前解析到的预览路径可能随缓存文件一起被删除
+        clear_preview_cache()
         _log.info("[ReportDB.clear_cache_paths] 完成 rowcount=%s", n)
         return n
 
@@ -1075,10 +1348,8 @@ class ReportDB:
     def get_meta(self, key: str) -> Optional[str]:
         """获取元数据值。"""
         _log.debug("[ReportDB.get_meta] key=%r", key)
-        with self._lock:
-            cursor = self._conn.execute(
-                "SELECT value FROM meta WHERE key = ?", (key,)
-            )
+        with self._read_conn() as conn:
+            cursor = conn.execute(SQL_GET_META, (key,))
             row = cursor.fetchone()
             result = row[0] if row else None
         _log.debug("[ReportDB.get_meta] 完成 key=%r has_value=%s", key, result is not None)
@@ -1087,35 +1358,35 @@ class ReportDB:
     def set_meta(self, key: str, value: str) -> None:
         """设置元数据值。"""
         _log.debug("[ReportDB.set_meta] key=%r", key)
+        self._check_writable()
         with self._lock:
-            self._conn.execute(
-                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
-                (key, value)
-            )
-            self._safe_commit()
+            self._write_cursor.execute(SQL_SET_META, (key, value))
+            self._write_gen += 1
+            self._defer_commit()
         _log.debug("[ReportDB.set_meta] 完成")
 
     # ==========================================================================
     #  同步预留
     # ==========================================================================
 
-    def get_updated_since(self, since: str) -> List[dict]:
+    def get_updated_since(self, since: str, as_dict: bool = True) -> List[Any]:
         """
         获取指定时间之后更新的记录（增量同步用）。
 
         Args:
             since: ISO 8601 时间字符串
+            as_dict: 同 get_all_photos
 
         Returns:
             更新记录列表
         """
         _log.debug("[ReportDB.get_updated_since] since=%r", since)
-        with self._lock:
-            cursor = self._conn.execute(
+        with self._read_conn() as conn:
+            cursor = conn.execute(
                 "SELECT * FROM photos WHERE updated_at > ? ORDER BY updated_at",
                 (since,)
             )
-            rows = [dict(row) for row in cursor.fetchall()]
+            rows = _fetch_rows(cursor, as_dict)
         _log.debug("[ReportDB.get_updated_since] 完成 count=%s", len(rows))
         return rows
 
@@ -1123,13 +1394,30 @@ class ReportDB:
     #  连接管理
     # ==========================================================================
 
+    def flush(self) -> None:
+        """立即提交 insert_photo/update_photo/set_meta 累积的未提交写入。"""
+        with self._lock:
+            self._commit_pending()
+
     def close(self) -> None:
-        """关闭数据库连接。"""
+        """关闭数据库连接（先提交未提交的写入）。"""
         _log.info("[ReportDB.close] db_path=%r", getattr(self, "db_path", None))
         with self._lock:
+            if self._conn and self._read_only:
+                self._conn.close()
+                self._conn = None
+                if self._release_sidecars_on_close:
+                    _release_wal_sidecars(self.db_path)
             if self._conn:
+                self._commit_pending()
+                try:
+                    # SQLite 建议在关闭连接前执行，按需刷新统计信息（通常很快或什么都不做）
+                    self._conn.execute("PRAGMA optimize")
+                except sqlite3.Error as e:
+                    _log.debug("[ReportDB.close] PRAGMA optimize 失败: %s", e)
                 self._conn.close()
                 self._conn = None
+        self._close_read_pool()
         _log.info("[ReportDB.close] 完成")
 
     def __enter__(self):
@@ -1145,6 +1433,161 @@ class ReportDB:
     #  内部方法
     # ==========================================================================
 
+    def _in_clause(self, column: str, values: list, params: List[Any]) -> str:
+        """生成 column IN (...) 条件并把参数追加到 params；长列表用 json_each 只绑定一个参数。"""
+        if self._has_json_each and len(values) >= _JSON_IN_MIN_VALUES:
+            try:
+                encoded = json.dumps(values)
+            except (TypeError, ValueError):
+                encoded = None
+            if encoded is not None:
+                params.append(encoded)
+                return f"{column} IN (SELECT value FROM json_each(?))"
+        params.extend(values)
+        return f"{column} IN ({', '.join(['?'] * len(values))})"
+
+    def _cache_token(self) -> tuple:
+        """
+        查询缓存的有效性标记：(本实例写入代数, PRAGMA data_version)。
+
+        data_version 在其他连接/进程提交后变化，覆盖外部程序写同一个 report.db 的情况。
+        """
+        with self._lock:
+            if self._conn is None:
+                raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+            data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            return (self._write_gen, data_version)
+
+    def _check_writable(self) -> None:
+        if self._read_only:
+            raise RuntimeError(f"ReportDB: opened read-only: {self.db_path!r}")
+
+    def _open_read_conn(self) -> Optional[sqlite3.Connection]:
+        """打开一条只读连接（mode=ro + query_only），失败返回 None。"""
+        try:
+            conn = _connect_read_only(self.db_path)
+        except sqlite3.Error as e:
+            _log.warning("[ReportDB._open_read_conn] 只读连接打开失败 回退主连接: %s", e)
+            self._read_pool_disabled = True
+            return None
+        return conn
+
+    @contextmanager
+    def _read_conn(self):
+        """借出一条只读连接；池不可用时在 _lock 下借用主连接。"""
+        if self._conn is None:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        # 只读连接看不到主连接上尚未提交的写入，先提交以保证读到自己的写入
+        if self._pending_writes:
+            self.flush()
+        conn = None
+        if not self._read_pool_disabled:
+            try:
+                conn = self._read_pool.get_nowait()
+            except queue.Empty:
+                conn = self._open_read_conn()
+        if conn is None:
+            with self._lock:
+                if self._conn is None:
+                    raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+                yield self._conn
+            return
+        try:
+            yield conn
+        finally:
+            self._release_read_conn(conn)
+
+    def _release_read_conn(self, conn: sqlite3.Connection) -> None:
+        if self._conn is not None:
+            try:
+                self._read_pool.put_nowait(conn)
+                return
+            except queue.Full:
+                pass
+        conn.close()
+
+    def _close_read_pool(self) -> None:
+        while True:
+            try:
+                conn = self._read_pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+
+    @contextmanager
+    def _write_transaction(self):
+        """
+        批量写入用的显式事务（调用方持有 _lock）。
+
+        先提交累积的单行写入，再 BEGIN IMMEDIATE 一开始就拿到写锁：WAL 下延迟事务
+        读后升级写锁遇到并发写入会直接 SQLITE_BUSY，IMMEDIATE 则按 timeout 等待。
+        正常结束提交一次，异常时回滚。
+        """
+        self._commit_pending()
+        self._safe_commit()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.rollback()
+            raise
+        self._conn.commit()
+
+    def _count_writes(self, n: int) -> None:
+        """累计写入行数，超过阈值时在后台线程执行 ANALYZE（调用方持有 _lock）。"""
+        self._writes_since_analyze += n
+        if self._writes_since_analyze < _ANALYZE_EVERY_WRITES:
+            return
+        self._writes_since_analyze = 0
+        threading.Thread(
+            target=self._analyze_in_background,
+            name="ReportDB-analyze",
+            daemon=True,
+        ).start()
+
+    def _analyze_in_background(self) -> None:
+        """用独立连接执行 ANALYZE，不占用主连接和 _lock。"""
+        _log.info("[ReportDB._analyze_in_background] START db_path=%r", self.db_path)
+        try:
+            conn = sqlite3.connect(self.db_path, timeout=30.0)
+            try:
+                conn.execute("ANALYZE")
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            _log.warning("[ReportDB._analyze_in_background] ANALYZE 失败: %s", e)
+            return
+        _log.info("[ReportDB._analyze_in_background] END")
+
+    def _defer_commit(self) -> None:
+        """记录一次单行写入；攒够一批立即提交，否则由定时器稍后提交（调用方持有 _lock）。"""
+        self._pending_writes += 1
+        self._count_writes(1)
+        if self._pending_writes >= _COMMIT_BATCH_SIZE:
+            self._commit_pending()
+            return
+        if self._commit_timer is None:
+            timer = threading.Timer(_COMMIT_DELAY_S, self.flush)
+            timer.daemon = True
+            self._commit_timer = timer
+            _DBS_WITH_PENDING_WRITES.add(self)
+            timer.start()
+
+    def _commit_pending(self) -> None:
+        """提交累积写入并取消定时器（调用方持有 _lock）。"""
+        timer = self._commit_timer
+        self._commit_timer = None
+        if timer is not None:
+            timer.cancel()
+        if self._pending_writes and self._conn is not None:
+            # 直接 commit，提交前不记日志：退出阶段日志输出可能已不可用，不能挡在提交前面。
+            # 提交失败时保留计数和登记，进程退出时还会再尝试一次
+            if self._conn.in_transaction:
+                self._conn.commit()
+            self._pending_writes = 0
+        _DBS_WITH_PENDING_WRITES.discard(self)
+
     def _safe_commit(self) -> None:
         """仅在存在活动事务时提交，兼容 autocommit 场景。"""
         _log.debug("[ReportDB._safe_commit]")
@@ -1171,60 +1614,265 @@ class ReportDB:
         - 数值字符串 → 对应的 float/int
         """
         _log.debug("[ReportDB._clean_data] input_keys=%s", len(data) if data else 0)
-        cleaned = {}
-        for key, value in data.items():
-            # 跳过非法列名
-            if key not in COLUMN_NAMES:
-                continue
+        cleaned = _clean_row(data)
+        _log.debug("[ReportDB._clean_data] 完成 output_keys=%s", len(cleaned))
+        return cleaned
 
-            # 布尔/yes-no 字段（优先处理，"-"/None/空 → 0）
-            if key in ("has_bird", "is_flying"):
-                if value is None or value == "-" or value == "":
-                    cleaned[key] = 0
-                elif isinstance(value, str):
-                    cleaned[key] = 1 if value.lower() in ("yes", "1", "true") else 0
-                else:
-                    cleaned[key] = 1 if value else 0
-                continue
+    @staticmethod
+    def _clean_batch(photos: List[dict], now: str) -> List[tuple]:
+        """
+        清洗整批记录，并按列集合切分成连续分组 [(columns, [values, ...]), ...]。
 
-            # 处理 None 和占位符
-            if value is None or value == "-" or value == "":
-                cleaned[key] = None
-                continue
+        与逐条 _clean_data 结果一致，但按列处理：相邻且键相同的记录先转置成列，
+        每列用 map() 套同一个转换函数，再 zip 回行元组，省去逐行建 dict 和逐格查表。
+        """
+        groups: List[tuple] = []
+        start = 0
+        n = len(photos)
+        while start < n:
+            keys = tuple(photos[start])
+            end = start + 1
+            while end < n and tuple(photos[end]) == keys:
+                end += 1
+            columns, rows = _clean_column_run(keys, photos[start:end], now)
+            if groups and groups[-1][0] == columns:
+                groups[-1][1].extend(rows)
+            else:
+                groups.append((columns, rows))
+            start = end
+        return groups
+
+# 列清洗规则（与 _clean_data 文档一致），按列名预先绑定转换函数
+_FLAG_COLUMNS = frozenset(("has_bird", "is_flying"))
+_FLAG_TRUE_STRINGS = frozenset(("yes", "1", "true"))
+_FLOAT_COLUMNS = frozenset((
+    "confidence", "head_sharp", "left_eye", "right_eye",
+    "beak", "nima_score", "flight_conf", "focus_x",
+    "focus_y", "adj_sharpness", "adj_topiq",
+    # V2: 新增数值字段
+    "focal_length", "gps_latitude", "gps_longitude",
+    "gps_altitude", "birdid_confidence",
+))
+_INT_COLUMNS = frozenset(("rating", "pick", "iso", "focal_length_35mm"))
+_INT_ZERO_DEFAULT_COLUMNS = frozenset(("rating", "pick"))
+
+
+def _clean_flag(value: Any) -> int:
+    # 布尔/yes-no 字段："-"/None/空 → 0；已是 int/bool 时直接判真假
+    if type(value) is int or type(value) is bool:
+        return 1 if value else 0
+    if value is None or value == "-" or value == "":
+        return 0
+    if isinstance(value, str):
+        return 1 if value.lower() in _FLAG_TRUE_STRINGS else 0
+    return 1 if value else 0
+
+
+if _fn_try_float is not None:
+    def _parse_float(value: Any) -> Optional[float]:
+        # 与 float() 接受的输入一致（含下划线分隔），失败/类型不符返回 None，不走异常路径
+        return _fn_try_float(value, on_fail=None, on_type_error=None, allow_underscores=True)
+else:
+    def _parse_float(value: Any) -> Optional[float]:
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return None
 
-            # 数值字段
-            if key in ("confidence", "head_sharp", "left_eye", "right_eye",
-                        "beak", "nima_score", "flight_conf", "focus_x",
-                        "focus_y", "adj_sharpness", "adj_topiq",
-                        # V2: 新增数值字段
-                        "focal_length", "gps_latitude", "gps_longitude",
-                        "gps_altitude", "birdid_confidence"):
-                try:
-                    cleaned[key] = float(value)
-                except (ValueError, TypeError):
-                    cleaned[key] = None
-                continue
 
-            # 整数字段
-            if key in ("rating", "pick", "iso", "focal_length_35mm"):
-                try:
-                    cleaned[key] = int(float(value))
-                except (ValueError, TypeError):
-                    cleaned[key] = 0 if key in ("rating", "pick") else None
-                continue
+def _clean_float(value: Any) -> Optional[float]:
+    # 已清洗过的数据（如导出后重新导入）直接返回，省去 float() 往返和占位符比较
+    if type(value) is float:
+        return value
+    if value is None or value == "-" or value == "":
+        return None
+    return _parse_float(value)
 
-            # 文本字段直接使用（包括 V2 新增的文本字段）
-            # shutter_speed, aperture, camera_model, lens_model,
-            # title, caption, city, state_province, country,
-            # date_time_original, bird_species_cn, bird_species_en, exposure_status
-            cleaned[key] = value
 
-        _log.debug("[ReportDB._clean_data] 完成 output_keys=%s", len(cleaned))
-        return cleaned
+def _clean_int(value: Any) -> Optional[int]:
+    if type(value) is int:
+        return value
+    if value is None or value == "-" or value == "":
+        return None
+    f = _parse_float(value)
+    if f is None:
+        return None
+    try:
+        return int(f)
+    except ValueError:  # NaN
+        return None
+
+
+def _clean_int_or_zero(value: Any) -> Optional[int]:
+    if type(value) is int:
+        return value
+    if value is None or value == "-" or value == "":
+        return None
+    f = _parse_float(value)
+    if f is None:
+        return 0
+    try:
+        return int(f)
+    except ValueError:  # NaN
+        return 0
+
+
+def _clean_text(value: Any) -> Any:
+    # 文本字段直接使用，仅把占位符转成 None
+    if value is None or value == "-" or value == "":
+        return None
+    return value
+
+
+_COLUMN_CLEANERS: Dict[str, Any] = {name: _clean_text for name in ALL_COLS}
+_COLUMN_CLEANERS.update((name, _clean_flag) for name in _FLAG_COLUMNS)
+_COLUMN_CLEANERS.update((name, _clean_float) for name in _FLOAT_COLUMNS)
+_COLUMN_CLEANERS.update((name, _clean_int) for name in _INT_COLUMNS)
+_COLUMN_CLEANERS.update((name, _clean_int_or_zero) for name in _INT_ZERO_DEFAULT_COLUMNS)
+
+
+def _arrow_type_is_clean(pa: Any, name: str, arrow_type: Any) -> bool:
+    """Arrow 列已是目标数值类型时，to_pylist() 的结果与清洗后一致，可跳过逐格清洗。"""
+    if name in _FLOAT_COLUMNS:
+        return pa.types.is_floating(arrow_type)
+    if name in _INT_COLUMNS:
+        return pa.types.is_integer(arrow_type)
+    return False
+
+
+def _clean_column_run(keys: tuple, rows: List[dict], now: str) -> tuple:
+    """清洗一段键完全相同的记录；返回 (columns, [values, ...])，列顺序与 _clean_data + 时间戳一致。"""
+    cleaners = _COLUMN_CLEANERS
+    columns = [k for k in keys if k in cleaners]
+    if columns:
+        if len(columns) == 1:
+            key = columns[0]
+            raw_columns = [[d[key] for d in rows]]
+        else:
+            getter = operator.itemgetter(*columns)
+            raw_columns = list(zip(*map(getter, rows)))
+        cleaned_columns = [list(map(cleaners[k], col)) for k, col in zip(columns, raw_columns)]
+    else:
+        cleaned_columns = []
+    count = len(rows)
+    if "created_at" not in columns:
+        columns.append("created_at")
+        cleaned_columns.append([now] * count)
+    if "updated_at" in columns:
+        cleaned_columns[columns.index("updated_at")] = [now] * count
+    else:
+        columns.append("updated_at")
+        cleaned_columns.append([now] * count)
+    return tuple(columns), list(zip(*cleaned_columns))
+
+
+def _clean_row(data: dict) -> dict:
+    """按列清洗一条记录并丢弃非法列名（不记日志，供批量路径使用）。"""
+    cleaners = _COLUMN_CLEANERS
+    return {key: cleaners[key](value) for key, value in data.items() if key in cleaners}
+
+
+@functools.lru_cache(maxsize=256)
+def _build_upsert_sql(columns: tuple) -> str:
+    """按给定列生成 INSERT ... ON CONFLICT(filename) DO UPDATE 语句（只更新这些列）。"""
+    placeholders = ", ".join(["?"] * len(columns))
+    col_str = ", ".join(columns)
+    update_clause = ", ".join(
+        f"{c} = excluded.{c}" for c in columns if c != "filename"
+    )
+    return (
+        f"INSERT INTO photos ({col_str}) VALUES ({placeholders}) "
+        f"ON CONFLICT(filename) DO UPDATE SET {update_clause}"
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _build_update_sql(columns: tuple) -> str:
+    """按给定列生成 UPDATE photos SET ... WHERE filename = ? 语句。"""
+    set_clause = ", ".join(f"{c} = ?" for c in columns)
+    return f"UPDATE photos SET {set_clause} WHERE filename = ?"
+
+
+def _connect_read_only(db_path: str) -> sqlite3.Connection:
+    """以 mode=ro + query_only 打开已有数据库（不会创建库文件，不写入数据；WAL 库仍会生成 -wal/-shm）。"""
+    uri = pathlib.Path(os.path.abspath(db_path)).as_uri() + "?mode=ro"
+    conn = sqlite3.connect(
+        uri,
+        uri=True,
+        check_same_thread=False,
+        timeout=30.0,
+        cached_statements=_CACHED_STATEMENTS,
+    )
+    try:
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only=ON")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA temp_store=MEMORY")
+    except sqlite3.Error:
+        conn.close()
+        raise
+    return conn
+
+
+_WAL_SIDECAR_SUFFIXES = ("-wal", "-shm")
+
+
+def _release_wal_sidecars(db_path: str) -> None:
+    """只读连接关闭后用普通连接（mode=rw，不会建库）读一次再关闭：若它是最后一个连接，
+    SQLite 会 checkpoint 并删除 -wal/-shm；其他进程仍打开着库时则原样保留。"""
+    uri = pathlib.Path(os.path.abspath(db_path)).as_uri() + "?mode=rw"
+    try:
+        conn = sqlite3.connect(uri, uri=True, timeout=1.0)
+        try:
+            conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        _log.debug("[ReportDB] 清理只读打开产生的 WAL 附属文件失败 db_path=%r: %s", db_path, e)
+
+
+_SELECTABLE_COLUMNS = COLUMN_NAMES | {"id"}
+
+
+def _select_list(columns: Optional[Sequence[str]]) -> str:
+    """把列名列表转成 SELECT 列表；None 为 *，非法列名抛 ValueError。"""
+    if columns is None:
+        return "*"
+    return _build_select_list(tuple(columns))
+
+
+@functools.lru_cache(maxsize=32)
+def _build_select_list(columns: tuple) -> str:
+    invalid = [c for c in columns if c not in _SELECTABLE_COLUMNS]
+    if invalid or not columns:
+        raise ValueError(f"ReportDB: invalid columns: {invalid or columns!r}")
+    return ", ".join(columns)
+
+
+def _copy_stats(stats: dict) -> dict:
+    out = dict(stats)
+    out["by_rating"] = dict(stats["by_rating"])
+    return out
+
+
+def _fetch_rows(cursor: sqlite3.Cursor, as_dict: bool) -> List[Any]:
+    rows = cursor.fetchall()
+    return [dict(row) for row in rows] if as_dict else rows
+
+
+# (秒, 字符串)：时间戳只精确到秒，同一秒内的写入复用同一个字符串
+_now_iso_cache: tuple = (-1, "")
 
 
 def _now_iso() -> str:
     """返回当前 UTC 时间的 ISO 8601 字符串。"""
-    s = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-    _log.debug("[_now_iso] %s", s)
+    global _now_iso_cache
+    sec = int(time.time())
+    cached = _now_iso_cache
+    if cached[0] == sec:
+        return cached[1]
+    tm = time.gmtime(sec)
+    # 直接按整数格式化，不走 strftime
+    s = "%04d-%02d-%02dT%02d:%02d:%02dZ" % tm[:6]
+    _now_iso_cache = (sec, s)
     return s
@@ -11,6 +11,7 @@
 from .config import (
     CONFIG_FILENAME,
     get_config_path,
+    invalidate_config_cache,
     load_config,
     save_config,
 )
@@ -30,6 +31,7 @@ from .send import (
 __all__ = [
     "CONFIG_FILENAME",
     "get_config_path",
+    "invalidate_config_cache",
     "load_config",
     "save_config",
     "ensure_file_open_aware_application",
@@ -9,6 +9,7 @@ SuperViewer 会在加载配置时顺带检查同级目录是否存在 SuperBirdS
 """
 from __future__ import annotations
 
+import functools
 import json
 import os
 import sys
@@ -20,21 +21,43 @@ LEGACY_APP_CONFIG_DIRNAMES = ("BirdStamp",)
 AUTO_BIRDSTAMP_APP_NAME = "SuperBirdStamp"
 AUTO_BIRDSTAMP_APP_ID = "birdstamp"
 
+# load_config 结果缓存：路径 → ((st_mtime_ns, st_size), apps)。文件未变时直接复用，
+# 省去重复读盘、JSON 解析和 SuperBirdStamp 自动探测。
+_CFG_CACHE: dict[str, tuple[tuple[int, int], list[dict[str, str]]]] = {}
+
+
+def _coerce_str(value: Any) -> str:
+    """已是 str 时原样返回，避免多余的 str() 调用。"""
+    return value if type(value) is str else str(value)
+
 
 def _normalize_app_entry(item: Any) -> dict[str, str] | None:
     """规范化单个外部应用配置，兼容可选 app_id 字段。"""
     if not isinstance(item, dict):
         return None
     normalized = {
-        "name": str(item.get("name", "")),
-        "path": str(item.get("path", "")),
+        "name": _coerce_str(item.get("name", "")),
+        "path": _coerce_str(item.get("path", "")),
     }
-    app_id = str(item.get("app_id", "")).strip()
+    app_id = _coerce_str(item.get("app_id", "")).strip()
     if app_id:
         normalized["app_id"] = app_id
     return normalized
 
 
+def _config_file_key(path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def invalidate_config_cache() -> None:
+    """清空 load_config 的缓存（save_config 写入后自动调用）。"""
+    _CFG_CACHE.clear()
+
+
 def _normalize_compare_path(path: str) -> str:
     """将应用路径归一化为便于比较的形式，兼容 macOS .app 简写路径。"""
     text = str(path or "").strip()
@@ -192,8 +215,9 @@ def _ensure_auto_external_apps(apps: list[dict[str, str]]) -> bool:
     return _merge_auto_app(apps, auto_app)
 
 
+@functools.lru_cache(maxsize=4)
 def _build_user_config_dir(app_dir_name: str) -> str:
-    """按应用目录名返回跨平台用户配置目录。"""
+    """按应用目录名返回跨平台用户配置目录（进程内不变，结果缓存）。"""
     if sys.platform == "win32":
         base = (
             os.environ.get("APPDATA")
@@ -264,7 +288,12 @@ def load_config(config_path: str | None = None, config_dir: str | None = None) -
                     continue
                 path = legacy
                 break
-    if os.path.isfile(path):
+    file_key = _config_file_key(path)
+    cached = _CFG_CACHE.get(path) if file_key is not None else None
+    if cached is not None and cached[0] == file_key:
+        out["apps"] = [dict(app) for app in cached[1]]
+        return out
+    if file_key is not None:
         try:
             with open(path, "r", encoding="utf-8") as f:
                 data = json.load(f)
@@ -277,6 +306,9 @@ def load_config(config_path: str | None = None, config_dir: str | None = None) -
             save_config(out["apps"], config_path=path)
         except Exception:
             pass
+    file_key = _config_file_key(path)
+    if file_key is not None:
+        _CFG_CACHE[path] = (file_key, [dict(app) for app in out["apps"]])
     return out
 
 
@@ -288,9 +320,21 @@ def save_config(apps: list[dict[str, str]], config_path: str | None = None, conf
         dir_ = config_dir if config_dir else (config_path if config_path and os.path.isdir(config_path) else None)
         path = get_config_path(dir_)
     data = {"apps": [entry for app in apps if (entry := _normalize_app_entry(app)) is not None]}
+    # 先写同目录临时文件再 os.replace，中途崩溃也不会留下截断的 extern_app.json
+    tmp_path = f"{path}.tmp-{os.getpid()}"
     try:
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
     except Exception:
+        try:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        except Exception:
+            pass
         raise
+    finally:
+        invalidate_config_cache()
@@ -7,38 +7,83 @@
 """
 from __future__ import annotations
 
+import functools
 import json
 import os
+import re
 import sys
 from collections.abc import Iterable
+from itertools import chain
 from typing import Any, Callable
 
 from app_common.log import get_logger
 
-# 协议：客户端发送一行 JSON：{"files": ["path1", "path2", ...]}，UTF-8
+# orjson（可选）：直接从 bytes 解析、直接输出 UTF-8 bytes，省去 decode/encode 中间对象
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# 协议：客户端发送一行 JSON：{"files": ["path1", "path2", ...]}，UTF-8，以 \n 结尾
+# （旧版发送端不带 \n，接收端在对端断开时兜底解析）
 _PROTOCOL_ENCODING = "utf-8"
+# 单条报文上限，防止异常客户端无限灌数据
+_MAX_PAYLOAD_BYTES = 64 * 1024 * 1024
 _log = get_logger("send_to_app")
 
 _QT_APIS = ("PyQt6", "PyQt5", "PySide6")
+# \w 在 str 模式下等价于 str.isalnum() 或 "_"，与逐字符判断结果一致（含中文等 Unicode 字母）
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
+_UNSAFE_ID_CHAR_RE = re.compile(r"[^\w-]")
 _FILE_OPEN_DISPATCHER_ATTR = "_send_to_app_file_open_dispatcher"
 _FILE_OPEN_FILTER_ATTR = "_send_to_app_file_open_filter"
 _QT_FILE_OPEN_SUPPORT: dict[str, Any] | None = None
+# (need_network, need_widgets) -> (QtCore, QtNetwork, QtWidgets)；进程内绑定一旦加载不会再变
+_QT_MODULE_CACHE: dict[tuple[bool, bool], tuple[Any, Any | None, Any | None]] = {}
+_QT_API_NAMES: tuple[str, ...] | None = None
+
+
+def _encode_payload(obj: Any) -> bytes:
+    """协议消息编码为 UTF-8 JSON bytes。"""
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode(_PROTOCOL_ENCODING)
+
+
+def _decode_payload(data: bytes) -> Any:
+    """从 UTF-8 JSON bytes 解析协议消息。"""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data.decode(_PROTOCOL_ENCODING))
 
 
 def _iter_qt_api_names() -> tuple[str, ...]:
     """优先复用当前进程里已经加载的 Qt 绑定，避免混用 PyQt/PySide。"""
+    global _QT_API_NAMES
+    if _QT_API_NAMES is not None:
+        return _QT_API_NAMES
     preferred: list[str] = []
     for api_name in _QT_APIS:
-        if api_name in sys.modules or any(module_name.startswith(f"{api_name}.") for module_name in sys.modules):
+        # 导入子模块时 Python 必先导入顶层包，直接查字典即可，无需遍历 sys.modules
+        if api_name in sys.modules or f"{api_name}.QtCore" in sys.modules:
             preferred.append(api_name)
+    loaded = bool(preferred)
     for api_name in _QT_APIS:
         if api_name not in preferred:
             preferred.append(api_name)
-    return tuple(preferred)
+    names = tuple(preferred)
+    if loaded:
+        # 已有绑定被加载后顺序即固定，后续调用不必再扫描 sys.modules
+        _QT_API_NAMES = names
+    return names
 
 
 def _load_qt_modules(*, need_network: bool = False, need_widgets: bool = False) -> tuple[Any, Any | None, Any | None]:
     """按当前绑定优先级加载 QtCore / QtNetwork / QtWidgets。"""
+    key = (need_network, need_widgets)
+    cached = _QT_MODULE_CACHE.get(key)
+    if cached is not None:
+        return cached
     for api_name in _iter_qt_api_names():
         try:
             if api_name == "PyQt6":
@@ -80,27 +125,66 @@ def _load_qt_modules(*, need_network: bool = False, need_widgets: bool = False)
                     from PySide6 import QtWidgets as _QtWidgets
 
                     QtWidgets = _QtWidgets
-            return QtCore, QtNetwork, QtWidgets
+            result = (QtCore, QtNetwork, QtWidgets)
+            _QT_MODULE_CACHE[key] = result
+            return result
         except ImportError:
             continue
     raise ImportError("Qt bindings are unavailable")
 
 
+def _maybe_normpath(path_text: str) -> str:
+    """POSIX 绝对路径已是规范形式时原样返回，跳过纯 Python 实现的 normpath。"""
+    if (
+        os.sep == "/"
+        and "//" not in path_text
+        and "/./" not in path_text
+        and "/../" not in path_text
+        and not path_text.endswith(("/", "/.", "/.."))
+    ):
+        return path_text
+    if path_text == "/":
+        return path_text
+    return os.path.normpath(path_text)
+
+
 def normalize_file_paths(paths: Iterable[str | os.PathLike[str]] | None) -> list[str]:
-    """统一做 expanduser + abspath + normpath + 去重，供 argv/socket/FileOpen 共用。"""
+    """统一做 expanduser + abspath/normpath + 去重，供 argv/socket/FileOpen 共用。"""
     normalized: list[str] = []
     seen: set[str] = set()
+    expanduser = os.path.expanduser
+    isabs = os.path.isabs
+    abspath = os.path.abspath
+    normpath = os.path.normpath
+    join = os.path.join
+    # POSIX 下 abspath 即 normpath(join(getcwd(), p))，getcwd 每批只取一次；
+    # Windows 的 abspath 走 GetFullPathNameW（处理盘符相对路径等），保持原样
+    use_abspath = sys.platform == "win32"
+    cwd: str | None = None
     for raw_path in paths or ():
         if raw_path is None:
             continue
-        try:
-            path_text = os.fspath(raw_path)
-        except TypeError:
-            path_text = str(raw_path)
+        if isinstance(raw_path, str):
+            path_text = raw_path
+        else:
+            try:
+                path_text = os.fspath(raw_path)
+            except TypeError:
+                path_text = str(raw_path)
         path_text = path_text.strip()
         if not path_text:
             continue
-        full_path = os.path.abspath(os.path.normpath(os.path.expanduser(path_text)))
+        if path_text[0] == "~":
+            path_text = expanduser(path_text)
+        # abspath 内部已做 normpath；已是绝对路径时只需 normpath
+        if isabs(path_text):
+            full_path = _maybe_normpath(path_text)
+        elif use_abspath:
+            full_path = abspath(path_text)
+        else:
+            if cwd is None:
+                cwd = os.getcwd()
+            full_path = normpath(join(cwd, path_text))
         if full_path in seen:
             continue
         seen.add(full_path)
@@ -132,6 +216,9 @@ def _get_qt_file_open_support() -> dict[str, Any]:
     file_open_type = _file_open_event_type(QEvent)
 
     class _FileOpenEventDispatcher(QObject):
+        # 一次 Finder 拖放的多个 FileOpen 可能跨多个事件循环周期到达，留一个短窗口合并成一批
+        _COALESCE_MS = 10
+
         def __init__(self, parent: Any = None) -> None:
             super().__init__(parent)
             self._pending_file_open_paths: list[str] = []
@@ -160,13 +247,13 @@ def _get_qt_file_open_support() -> dict[str, Any]:
             except Exception:
                 path_text = ""
 
-            normalized_paths = normalize_file_paths([path_text])
-            if not normalized_paths:
+            if not path_text or not path_text.strip():
                 return False
 
-            self._pending_file_open_paths.extend(normalized_paths)
+            # 连续 FileOpen 只暂存原始路径，统一在冲刷时归一化 + 去重
+            self._pending_file_open_paths.append(path_text)
             if not self._flush_timer.isActive():
-                self._flush_timer.start(0)
+                self._flush_timer.start(self._COALESCE_MS)
             return True
 
         def flush(self) -> None:
@@ -189,11 +276,7 @@ def _get_qt_file_open_support() -> dict[str, Any]:
         def _flush_buffered_batches(self) -> None:
             if self._dispatch_callback is None or not self._buffered_batches:
                 return
-            merged_paths = normalize_file_paths(
-                path_text
-                for batch_paths in self._buffered_batches
-                for path_text in batch_paths
-            )
+            merged_paths = normalize_file_paths(chain.from_iterable(self._buffered_batches))
             self._buffered_batches.clear()
             if merged_paths:
                 self._dispatch(merged_paths)
@@ -301,11 +384,12 @@ def _canonicalize_app_id(app_id: str) -> str:
     if not raw:
         return "default"
 
-    collapsed = "".join(ch.lower() for ch in raw if ch.isalnum())
+    # 逐字符 lower，保持与旧实现一致（整串 lower 对希腊字母词尾等有上下文差异）
+    collapsed = "".join(map(str.lower, _NON_ALNUM_RE.sub("", raw)))
     if collapsed:
         return collapsed
 
-    safe = "".join(ch.lower() if ch.isalnum() or ch in "-_" else "_" for ch in raw)
+    safe = "".join(map(str.lower, _UNSAFE_ID_CHAR_RE.sub("_", raw)))
     safe = safe.strip("_")
     return safe or "default"
 
@@ -315,20 +399,23 @@ def _legacy_safe_app_id(app_id: str) -> str:
     raw = str(app_id or "").strip()
     if not raw:
         return "default"
-    safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in raw)
-    safe = safe.strip("_")
+    safe = _UNSAFE_ID_CHAR_RE.sub("_", raw).strip("_")
     return safe or "default"
 
 
-def _server_name_from_safe_id(safe: str) -> str:
+@functools.lru_cache(maxsize=1)
+def _uid_token() -> str:
+    """当前用户标识（进程内不变），用于区分不同用户的 IPC 名称。"""
     if sys.platform == "win32":
-        uid = os.environ.get("USERNAME", "default").strip() or "default"
-    else:
-        try:
-            uid = str(os.getuid())
-        except (AttributeError, OSError):
-            uid = os.environ.get("USER", os.environ.get("USERNAME", "default"))
-    name = f"SuperViewer_sendto_{safe}_{uid}"
+        return os.environ.get("USERNAME", "default").strip() or "default"
+    try:
+        return str(os.getuid())
+    except (AttributeError, OSError):
+        return os.environ.get("USER", os.environ.get("USERNAME", "default"))
+
+
+def _server_name_from_safe_id(safe: str) -> str:
+    name = f"SuperViewer_sendto_{safe}_{_uid_token()}"
     if sys.platform == "win32":
         # Windows Named Pipe 名称长度上限 256，且仅允许部分字符
         name = name[:200].replace("\\", "_")
@@ -337,6 +424,12 @@ def _server_name_from_safe_id(safe: str) -> str:
 
 def _server_names(app_id: str) -> list[str]:
     """按新旧两种 app_id 规则生成 IPC 名称，优先尝试稳定归一化结果。"""
+    return list(_cached_server_names(app_id))
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_server_names(app_id: str) -> tuple[str, ...]:
+    """IPC 名称在进程内不变，探测/启动/停止/发送反复调用时直接复用。"""
     names: list[str] = []
     seen: set[str] = set()
     for safe in (_canonicalize_app_id(app_id), _legacy_safe_app_id(app_id)):
@@ -345,7 +438,7 @@ def _server_names(app_id: str) -> list[str]:
             continue
         seen.add(name)
         names.append(name)
-    return names or [_server_name_from_safe_id("default")]
+    return tuple(names or [_server_name_from_safe_id("default")])
 
 
 def _server_name(app_id: str) -> str:
@@ -354,7 +447,10 @@ def _server_name(app_id: str) -> str:
 
 
 def _send_via_socket(server_name: str, file_paths: list[str]) -> bool:
-    """作为客户端连接已有实例，发送 file_paths 后返回。成功返回 True。"""
+    """作为客户端连接已有实例，发送 file_paths 后返回。成功返回 True。
+
+    file_paths 须已经过 normalize_file_paths（由 send_file_list_to_running_app 统一处理）。
+    """
     _, QtNetwork, _ = _load_qt_modules(need_network=True)
     if QtNetwork is None:
         return False
@@ -363,14 +459,18 @@ def _send_via_socket(server_name: str, file_paths: list[str]) -> bool:
     sock.connectToServer(server_name)
     if not sock.waitForConnected(3000):
         return False
-    payload = json.dumps({"files": normalize_file_paths(file_paths)}, ensure_ascii=False)
-    sock.write(payload.encode(_PROTOCOL_ENCODING))
-    sock.flush()
-    sock.waitForBytesWritten(2000)
-    sock.disconnectFromServer()
-    unconnected = getattr(QLocalSocket.LocalSocketState, "UnconnectedState", None) or getattr(QLocalSocket, "UnconnectedState", 0)
-    if sock.state() != unconnected:
+    # 以换行结尾，接收端据此判断报文完整；旧版接收端 json 解析会忽略尾部空白
+    payload = _encode_payload({"files": file_paths}) + b"\n"
+    if sock.write(payload) != len(payload):
         sock.abort()
+        return False
+    # 只在仍有待写数据时等待；写完后 disconnectFromServer 即可，无需再 flush / 查状态
+    # waitForBytesWritten 每次只保证写出一部分，大报文需循环直到缓冲区清空
+    while sock.bytesToWrite() > 0:
+        if not sock.waitForBytesWritten(3000):
+            sock.abort()
+            return False
+    sock.disconnectFromServer()
     return True
 
 
@@ -471,31 +571,65 @@ class SingleInstanceReceiver:
         if not conn:
             return
         done = []
+        # 报文可能分多次 readyRead 到达：累积到行尾换行（或旧版发送端断开）再解析
+        buffer = bytearray()
 
-        def read_and_callback() -> None:
+        def close_conn() -> None:
             if done:
                 return
+            done.append(1)
+            try:
+                conn.disconnectFromServer()
+                if conn.state() != getattr(conn, "UnconnectedState", 0):
+                    conn.abort()
+            except Exception:
+                pass
+            conn.deleteLater()
+
+        def read_and_callback(final: bool = False) -> None:
+            if done:
+                return
+            scanned = len(buffer)
+            try:
+                buffer.extend(conn.readAll().data())
+            except Exception:
+                close_conn()
+                return
+            end = buffer.find(b"\n", scanned)
+            if end >= 0:
+                message = bytes(buffer[:end])
+            elif final or buffer[-1:] == b"}":
+                # 旧版发送端不带换行：完整报文必以 } 结尾，断开时再兜底解析一次
+                message = bytes(buffer)
+            else:
+                if len(buffer) > _MAX_PAYLOAD_BYTES:
+                    close_conn()
+                return
+            if not message.strip():
+                close_conn()
+                return
             try:
-                data = conn.readAll().data()
-                if data:
-                    obj = json.loads(data.decode(_PROTOCOL_ENCODING))
-                    paths = obj.get("files")
-                    if isinstance(paths, list):
-                        done.append(1)
-                        self._on_files(normalize_file_paths(paths))
+                obj = _decode_payload(message)
+            except ValueError:
+                # 无换行的半包恰好以 } 结尾：继续等待，超限或断开则放弃
+                if end >= 0 or final or len(buffer) > _MAX_PAYLOAD_BYTES:
+                    close_conn()
+                return
+            except Exception:
+                close_conn()
+                return
+            try:
+                paths = obj.get("files") if isinstance(obj, dict) else None
+                if isinstance(paths, list):
+                    self._on_files(normalize_file_paths(paths))
             except Exception:
                 pass
             finally:
-                try:
-                    conn.disconnectFromServer()
-                    if conn.state() != getattr(conn, "UnconnectedState", 0):
-                        conn.abort()
-                except Exception:
-                    pass
-                conn.deleteLater()
+                close_conn()
 
         try:
             conn.readyRead.connect(read_and_callback)
+            conn.disconnected.connect(lambda: read_and_callback(final=True))
             if conn.bytesAvailable() > 0:
                 read_and_callback()
         except Exception:
@@ -4,27 +4,46 @@
 支持一次发送单个或多个文件（全路径）：
 - 若配置了 app_id，则优先按本地 socket 协议热发送给已运行实例；
 - 否则或热发送失败时，回退为命令行启动目标应用。
-跨平台：Windows（QProcess.startDetached）、macOS（open -a）。
+跨平台：均用 QProcess.startDetached 启动（Qt 不可用时回退 subprocess）；macOS 通过 open -a。
 """
 from __future__ import annotations
 
+import functools
 import os
 import subprocess
 import sys
 from typing import Any
 
-# Windows 下用 Qt 的 startDetached，与项目其它处行为一致，且正确传递带空格的路径
-if sys.platform == "win32":
+
+def _qprocess() -> Any | None:
+    """
+    返回 Qt 的 QProcess，用 startDetached 启动外部应用：Windows 下正确传递带空格的路径，
+    POSIX 下由 Qt 以 posix_spawn/双 fork 方式脱离启动，不像 subprocess.Popen 那样 fork 整个
+    GUI 进程，也不留下需回收的子进程。复用 receive 中带缓存的 Qt 模块查找，避免混用 PyQt/PySide，
+    也不在导入本模块时就加载 Qt。
+    """
     try:
-        from PySide6.QtCore import QProcess
-    except ImportError:
+        from .receive import _load_qt_modules
+
+        QtCore, _, _ = _load_qt_modules()
+    except Exception:
+        return None
+    return getattr(QtCore, "QProcess", None)
+
+
+def _start_detached(program: str, arguments: list[str]) -> None:
+    """优先用 QProcess.startDetached 启动；Qt 不可用或启动失败时回退 subprocess.Popen。"""
+    qprocess = _qprocess()
+    if qprocess is not None:
         try:
-            from PyQt6.QtCore import QProcess
-        except ImportError:
-            from PyQt5.QtCore import QProcess
-    _QProcess = QProcess
-else:
-    _QProcess = None
+            result = qprocess.startDetached(program, arguments)
+            # PyQt6/PySide6 返回 (ok, pid)，PyQt5 部分重载只返回 bool
+            ok = result[0] if isinstance(result, tuple) else bool(result)
+            if ok:
+                return
+        except Exception:
+            pass
+    subprocess.Popen([program] + arguments)
 
 
 def _resolve_socket_app_id(app: dict[str, Any]) -> str:
@@ -51,11 +70,14 @@ def _try_send_via_socket(app: dict[str, Any], file_paths: list[str]) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=64)
 def resolve_app_path(app_path: str) -> str:
     """
     将配置中的 app 路径规范化为可执行形式。
     - macOS: 支持 .app 或 Adobe 风格目录，返回可供 open -a 使用的路径或名称。
     - Windows: 返回可执行路径。
+    结果按 app_path 缓存（省去重复的 isdir/listdir）；应用列表保存后由设置界面调用
+    resolve_app_path.cache_clear() 失效。
     """
     if not app_path:
         return ""
@@ -99,12 +121,19 @@ def send_files_to_app(
     if not path:
         return
     resolved: list[str] = []
-    for fp in file_paths or []:
-        if not fp:
-            continue
-        if not os.path.isabs(fp) and base_directory:
-            fp = os.path.normpath(os.path.join(base_directory, fp))
-        resolved.append(fp)
+    if base_directory:
+        isabs = os.path.isabs
+        normpath = os.path.normpath
+        join = os.path.join
+        for fp in file_paths or []:
+            if not fp:
+                continue
+            if not isabs(fp):
+                fp = normpath(join(base_directory, fp))
+            resolved.append(fp)
+    else:
+        # 无 base_directory 时路径原样传递，只需过滤空项
+        resolved = [fp for fp in file_paths or [] if fp]
     if not resolved:
         return
 
@@ -114,8 +143,6 @@ def send_files_to_app(
     if sys.platform == "darwin":
         ap = resolve_app_path(path)
         # open -a App 可接受多个文件
-        subprocess.Popen(["open", "-a", ap] + resolved)
-    elif sys.platform == "win32" and _QProcess is not None:
-        _QProcess.startDetached(path, resolved)
+        _start_detached("open", ["-a", ap] + resolved)
     else:
-        subprocess.Popen([path] + resolved)
+        _start_detached(path, resolved)
@@ -8,9 +8,14 @@ from __future__ import annotations
 
 import os
 import sys
-from typing import Callable
+from typing import Any, Callable
 
 from . import config as _config
+from .send import resolve_app_path
+
+# 已构建的 (dialog, state) 挂在 parent 的这个私有属性上：同一 parent 复用对话框，避免每次重建控件树，
+# 且随 parent 一起释放（不放模块级字典，否则 parent 与对话框永远不会被回收）
+_DIALOG_ATTR = "_send_to_app_settings_dialog"
 
 
 def _get_app_file_filter():
@@ -78,6 +83,13 @@ def _qt():
         )
 
 
+def _app_item_text(app: dict) -> str:
+    """列表中单个应用的显示文本。"""
+    app_id = str(app.get("app_id", "")).strip()
+    suffix = f"  |  app_id={app_id}" if app_id else ""
+    return f"{app.get('name', '')}  |  {app.get('path', '')}{suffix}"
+
+
 def show_external_apps_settings_dialog(
     parent,
     config_dir: str | None = None,
@@ -87,16 +99,45 @@ def show_external_apps_settings_dialog(
     显示「外部应用」设置对话框，从 extern_app.json 读写。
     config_dir: 可选，显式指定配置目录；为 None 时使用 send_to_app 默认用户目录。
     on_saved: 保存后回调（可用来刷新菜单等）。
+    同一 parent 再次打开时复用已建好的对话框，只刷新应用列表。
     """
+    data = _config.load_config(config_dir=config_dir)
+    apps = list(data.get("apps") or [])
+
+    dlg = None
+    state: dict[str, Any] = {}
+    cached = getattr(parent, _DIALOG_ATTR, None) if parent is not None else None
+    if cached is not None:
+        dlg, state = cached
+        try:
+            dlg.objectName()
+        except RuntimeError:
+            # C++ 对象已随 parent 销毁
+            dlg = None
+    if dlg is None:
+        state = {}
+        dlg = _build_settings_dialog(parent, state)
+        if parent is not None:
+            try:
+                setattr(parent, _DIALOG_ATTR, (dlg, state))
+            except AttributeError:
+                pass
+
+    state["apps"] = apps
+    state["config_dir"] = config_dir
+    state["on_saved"] = on_saved
+    state["refresh"]()
+    dlg.exec()
+
+
+def _build_settings_dialog(parent, state: dict[str, Any]):
+    """构建设置对话框；各回调通过 state 读取当前的 apps / config_dir / on_saved。"""
     (
         QDialog, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
         QPushButton, QLabel, QLineEdit, QFileDialog, QMessageBox,
         QDialogButtonBox, QFormLayout, QGroupBox, Qt,
     ) = _qt()
 
-    data = _config.load_config(config_dir=config_dir)
-    apps = list(data.get("apps") or [])
-
     dlg = QDialog(parent)
     dlg.setWindowTitle("发送到外部应用 - 设置")
     layout = QVBoxLayout(dlg)
@@ -122,13 +163,12 @@ def show_external_apps_settings_dialog(
         return list_widget.currentRow()
 
     def apply_changes():
+        # 打开对话框时整表刷新：一次 addItems 批量插入，模型只发一次行插入信号；
+        # 增删改只更新对应的单行
         list_widget.clear()
-        for a in apps:
-            app_id = str(a.get("app_id", "")).strip()
-            suffix = f"  |  app_id={app_id}" if app_id else ""
-            list_widget.addItem(QListWidgetItem(f"{a.get('name', '')}  |  {a.get('path', '')}{suffix}"))
+        list_widget.addItems([_app_item_text(a) for a in state["apps"]])
 
-    apply_changes()
+    state["refresh"] = apply_changes
 
     def on_add():
         name_edit = QLineEdit()
@@ -175,14 +215,15 @@ def show_external_apps_settings_dialog(
             item = {"name": name or os.path.basename(path), "path": path}
             if app_id:
                 item["app_id"] = app_id
-            apps.append(item)
-            apply_changes()
+            state["apps"].append(item)
+            list_widget.addItem(_app_item_text(item))
             sub.accept()
         bb.accepted.connect(accept)
         bb.rejected.connect(sub.reject)
         sub.exec()
 
     def on_edit():
+        apps = state["apps"]
         i = current_index()
         if i < 0 or i >= len(apps):
             QMessageBox.information(dlg, "提示", "请先选中一项。")
@@ -230,19 +271,20 @@ def show_external_apps_settings_dialog(
             if app_id:
                 item["app_id"] = app_id
             apps[i] = item
-            apply_changes()
+            list_widget.item(i).setText(_app_item_text(item))
             sub.accept()
         bb.accepted.connect(accept)
         bb.rejected.connect(sub.reject)
         sub.exec()
 
     def on_remove():
+        apps = state["apps"]
         i = current_index()
         if i < 0 or i >= len(apps):
             QMessageBox.information(dlg, "提示", "请先选中一项。")
             return
         apps.pop(i)
-        apply_changes()
+        list_widget.takeItem(i)
 
     add_btn.clicked.connect(on_add)
     edit_btn.clicked.connect(on_edit)
@@ -258,7 +300,9 @@ def show_external_apps_settings_dialog(
 
     def save():
         try:
-            _config.save_config(apps, config_dir=config_dir)
+            _config.save_config(state["apps"], config_dir=state["config_dir"])
+            resolve_app_path.cache_clear()
+            on_saved = state["on_saved"]
             if on_saved:
                 on_saved()
             dlg.accept()
@@ -267,5 +311,4 @@ def show_external_apps_settings_dialog(
 
     bb.accepted.connect(save)
     bb.rejected.connect(dlg.reject)
-
-    dlg.exec()
+    return dlg
@@ -19,55 +19,72 @@ Usage::
 """
 from __future__ import annotations
 
+import sys
 import time
-from contextlib import contextmanager
-from typing import Generator
 
-# (start_time, end_time | None) per name
-_span_start: dict[str, float] = {}
-_span_elapsed: dict[str, float] = {}  # name -> total seconds (when ended)
+# name -> [start_ns | None, total_ns, call_count]; one dict lookup per begin/end.
+# Integer nanoseconds keep the sums exact; seconds are only computed on output.
+_spans: dict[str, list] = {}
 
 
 def stat_reset() -> None:
     """Clear all recorded spans."""
-    _span_start.clear()
-    _span_elapsed.clear()
+    _spans.clear()
 
 
 def stat_begin(name: str) -> None:
     """Start a named span."""
-    _span_start[name] = time.perf_counter()
-    if name in _span_elapsed:
-        del _span_elapsed[name]
+    s = _spans.get(name)
+    if s is None:
+        s = _spans[name] = [None, 0, 0]
+    s[0] = time.perf_counter_ns()
 
 
 def stat_end(name: str) -> float | None:
     """End a named span; return elapsed seconds or None if not started."""
-    if name not in _span_start:
+    s = _spans.get(name)
+    if s is None or s[0] is None:
         return None
-    elapsed = time.perf_counter() - _span_start.pop(name)
-    _span_elapsed[name] = _span_elapsed.get(name, 0) + elapsed
-    return elapsed
+    elapsed_ns = time.perf_counter_ns() - s[0]
+    s[0] = None
+    s[1] += elapsed_ns
+    s[2] += 1
+    return elapsed_ns / 1e9
 
 
-@contextmanager
-def stat_span(name: str) -> Generator[None, None, None]:
-    """Context manager to record elapsed time for a named span."""
-    stat_begin(name)
-    try:
-        yield
-    finally:
-        stat_end(name)
+class _StatSpan:
+    """Context manager recording elapsed time for a named span (no generator frame per use)."""
+
+    __slots__ = ("_name",)
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __enter__(self) -> None:
+        stat_begin(self._name)
+
+    def __exit__(self, *exc_info: object) -> None:
+        stat_end(self._name)
+
+
+# Context manager to record elapsed time for a named span: ``with stat_span(name): ...``
+stat_span = _StatSpan
 
 
 def stat_report(*, return_lines: bool = False) -> list[str] | None:
-    """Print all spans to stderr (name: seconds), or return list of lines."""
+    """Print all spans to stderr, slowest first (name: total seconds [calls, avg]), or return list of lines."""
+    items = [(k, v[1], v[2]) for k, v in _spans.items() if v[2]]
+    items.sort(key=lambda item: (-item[1], item[0]))
     lines: list[str] = []
-    for k in sorted(_span_elapsed.keys()):
-        t = _span_elapsed[k]
-        lines.append(f"[stat] {k}: {t:.3f}s")
+    for k, t_ns, n in items:
+        t = t_ns / 1e9
+        if n == 1:
+            lines.append(f"[stat] {k}: {t:.3f}s")
+        else:
+            lines.append(f"[stat] {k}: {t:.3f}s ({n} calls, avg {t / n * 1000:.3f}ms)")
     if return_lines:
         return lines
-    for line in lines:
-        print(line, file=__import__("sys").stderr, flush=True)
+    if lines:
+        sys.stderr.write("\n".join(lines) + "\n")
+        sys.stderr.flush()
     return None
@@ -1,6 +1,12 @@
 import math
 
-from app_common.focus_calc import extract_focus_box_for_display, resolve_focus_camera_type_from_metadata
+from app_common.focus_calc import (
+    extract_focus,
+    extract_focus_box,
+    extract_focus_box_for_display,
+    get_focus_point,
+    resolve_focus_camera_type_from_metadata,
+)
 
 
 def _sample_sony_focus_metadata(makernote_key: str) -> dict[str, object]:
@@ -39,3 +45,14 @@ def test_extract_focus_box_for_display_accepts_legacy_and_precache_sony_makernot
         0.5657894736842105,
     )
     assert all(math.isclose(actual, target, rel_tol=1e-9, abs_tol=1e-9) for actual, target in zip(legacy_focus_box, expected))
+
+
+def test_extract_focus_matches_separate_point_and_box_calls() -> None:
+    tagged_raw = _sample_sony_focus_metadata("Makernote Tag 0x2027")
+    point_only_raw = {"Make": "SONY", "Model": "ILCE-7M4", "Composite:FocusX": 1200, "Composite:FocusY": 800}
+
+    for raw in (tagged_raw, point_only_raw, {}):
+        assert extract_focus(raw, 5472, 3648) == (
+            get_focus_point(raw, 5472, 3648),
+            extract_focus_box(raw, 5472, 3648),
+        )
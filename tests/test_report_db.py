@@ -0,0 +1,194 @@
+import os
+import sqlite3
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from app_common import report_db
+from app_common.report_db import ReportDB, get_preview_path_for_file, invalidate_preview_path
+
+
+def test_insert_photos_batch_only_updates_columns_present_in_each_row(tmp_path) -> None:
+    db = ReportDB(str(tmp_path))
+    try:
+        db.insert_photos_batch(
+            [
+                {"filename": "IMG_0001", "rating": 3, "bird_species_cn": "白鹭"},
+                {"filename": "IMG_0002", "rating": 1, "bird_species_cn": "麻雀"},
+            ]
+        )
+        count = db.insert_photos_batch(
+            [
+                {"filename": "IMG_0001", "rating": 2},
+                {"filename": "IMG_0003", "has_bird": "yes"},
+                {"filename": "IMG_0001", "focus_status": "BEST"},
+            ]
+        )
+
+        assert count == 3
+        first = db.get_photo("IMG_0001")
+        assert first is not None
+        assert first["rating"] == 2
+        assert first["bird_species_cn"] == "白鹭"
+        assert first["focus_status"] == "BEST"
+        assert db.get_photo("IMG_0003")["has_bird"] == 1
+        assert db.count() == 3
+    finally:
+        db.close()
+
+
+def test_cached_statistics_and_species_follow_writes(tmp_path) -> None:
+    db = ReportDB(str(tmp_path))
+    try:
+        db.insert_photo({"filename": "IMG_0001", "rating": 2, "bird_species_cn": "白鹭"})
+        assert db.get_statistics()["total"] == 1
+        assert db.get_distinct_species() == ["白鹭"]
+
+        db.update_photo("IMG_0001", {"bird_species_cn": "苍鹭", "has_bird": "yes"})
+        db.insert_photos_batch([{"filename": "IMG_0002", "rating": 3}])
+
+        stats = db.get_statistics()
+        assert stats["total"] == 2
+        assert stats["has_bird"] == 1
+        assert stats["by_rating"] == {2: 1, 3: 1}
+        assert db.get_distinct_species() == ["苍鹭"]
+    finally:
+        db.close()
+
+
+_V2_PLUS_COLUMNS = frozenset({
+    "iso", "shutter_speed", "aperture", "focal_length", "focal_length_35mm", "camera_model",
+    "lens_model", "gps_latitude", "gps_longitude", "gps_altitude", "title", "caption", "city",
+    "state_province", "country", "date_time_original", "bird_species_cn", "bird_species_en",
+    "birdid_confidence", "exposure_status", "original_path", "current_path", "temp_jpeg_path",
+    "debug_crop_path", "yolo_debug_path", "pick",
+})
+
+
+def test_opening_v1_database_upgrades_before_creating_filter_indexes(tmp_path) -> None:
+    db_dir = tmp_path / ".superpicky"
+    db_dir.mkdir()
+    v1_cols = [f"{name} {type_def}" for name, type_def, _ in report_db.PHOTO_COLUMNS if name not in _V2_PLUS_COLUMNS]
+    conn = sqlite3.connect(str(db_dir / ReportDB.DB_FILENAME))
+    with conn:
+        conn.execute(f"CREATE TABLE photos (id INTEGER PRIMARY KEY AUTOINCREMENT, {', '.join(v1_cols)})")
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute("INSERT INTO meta (key, value) VALUES ('schema_version', '1')")
+        conn.execute("INSERT INTO photos (filename, rating) VALUES ('IMG_0001', 2)")
+    conn.close()
+
+    db = ReportDB(str(tmp_path))
+    try:
+        assert db.get_photo("IMG_0001")["rating"] == 2
+        assert db.get_photo("IMG_0001")["bird_species_cn"] is None
+        indexes = {row[0] for row in db._conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {"idx_photos_species_cn", "idx_photos_species_en", "idx_photos_focus"} <= indexes
+    finally:
+        db.close()
+
+
+def test_open_if_exists_read_only_reads_without_writing(tmp_path) -> None:
+    db = ReportDB(str(tmp_path))
+    db.insert_photo({"filename": "IMG_0001", "rating": 3})
+    db.close()
+    db_dir = tmp_path / ".superpicky"
+    files_before = sorted(os.listdir(db_dir))
+
+    ro = ReportDB.open_if_exists(str(tmp_path), read_only=True)
+    assert ro is not None
+    try:
+        assert ro.get_photo("IMG_0001")["rating"] == 3
+        assert ro.count() == 1
+        with pytest.raises(RuntimeError):
+            ro.update_photo("IMG_0001", {"rating": 1})
+    finally:
+        ro.close()
+    assert sorted(os.listdir(db_dir)) == files_before == [ReportDB.DB_FILENAME]
+
+
+def test_bulk_insert_arrow_matches_batch_cleaning(tmp_path) -> None:
+    pa = pytest.importorskip("pyarrow")
+    db = ReportDB(str(tmp_path))
+    try:
+        db.insert_photo({"filename": "IMG_0001", "bird_species_cn": "白鹭"})
+        table = pa.table(
+            {
+                "filename": ["IMG_0001", "IMG_0002"],
+                "rating": pa.array([2, None], type=pa.int64()),
+                "has_bird": ["yes", "-"],
+                "confidence": ["0.5", "-"],
+            }
+        )
+        assert db.bulk_insert_arrow(table) == 2
+
+        first = db.get_photo("IMG_0001")
+        assert first["rating"] == 2
+        assert first["has_bird"] == 1
+        assert first["confidence"] == 0.5
+        assert first["bird_species_cn"] == "白鹭"
+        second = db.get_photo("IMG_0002")
+        assert second["has_bird"] == 0
+        assert second["confidence"] is None
+    finally:
+        db.close()
+
+
+def _committed_count(db_path: str) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM photos").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_single_row_writes_are_deferred_until_flush_or_close(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(report_db, "_COMMIT_DELAY_S", 3600)
+    db = ReportDB(str(tmp_path))
+    try:
+        db.insert_photo({"filename": "IMG_0001", "rating": 1})
+        assert _committed_count(db.db_path) == 0
+        db.flush()
+        assert _committed_count(db.db_path) == 1
+
+        db.insert_photo({"filename": "IMG_0002", "rating": 2})
+        assert _committed_count(db.db_path) == 1
+    finally:
+        db.close()
+    assert _committed_count(db.db_path) == 2
+
+
+def test_deferred_writes_survive_interpreter_exit_without_close(tmp_path) -> None:
+    log_file = tmp_path / "app.log"
+    script = textwrap.dedent(
+        """
+        import sys
+        from app_common.log import get_logger
+        from app_common import report_db
+        report_db._COMMIT_DELAY_S = 3600
+        get_logger("test").info("open log file before ReportDB writes")
+        db = report_db.ReportDB(sys.argv[1])
+        db.insert_photo({"filename": "IMG_0001"})
+        """
+    )
+    env = dict(os.environ, APP_COMMON_LOG_FILE=str(log_file), APP_COMMON_LOG_LEVEL="DEBUG")
+    subprocess.run([sys.executable, "-c", script, str(tmp_path)], check=True, env=env, capture_output=True)
+
+    db_path = os.path.join(str(tmp_path), ".superpicky", "report.db")
+    assert _committed_count(db_path) == 1
+
+
+def test_preview_path_cache_does_not_remember_missing_files(tmp_path) -> None:
+    report_cache = {"IMG_0001": {"temp_jpeg_path": os.path.join(".superpicky", "cache", "IMG_0001.jpg")}}
+    src = str(tmp_path / "IMG_0001.NEF")
+    preview = tmp_path / ".superpicky" / "cache" / "IMG_0001.jpg"
+
+    assert get_preview_path_for_file(src, str(tmp_path), report_cache) == src
+    preview.parent.mkdir(parents=True)
+    preview.write_bytes(b"jpeg")
+    assert get_preview_path_for_file(src, str(tmp_path), report_cache) == str(preview)
+
+    preview.unlink()
+    invalidate_preview_path(str(preview))
+    assert get_preview_path_for_file(src, str(tmp_path), report_cache) == src
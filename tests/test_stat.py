@@ -0,0 +1,37 @@
+from app_common import stat
+from app_common.stat import stat_begin, stat_end, stat_report, stat_reset, stat_span
+
+
+def test_spans_accumulate_across_calls() -> None:
+    stat_reset()
+    try:
+        assert stat_end("missing") is None
+        for _ in range(3):
+            with stat_span("loop"):
+                pass
+        stat_begin("once")
+        assert stat_end("once") is not None
+        assert stat_end("once") is None
+        stat_begin("open")
+
+        lines = stat_report(return_lines=True)
+        assert len(lines) == 2
+        by_name = {line.split(":")[0]: line for line in lines}
+        assert "(3 calls, avg " in by_name["[stat] loop"]
+        assert by_name["[stat] once"].endswith("s")
+    finally:
+        stat_reset()
+
+
+def test_report_sorts_slowest_first() -> None:
+    stat_reset()
+    try:
+        stat_begin("fast")
+        stat_end("fast")
+        stat_begin("slow")
+        stat_end("slow")
+        stat._spans["slow"][1] += 10**9
+        lines = stat_report(return_lines=True)
+        assert [line.split(":")[0] for line in lines] == ["[stat] slow", "[stat] fast"]
+    finally:
+        stat_reset()
@@ -13,13 +13,16 @@ thumb_stream
 from __future__ import annotations
 
 import io as _io
+import mmap
 import os
+import threading
 import time as _time
 from pathlib import Path
 from typing import Callable, Generator
 
 # 扩展名集合，与 file_browser 一致，便于独立测试
 _JPEG_EXTENSIONS = frozenset({".jpg", ".jpeg"})
+_HEIF_EXTENSIONS = frozenset({".heic", ".heif", ".hif"})
 _RAW_EXTENSIONS = frozenset({
     ".cr2", ".cr3", ".crw", ".nef", ".nrw", ".arw", ".srf", ".sr2",
     ".rw2", ".raw", ".orf", ".ori", ".raf", ".dng", ".pef", ".ptx",
@@ -41,11 +44,97 @@ try:
 except Exception:
     pass
 
+# pillow-heif（可选）：注册后 PIL 可直接打开 HEIC/HEIF（libheif 解码），
+# 且 draft() 会改用文件内嵌的预缩放缩略图，无需解码整张原图。
+try:
+    from pillow_heif import register_heif_opener as _register_heif_opener
+    _register_heif_opener()
+except Exception:
+    pass
 
-def _get_raw_thumbnail_bytes(path: str) -> bytes | None:
-    """从 RAW 文件提取嵌入 JPEG 缩略图字节。"""
-    if Path(path).suffix.lower() not in _RAW_EXTENSIONS:
+# NumPy（可选）：存在时用向量化混合替代 PIL 的 new/split/paste 三步合成透明图。
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# 透明像素合成时使用的背景灰度，与缩略图面板底色一致
+_ALPHA_BG_LEVEL = 45
+
+
+# RAW 嵌入缩略图提取策略：按扩展名给出依次尝试的方式。
+# 非 TIFF 容器（CR3/CRW/RAF/X3F/ORF/RW2 等）piexif 无法解析，直接交给 rawpy，省去一次整段 EXIF 读取。
+# 常见带预览 JPEG 的格式先用 mmap 扫描 SOI 直接截取（"scan"），不做 IFD 解析。
+_RAW_DEFAULT_STRATEGY: tuple[str, ...] = ("piexif", "rawpy")
+_RAW_STRATEGY: dict[str, tuple[str, ...]] = {
+    ".cr2": ("scan", "piexif", "rawpy"),
+    ".nef": ("scan", "piexif", "rawpy"),
+    ".arw": ("scan", "piexif", "rawpy"),
+    ".dng": ("scan", "piexif", "rawpy"),
+    ".pef": ("scan", "piexif", "rawpy"),
+    ".orf": ("scan", "rawpy"),
+    ".raf": ("scan", "rawpy"),
+    ".rw2": ("scan", "rawpy"),
+    ".cr3": ("rawpy",),
+    ".crw": ("rawpy",),
+    ".x3f": ("rawpy",),
+    ".ori": ("rawpy",),
+    ".raw": ("rawpy",),
+    ".rwl": ("rawpy",),
+    ".mrw": ("rawpy",),
+}
+
+# SOI 扫描窗口与最小预览体积：预览 JPEG 一般位于文件前部，过小的多为 160px 级 IFD 缩略图。
+_RAW_SCAN_WINDOW = 2_000_000
+_RAW_SCAN_MIN_BYTES = 10_000
+_JPEG_SOI = b"\xff\xd8\xff"
+_JPEG_EOI = b"\xff\xd9"
+_JPEG_SOS = 0xDA
+# 仅接受 baseline / extended / progressive 帧（SOF0-2）；SOF3 等多为 RAW 里的无损 JPEG 传感器数据，PIL 打不开
+_JPEG_SOF_ACCEPTED = frozenset({0xC0, 0xC1, 0xC2})
+_JPEG_SOF_ALL = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _scan_jpeg_header(mm, start: int, size: int) -> int:
+    """从 SOI 之后逐段走到 SOS，返回 SOS 位置；帧类型不是 SOF0-2 或段结构损坏时返回 -1。"""
+    pos = start + 2
+    sof = None
+    # 逐段跳过 APPn/DQT/DHT 等头部段，避免把 APP1 里内嵌小缩略图的 EOI 当作结尾。
+    while pos + 4 <= size and mm[pos] == 0xFF:
+        marker = mm[pos + 1]
+        if marker == _JPEG_SOS:
+            return pos if sof in _JPEG_SOF_ACCEPTED else -1
+        if marker in _JPEG_SOF_ALL:
+            sof = marker
+        seg_len = int.from_bytes(mm[pos + 2:pos + 4], "big")
+        if seg_len < 2:
+            return -1
+        pos += 2 + seg_len
+    return -1
+
+
+def _raw_thumb_via_scan(path: str) -> bytes | None:
+    """mmap 文件，在前 _RAW_SCAN_WINDOW 字节内依次找嵌入 JPEG 的 SOI，取第一个 SOF0-2 且足够大的预览。"""
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            window = min(_RAW_SCAN_WINDOW, size)
+            start = mm.find(_JPEG_SOI, 0, window)
+            while start >= 0:
+                sos = _scan_jpeg_header(mm, start, size)
+                if sos >= 0:
+                    end = mm.find(_JPEG_EOI, sos)
+                    if end < 0:
+                        return None
+                    if end - start > _RAW_SCAN_MIN_BYTES:
+                        return bytes(mm[start:end + 2])
+                start = mm.find(_JPEG_SOI, start + 2, window)
+            return None
+    except (OSError, ValueError):
         return None
+
+
+def _raw_thumb_via_piexif(path: str) -> bytes | None:
     try:
         import piexif
         data = piexif.load(path)
@@ -54,6 +143,10 @@ def _get_raw_thumbnail_bytes(path: str) -> bytes | None:
             return thumb
     except Exception:
         pass
+    return None
+
+
+def _raw_thumb_via_rawpy(path: str) -> bytes | None:
     try:
         import rawpy
         with rawpy.imread(path) as rp:
@@ -68,6 +161,112 @@ def _get_raw_thumbnail_bytes(path: str) -> bytes | None:
     return None
 
 
+def _jpeg_bytes_openable(data: bytes) -> bool:
+    """PIL 能否识别这段 JPEG 字节（只解析头部）；打不开时交给下一种提取方式。无 PIL 时不做校验。"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return True
+    try:
+        with Image.open(_io.BytesIO(data)) as img:
+            return img.format == "JPEG"
+    except Exception:
+        return False
+
+
+_RAW_EXTRACTORS: dict[str, Callable[[str], bytes | None]] = {
+    "scan": _raw_thumb_via_scan,
+    "piexif": _raw_thumb_via_piexif,
+    "rawpy": _raw_thumb_via_rawpy,
+}
+
+
+# 提取结果按 (path, mtime_ns) 缓存，列表/缩略图模式切换时同一文件不再重复提取。
+# 预览 JPEG 动辄数 MB，按总字节数而非条目数限额；未提取到的结果按固定开销计入。
+_RAW_THUMB_CACHE_MAX_BYTES = 24 * 1024 * 1024
+_RAW_THUMB_CACHE_ENTRY_OVERHEAD = 256
+_raw_thumb_cache: dict[tuple[str, int], bytes | None] = {}
+_raw_thumb_cache_bytes = 0
+_raw_thumb_cache_lock = threading.Lock()
+
+
+def _raw_thumb_cache_cost(thumb: bytes | None) -> int:
+    return _RAW_THUMB_CACHE_ENTRY_OVERHEAD + (len(thumb) if thumb else 0)
+
+
+def _extract_raw_thumbnail_bytes(path: str, ext: str) -> bytes | None:
+    """按扩展名对应的策略依次尝试，返回第一个 PIL 能打开的嵌入 JPEG。"""
+    for name in _RAW_STRATEGY.get(ext, _RAW_DEFAULT_STRATEGY):
+        thumb = _RAW_EXTRACTORS[name](path)
+        if thumb and _jpeg_bytes_openable(thumb):
+            return thumb
+    return None
+
+
+def _get_raw_thumbnail_bytes_cached(path: str, ext: str, mtime_ns: int) -> bytes | None:
+    """按 (path, mtime_ns) 查缓存，未命中时提取并放入缓存，超出字节上限时淘汰最久未用的条目。"""
+    global _raw_thumb_cache_bytes
+    key = (path, mtime_ns)
+    with _raw_thumb_cache_lock:
+        if key in _raw_thumb_cache:
+            thumb = _raw_thumb_cache.pop(key)
+            _raw_thumb_cache[key] = thumb
+            return thumb
+    thumb = _extract_raw_thumbnail_bytes(path, ext)
+    cost = _raw_thumb_cache_cost(thumb)
+    if cost > _RAW_THUMB_CACHE_MAX_BYTES:
+        return thumb
+    with _raw_thumb_cache_lock:
+        if key in _raw_thumb_cache:
+            _raw_thumb_cache_bytes -= _raw_thumb_cache_cost(_raw_thumb_cache.pop(key))
+        _raw_thumb_cache[key] = thumb
+        _raw_thumb_cache_bytes += cost
+        while _raw_thumb_cache_bytes > _RAW_THUMB_CACHE_MAX_BYTES:
+            evicted = _raw_thumb_cache.pop(next(iter(_raw_thumb_cache)))
+            _raw_thumb_cache_bytes -= _raw_thumb_cache_cost(evicted)
+    return thumb
+
+
+def _get_raw_thumbnail_bytes(path: str) -> bytes | None:
+    """从 RAW 文件提取嵌入 JPEG 缩略图字节。"""
+    ext = Path(path).suffix.lower()
+    if ext not in _RAW_EXTENSIONS:
+        return None
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    return _get_raw_thumbnail_bytes_cached(path, ext, mtime_ns)
+
+
+def _flatten_to_rgb(img) -> tuple[bytes, int, int]:
+    """已缩放的 PIL Image 转为 RGB 字节 (data, w, h)；带透明通道时合成到深灰背景上。"""
+    if img.mode == "P":
+        img = img.convert("RGBA")
+    if img.mode in ("RGBA", "LA"):
+        if _np is not None:
+            arr = _np.asarray(img.convert("RGBA"), dtype=_np.uint8)
+            alpha = arr[..., 3:4].astype(_np.uint16)
+            rgb = (
+                (arr[..., :3].astype(_np.uint16) * alpha + _ALPHA_BG_LEVEL * (255 - alpha)) // 255
+            ).astype(_np.uint8)
+            h, w, _ = rgb.shape
+            return (rgb.tobytes(), w, h)
+        from PIL import Image
+        bg = Image.new("RGB", img.size, (_ALPHA_BG_LEVEL,) * 3)
+        try:
+            alpha = img.split()[-1]
+            bg.paste(img.convert("RGB"), mask=alpha)
+        except Exception:
+            bg.paste(img.convert("RGB"))
+        img = bg
+    elif img.mode != "RGB":
+        img = img.convert("RGB")
+    w, h = img.size
+    data = img.tobytes("raw", "RGB")
+    return (data, w, h)
+
+
 def _pil_to_rgb_thumb(img, size: int) -> tuple[bytes, int, int] | None:
     """PIL Image 缩放到不超过 size，转为 RGB 字节 (data, w, h)。使用 LANCZOS 以获得最终高质量。"""
     try:
@@ -80,21 +279,7 @@ def _pil_to_rgb_thumb(img, size: int) -> tuple[bytes, int, int] | None:
         except Exception:
             pass
         img.thumbnail((size, size), Image.LANCZOS)
-        if img.mode == "P":
-            img = img.convert("RGBA")
-        if img.mode in ("RGBA", "LA"):
-            bg = Image.new("RGB", img.size, (45, 45, 45))
-            try:
-                alpha = img.split()[-1]
-                bg.paste(img.convert("RGB"), mask=alpha)
-            except Exception:
-                bg.paste(img.convert("RGB"))
-            img = bg
-        elif img.mode != "RGB":
-            img = img.convert("RGB")
-        w, h = img.size
-        data = img.tobytes("raw", "RGB")
-        return (data, w, h)
+        return _flatten_to_rgb(img)
     except Exception:
         return None
 
@@ -112,21 +297,7 @@ def _pil_to_rgb_thumb_bilinear(img, size: int) -> tuple[bytes, int, int] | None:
         except Exception:
             pass
         img.thumbnail((size, size), Image.BILINEAR)
-        if img.mode == "P":
-            img = img.convert("RGBA")
-        if img.mode in ("RGBA", "LA"):
-            bg = Image.new("RGB", img.size, (45, 45, 45))
-            try:
-                alpha = img.split()[-1]
-                bg.paste(img.convert("RGB"), mask=alpha)
-            except Exception:
-                bg.paste(img.convert("RGB"))
-            img = bg
-        elif img.mode != "RGB":
-            img = img.convert("RGB")
-        w, h = img.size
-        data = img.tobytes("raw", "RGB")
-        return (data, w, h)
+        return _flatten_to_rgb(img)
     except Exception:
         return None
 
@@ -156,7 +327,8 @@ def load_thumbnail_rgb_fast(path: str, max_size: int = THUMB_FAST_DEFAULT_SIZE)
 
 def load_thumbnail_rgb(path: str, size: int) -> tuple[bytes, int, int] | None:
     """
-    解码为指定尺寸内的 RGB 缩略图，支持 JPEG（draft）、RAW（嵌入缩略图）及常见位图。
+    解码为指定尺寸内的 RGB 缩略图，支持 JPEG（draft）、RAW（嵌入缩略图）、HEIF（需 pillow-heif，
+    优先用内嵌缩略图）及常见位图。
     返回 (rgb_bytes, width, height)，24-bit RGB 行优先；失败返回 None。
     不包含磁盘缓存，由调用方负责。可被 C 实现替换。
     """
@@ -178,7 +350,7 @@ def load_thumbnail_rgb(path: str, size: int) -> tuple[bytes, int, int] | None:
                     img = None
         if img is None:
             img = Image.open(path)
-            if ext in _JPEG_EXTENSIONS:
+            if ext in _JPEG_EXTENSIONS or ext in _HEIF_EXTENSIONS:
                 try:
                     img.draft("RGB", (size, size))
                 except Exception: